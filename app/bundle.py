@@ -0,0 +1,255 @@
+"""Prebuilt dataset bundles that several app processes memory-map read-only.
+
+``python -m app.bundle`` parses and indexes the catalog once. It writes the
+prepared dataframe as an uncompressed Arrow file and every index as flat
+``.npy`` arrays. A process whose ``TUTORIAL_LIST_PATH`` points at the bundle
+maps those files instead of parsing YAML. The operating system then keeps one
+copy of their pages, however many replicas serve the app.
+
+Layout::
+
+    bundle/manifest.json          replaced atomically; names the current generation
+    bundle/<generation>/catalog.arrow
+    bundle/<generation>/*.npy
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.data import DEFAULT_DATA_PATH, DEFAULT_SNAPSHOT_DIR, SortIndex, TagIndex
+from app.facets import FacetTable
+from app.ui.search import SearchIndex
+
+if TYPE_CHECKING:
+    from app.dataset import Dataset
+    from app.related import RelatedIndex
+
+# Bump whenever the layout changes so old bundles are rejected instead of misread.
+BUNDLE_FORMAT = 1
+MANIFEST_NAME = "manifest.json"
+CATALOG_NAME = "catalog.arrow"
+DEFAULT_BUNDLE_DIR = DEFAULT_SNAPSHOT_DIR / "bundle"
+# Generations kept on disk; replicas still mapping an older one keep working until they reload.
+KEEP_GENERATIONS = 2
+
+
+@dataclass(frozen=True)
+class Bundle:
+    """A mapped catalog and the prebuilt indexes read from a bundle directory."""
+
+    source: str
+    version: str | None
+    dataframe: pd.DataFrame
+    tag_index: TagIndex
+    facet_table: FacetTable
+    search_index: SearchIndex
+    sort_index: SortIndex
+    related: RelatedIndex
+
+
+def is_bundle(path: str | Path) -> bool:
+    """Whether ``path`` is a bundle directory rather than YAML sources."""
+    return (Path(path) / MANIFEST_NAME).is_file()
+
+
+def _pack(arrays: Sequence[np.ndarray], dtype: type) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenate ``arrays`` into one values array plus ``len + 1`` offsets."""
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([len(array) for array in arrays], out=offsets[1:])
+    values = np.concatenate(arrays).astype(dtype, copy=False) if arrays else np.empty(0, dtype=dtype)
+    return values, offsets
+
+
+def _unpack(values: np.ndarray, offsets: np.ndarray) -> list[np.ndarray]:
+    """Split packed ``values`` back into views; nothing is copied."""
+    return [values[start:stop] for start, stop in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+
+def write_bundle(dataset: "Dataset", directory: str | Path) -> Path:
+    """Write ``dataset`` and all of its indexes as a new generation of the bundle at ``directory``.
+
+    The manifest is swapped in last, so a process reloading concurrently
+    sees either the previous generation or the complete new one.
+    """
+    import pyarrow as pa
+
+    directory = Path(directory)
+    generation = f"{(dataset.version or 'unversioned')[:12]}-{time.time_ns()}"
+    target = directory / generation
+    target.mkdir(parents=True)
+
+    table = pa.Table.from_pandas(dataset.catalog_frame, preserve_index=False)
+    with pa.OSFile(str(target / CATALOG_NAME), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    facets = dataset.facet_table
+    tag_keys = list(dataset.tag_index.postings)
+    search = dataset.planner.search.index
+    sort_columns = list(dataset.sort_index.orders)
+    related = dataset.related
+
+    arrays: dict[str, np.ndarray] = {"facet_offsets": facets.offsets, "facet_codes": facets.codes}
+    arrays["tag_rows"], arrays["tag_offsets"] = _pack([dataset.tag_index.postings[key] for key in tag_keys], np.int64)
+    arrays["search_rows"], arrays["search_offsets"] = _pack([rows for rows, _ in search.postings], np.int64)
+    arrays["search_scores"], _ = _pack([scores for _, scores in search.postings], np.float64)
+    orders = [dataset.sort_index.orders[column] for column in sort_columns]
+    arrays["sort_ranked"], arrays["sort_ranked_offsets"] = _pack([ranked for ranked, _ in orders], np.int64)
+    arrays["sort_missing"], arrays["sort_missing_offsets"] = _pack([missing for _, missing in orders], np.int64)
+    arrays["related_labels"] = related.labels
+    arrays["related_neighbours"] = related.neighbours
+    arrays["related_scores"] = related.scores
+    for name, array in arrays.items():
+        np.save(target / f"{name}.npy", np.ascontiguousarray(array))
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "generation": generation,
+        "source": str(dataset.source),
+        "version": dataset.version,
+        "rows": len(dataset.dataframe),
+        "label_columns": [str(column) for column in facets.label_columns],
+        "label_values": [str(value) for value in facets.label_values],
+        "column_labels": {
+            column: [int(labels[0]), int(labels[-1]) + 1] if len(labels) else [0, 0]
+            for column, labels in facets.column_labels.items()
+        },
+        "tag_keys": [list(key) for key in tag_keys],
+        "search_terms": search.terms,
+        "sort_columns": sort_columns,
+    }
+    temporary = directory / f"{MANIFEST_NAME}.{os.getpid()}.tmp"
+    temporary.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(temporary, directory / MANIFEST_NAME)
+    _prune(directory, keep=generation)
+    return target
+
+
+def _prune(directory: Path, keep: str) -> None:
+    """Delete all but the newest ``KEEP_GENERATIONS`` generations; ``keep`` always survives."""
+    generations = sorted(
+        (path for path in directory.iterdir() if path.is_dir() and (path / CATALOG_NAME).exists()),
+        key=lambda path: path.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for path in generations[KEEP_GENERATIONS:]:
+        if path.name != keep:
+            # Pages already mapped by a running process stay valid after the files are unlinked.
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def read_manifest(directory: str | Path) -> dict[str, Any]:
+    """Return the manifest of the bundle at ``directory``."""
+    manifest = json.loads((Path(directory) / MANIFEST_NAME).read_text(encoding="utf-8"))
+    if manifest.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"{directory} was written in an older bundle format; rebuild it with python -m app.bundle")
+    return manifest
+
+
+def _map_dataframe(path: Path) -> pd.DataFrame:
+    """Map the Arrow catalog; string and list columns keep pointing at the mapped pages."""
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+    def arrow_backed(kind: "pa.DataType") -> Any:
+        # Lists would otherwise become per-process Python objects, one per cell.
+        return pd.ArrowDtype(kind) if pa.types.is_list(kind) or pa.types.is_large_list(kind) else None
+
+    return table.to_pandas(split_blocks=True, types_mapper=arrow_backed)
+
+
+def read_bundle(directory: str | Path) -> Bundle:
+    """Map the current generation of the bundle at ``directory``."""
+    from app.related import RelatedIndex
+
+    manifest = read_manifest(directory)
+    root = Path(directory) / manifest["generation"]
+
+    def load(name: str) -> np.ndarray:
+        return np.asarray(np.load(root / f"{name}.npy", mmap_mode="r"))
+
+    dataframe = _map_dataframe(root / CATALOG_NAME)
+    dataframe.attrs["source_sha256"] = manifest["version"]
+    size = manifest["rows"]
+
+    facet_table = FacetTable(
+        size=size,
+        offsets=load("facet_offsets"),
+        codes=load("facet_codes"),
+        label_columns=np.array(manifest["label_columns"], dtype=object),
+        label_values=np.array(manifest["label_values"], dtype=object),
+        column_labels={column: np.arange(start, stop) for column, (start, stop) in manifest["column_labels"].items()},
+    )
+    tag_index = TagIndex(
+        size=size,
+        postings=dict(zip(map(tuple, manifest["tag_keys"]), _unpack(load("tag_rows"), load("tag_offsets")))),
+    )
+    search_offsets = load("search_offsets")
+    search_index = SearchIndex(
+        size=size,
+        terms=manifest["search_terms"],
+        postings=list(
+            zip(_unpack(load("search_rows"), search_offsets), _unpack(load("search_scores"), search_offsets))
+        ),
+    )
+    sort_index = SortIndex(
+        orders=dict(
+            zip(
+                manifest["sort_columns"],
+                zip(
+                    _unpack(load("sort_ranked"), load("sort_ranked_offsets")),
+                    _unpack(load("sort_missing"), load("sort_missing_offsets")),
+                ),
+            )
+        )
+    )
+    related = RelatedIndex(
+        table=facet_table,
+        labels=load("related_labels"),
+        neighbours=load("related_neighbours"),
+        scores=load("related_scores"),
+    )
+    return Bundle(
+        source=manifest["source"],
+        version=manifest["version"],
+        dataframe=dataframe,
+        tag_index=tag_index,
+        facet_table=facet_table,
+        search_index=search_index,
+        sort_index=sort_index,
+        related=related,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.dataset import Dataset
+
+    parser = argparse.ArgumentParser(description="Build a memory-mappable bundle of the catalog and its indexes.")
+    parser.add_argument("source", nargs="?", type=Path, default=DEFAULT_DATA_PATH)
+    parser.add_argument("--output", type=Path, default=DEFAULT_BUNDLE_DIR, help="bundle directory to (re)write")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    dataset = Dataset.build(args.source)
+    target = write_bundle(dataset, args.output)
+    size = sum(path.stat().st_size for path in target.iterdir())
+    print(
+        f"Wrote {len(dataset.dataframe)} tutorials ({size / 2**20:.1f} MB) to {target} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
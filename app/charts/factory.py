@@ -30,21 +30,21 @@ class ChartFactory:
     inner_radius: int = 50
     outer_radius: int = 200
 
-    def deployment_distribution(self, column: pd.Series) -> tuple[pd.DataFrame, dict]:
+    def deployment_distribution(self, column: pd.Series | pd.DataFrame) -> tuple[pd.DataFrame, dict]:
         """Return data and spec for the deployment distribution donut chart."""
         return self._donut_distribution(column, title="Deployment")
 
-    def technology_distribution(self, column: pd.Series) -> tuple[pd.DataFrame, dict]:
+    def technology_distribution(self, column: pd.Series | pd.DataFrame) -> tuple[pd.DataFrame, dict]:
         """Return data and spec for the robotics technology donut chart."""
         return self._donut_distribution(column, title="Robotics Technology")
 
-    def language_distribution(self, column: pd.Series) -> tuple[pd.DataFrame, dict]:
+    def language_distribution(self, column: pd.Series | pd.DataFrame) -> tuple[pd.DataFrame, dict]:
         """Return data and spec for the language donut chart."""
         return self._donut_distribution(column, title="Language")
 
-    def distro_distribution(self, column: pd.Series) -> tuple[pd.DataFrame, dict]:
+    def distro_distribution(self, column: pd.Series | pd.DataFrame) -> tuple[pd.DataFrame, dict]:
         """Return data and spec for the ROS distro bar chart."""
-        counts = value_counts_from_column(column)
+        counts = self._counts(column)
         if counts.empty:
             return counts, {}
 
@@ -75,9 +75,15 @@ class ChartFactory:
         remaining = sorted(name for name in values_list if name not in desired)
         return desired + remaining
 
-    def _donut_distribution(self, column: pd.Series, *, title: str) -> tuple[pd.DataFrame, dict]:
+    def _counts(self, column: pd.Series | pd.DataFrame) -> pd.DataFrame:
+        """Accept precomputed ``value``/``count`` frames or count a raw column."""
+        if isinstance(column, pd.DataFrame):
+            return column
+        return value_counts_from_column(column)
+
+    def _donut_distribution(self, column: pd.Series | pd.DataFrame, *, title: str) -> tuple[pd.DataFrame, dict]:
         """Shared builder for donut-style categorical charts."""
-        counts = value_counts_from_column(column)
+        counts = self._counts(column)
         if counts.empty:
             return counts, {}
 
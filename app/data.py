@@ -1,21 +1,42 @@
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterable, Mapping
 
+import numpy as np
 import pandas as pd
-import streamlit as st
 
-from tutorial_parser import load_tutorials
+from tutorial_parser import MULTI_VALUE_FIELDS, load_tutorials
 
 
-DEFAULT_DATA_PATH = Path(__file__).resolve().parent.parent / "tutorial_list.yaml"
+# A YAML file, a directory of YAML shards, or a glob such as ``catalogs/*.yaml``.
+DEFAULT_DATA_PATH = Path(
+    os.environ.get("TUTORIAL_LIST_PATH", Path(__file__).resolve().parent.parent / "tutorial_list.yaml")
+)
+DEFAULT_SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / ".cache"
+
+TAG_INDEX_COLUMNS = (
+    "distro",
+    "technology",
+    "application",
+    "stack",
+    "robot",
+    "hardware",
+    "deploy_docker",
+    "deploy_gui",
+    "language",
+    "governance",
+    "date",
+    "link_status",
+)
 
 
-@st.cache_data(show_spinner=False)
 def load_app_data(path: Path | None = None) -> pd.DataFrame:
-    """Load tutorial metadata from YAML and cache it for the session."""
+    """Load tutorial metadata from YAML, served from the snapshot when current."""
     target = path or DEFAULT_DATA_PATH
-    return load_tutorials(target)
+    return load_tutorials(target, snapshot_dir=DEFAULT_SNAPSHOT_DIR)
 
 
 def prepare_dataframe(dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -25,36 +46,140 @@ def prepare_dataframe(dataframe: pd.DataFrame) -> pd.DataFrame:
     if "date" in prepared.columns:
         prepared["date"] = pd.to_numeric(prepared["date"], errors="coerce").astype("Int16")
 
-    object_columns = prepared.select_dtypes(include=["object"]).columns
+    multi_value_columns = MULTI_VALUE_FIELDS.intersection(prepared.columns)
+    for column in multi_value_columns:
+        prepared[column] = prepared[column].map(_as_tag_list)
+
+    object_columns = prepared.select_dtypes(include=["object", "string"]).columns
     for column in object_columns:
-        prepared[column] = prepared[column].fillna("").astype(str)
+        if column not in multi_value_columns:
+            prepared[column] = prepared[column].fillna("").astype(str)
 
     return prepared
 
 
-def unique_comma_separated_values(column: pd.Series) -> list[str]:
-    """Extract unique values from a comma-separated column."""
-    values: set[str] = set()
-    for entry in column.dropna():
-        for part in str(entry).split(","):
-            normalized = part.strip()
-            if normalized and normalized.lower() != "not-defined":
-                values.add(normalized)
-    return sorted(values)
+def to_display_frame(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Join list cells into comma-separated strings for the rows being rendered."""
+    joined = {
+        column: dataframe[column].map(_display_text)
+        for column in MULTI_VALUE_FIELDS.intersection(dataframe.columns)
+    }
+    return dataframe.assign(**joined) if joined else dataframe
+
+
+def explode_multi_value(column: pd.Series) -> pd.DataFrame:
+    """Return a long-form table of row positions and categorical values."""
+    if pd.api.types.is_numeric_dtype(column):
+        column = column.astype("string")
+    lists = column.map(_as_tag_list).tolist()
+    lengths = np.fromiter((len(entry) for entry in lists), dtype=np.int64, count=len(lists))
+    rows = np.repeat(np.arange(len(lists), dtype=np.int64), lengths)
+    values = pd.Categorical([value for entry in lists for value in entry])
+    return pd.DataFrame({"row": rows, "value": values})
 
 
 def value_counts_from_column(column: pd.Series) -> pd.DataFrame:
-    """Count occurrences of values from a comma-separated column."""
-    collected: list[str] = []
-    for entry in column.dropna():
-        for part in str(entry).split(","):
-            normalized = part.strip()
-            if normalized and normalized.lower() != "not-defined":
-                collected.append(normalized)
-
-    if not collected:
+    """Count occurrences of values from a multi-valued (list or comma-separated) column."""
+    values = explode_multi_value(column)["value"]
+    if values.empty:
         return pd.DataFrame(columns=["value", "count"])
 
-    counts = pd.Series(collected).value_counts().reset_index()
+    counts = values.value_counts()
+    counts = counts[[str(value).lower() != "not-defined" for value in counts.index]]
+    if counts.empty:
+        return pd.DataFrame(columns=["value", "count"])
+
+    counts = counts.reset_index()
     counts.columns = ["value", "count"]
+    counts["value"] = counts["value"].astype(str)
     return counts
+
+
+def _as_tag_list(entry: Any) -> list[str]:
+    """Return the values of a multi-valued cell as a list of stripped strings."""
+    if isinstance(entry, list):
+        return entry
+    if entry is None or entry is pd.NA or (isinstance(entry, float) and np.isnan(entry)):
+        return []
+    if isinstance(entry, (tuple, np.ndarray)):
+        return [str(value) for value in entry]
+    return [part.strip() for part in str(entry).split(",") if part.strip()]
+
+
+def _display_text(entry: Any) -> str:
+    return ", ".join(_as_tag_list(entry))
+
+
+@dataclass(frozen=True)
+class TagIndex:
+    """Inverted index mapping (column, tag) pairs to sorted row positions."""
+
+    size: int
+    postings: Mapping[tuple[str, str], np.ndarray]
+
+    @classmethod
+    def build(cls, dataframe: pd.DataFrame, columns: Iterable[str] = TAG_INDEX_COLUMNS) -> "TagIndex":
+        """Index every tag of the given multi-valued columns by row position."""
+        size = len(dataframe)
+        postings: dict[tuple[str, str], np.ndarray] = {}
+        for column in columns:
+            if column not in dataframe.columns:
+                continue
+            exploded = explode_multi_value(dataframe[column])
+            if exploded.empty:
+                continue
+
+            codes, tags = pd.factorize(exploded["value"].astype(str).str.lower())
+            # Sorting (code, row) keys groups rows per tag in ascending order and drops repeats.
+            keys = np.unique(codes.astype(np.int64) * size + exploded["row"].to_numpy())
+            key_codes, key_rows = np.divmod(keys, size)
+            starts = np.flatnonzero(np.diff(key_codes)) + 1
+            for code, rows in zip(key_codes[np.r_[0, starts]], np.split(key_rows, starts)):
+                postings[(column, tags[code])] = rows
+
+        return cls(size=size, postings=postings)
+
+    def rows_for(self, column: str, selections: Iterable[str]) -> np.ndarray:
+        """Return the rows tagged with any of the selections in ``column``."""
+        empty = np.empty(0, dtype=np.int64)
+        matched = [self.postings.get((column, str(selection).strip().lower()), empty) for selection in selections]
+        if not matched:
+            return empty
+        if len(matched) == 1:
+            return matched[0]
+        return np.unique(np.concatenate(matched))
+
+
+@dataclass(frozen=True)
+class SortIndex:
+    """Precomputed ascending row orders per column, with missing values kept apart."""
+
+    orders: Mapping[str, tuple[np.ndarray, np.ndarray]]
+
+    @classmethod
+    def build(cls, dataframe: pd.DataFrame) -> "SortIndex":
+        """Sort every column once by its case-insensitive display value."""
+        orders: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for column in dataframe.columns:
+            values = dataframe[column].reset_index(drop=True)
+            if column in MULTI_VALUE_FIELDS:
+                values = values.map(_display_text)
+            if not pd.api.types.is_numeric_dtype(values):
+                values = values.astype("string").str.lower().replace("", pd.NA)
+
+            missing = values.isna().to_numpy()
+            ranked = values[~missing].sort_values(kind="stable")
+            orders[column] = (ranked.index.to_numpy(), np.flatnonzero(missing))
+        return cls(orders=orders)
+
+    def order(self, positions: np.ndarray, column: str | None, descending: bool = False) -> np.ndarray:
+        """Return ``positions`` reordered by ``column``; missing values always sort last."""
+        if column not in self.orders:
+            return positions
+
+        ranked, missing = self.orders[column]
+        if descending:
+            ranked = ranked[::-1]
+        selected = np.zeros(len(ranked) + len(missing), dtype=bool)
+        selected[positions] = True
+        return np.concatenate([ranked[selected[ranked]], missing[selected[missing]]])
@@ -0,0 +1,302 @@
+"""Process-wide, read-only tutorial dataset shared by every Streamlit session."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Mapping
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app import tracing
+from app.data import DEFAULT_DATA_PATH, DEFAULT_SNAPSHOT_DIR, SortIndex, TagIndex, prepare_dataframe
+from app.dedupe import duplicate_column, find_duplicates
+from app.facets import FacetCounter, FacetCube, FacetTable
+from app.links import DEFAULT_CACHE_PATH as LINK_CACHE_PATH
+from app.links import link_status_column, load_link_states
+from app.query import CatalogQuery, CatalogResult, FilterPlanner, ResultCache
+from app.ui.search import SearchIndex
+from tutorial_parser import TutorialListParser, resolve_sources
+
+if TYPE_CHECKING:
+    from app.related import RelatedIndex
+
+logger = logging.getLogger(__name__)
+
+# (path, mtime_ns, size) of every file the dataset was built from.
+_Signature = tuple[tuple[str, int, int], ...]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """A prepared catalog and its indexes; every session receives the same objects.
+
+    Consumers must treat ``dataframe`` as read-only: it is shared, not copied.
+    Indexes and columns used by a single view are built the first time that
+    view asks.
+    """
+
+    source: Path
+    version: str | None
+    dataframe: pd.DataFrame
+    tag_index: TagIndex
+    facet_table: FacetTable
+    planner: FilterPlanner
+
+    @classmethod
+    def build(cls, source: Path) -> "Dataset":
+        """Load, prepare and index ``source`` once."""
+        with tracing.span("parse", source=str(source)) as attributes:
+            parser = TutorialListParser(source, snapshot_dir=DEFAULT_SNAPSHOT_DIR)
+            raw = parser.load_dataframe()
+            attributes["rows_out"] = len(raw)
+            attributes["validation_issues"] = len(parser.report)
+        counts = parser.report.counts()
+        if any(counts.values()):
+            logger.info(
+                "Validated %s: %s (python -m tutorial_parser %s --output report.json for details)",
+                source,
+                ", ".join(f"{count} {kind}" for kind, count in counts.items() if count),
+                source,
+            )
+        with tracing.span("prepare_dataframe", rows_in=len(raw)):
+            dataframe = prepare_dataframe(raw)
+        with tracing.span("link_status", rows_in=len(dataframe)):
+            link_states = load_link_states(LINK_CACHE_PATH)
+            dataframe["link_status"] = link_status_column(dataframe, link_states)
+        version = dataset_version(dataframe.attrs.get("source_sha256"), link_states)
+        with tracing.span("build_indexes", rows_in=len(dataframe)):
+            tag_index = TagIndex.build(dataframe)
+            facet_table = FacetTable.build(dataframe)
+            search_index = SearchIndex.build(dataframe)
+            planner = FilterPlanner(dataframe, tag_index, search_index, facet_table)
+        return cls(
+            source=source,
+            version=version,
+            dataframe=dataframe,
+            tag_index=tag_index,
+            facet_table=facet_table,
+            planner=planner,
+        )
+
+    @classmethod
+    def load(cls, source: Path) -> "Dataset":
+        """Map ``source`` when it is a prebuilt bundle, otherwise build it from YAML."""
+        from app.bundle import is_bundle
+
+        return cls.from_bundle(source) if is_bundle(source) else cls.build(source)
+
+    @classmethod
+    def from_bundle(cls, directory: Path) -> "Dataset":
+        """Map a bundle written by ``python -m app.bundle``; no parsing or index building happens."""
+        from app.bundle import read_bundle
+
+        with tracing.span("map_bundle", source=str(directory)) as attributes:
+            bundle = read_bundle(directory)
+            attributes["rows_out"] = len(bundle.dataframe)
+        planner = FilterPlanner(bundle.dataframe, bundle.tag_index, bundle.search_index, bundle.facet_table)
+        dataset = cls(
+            source=directory,
+            version=bundle.version,
+            dataframe=bundle.dataframe,
+            tag_index=bundle.tag_index,
+            facet_table=bundle.facet_table,
+            planner=planner,
+        )
+        # Seed the lazily built indexes with their prebuilt copies; the mapped table has every column.
+        dataset.__dict__.update(catalog_frame=bundle.dataframe, sort_index=bundle.sort_index, related=bundle.related)
+        return dataset
+
+    def warm(self) -> None:
+        """Build every lazily built index now, so no page has to build one on a rerun."""
+        # The first catalog rerun builds the table's indexes itself, so start with the others.
+        for name in ("related", "cube", "catalog_frame", "sort_index"):
+            getattr(self, name)
+
+    # Concurrent first uses may both build an index; either result is equivalent.
+    @cached_property
+    def catalog_frame(self) -> pd.DataFrame:
+        """``dataframe`` plus the ``duplicate_of`` column the catalog table and exports show."""
+        with tracing.span("dedupe", rows_in=len(self.dataframe)):
+            duplicates = duplicate_column(self.dataframe, find_duplicates(self.dataframe))
+        return self.dataframe.assign(duplicate_of=duplicates)
+
+    @cached_property
+    def sort_index(self) -> SortIndex:
+        """Per-column row orders for the catalog table."""
+        with tracing.span("build:sort_index", rows_in=len(self.catalog_frame)):
+            return SortIndex.build(self.catalog_frame)
+
+    @cached_property
+    def facets(self) -> FacetCounter:
+        """Memoized row-based facet counts for the chart view."""
+        return FacetCounter(self.facet_table, version=self.version)
+
+    @cached_property
+    def related(self) -> RelatedIndex:
+        """Top related tutorials of every visible row for the catalog view."""
+        # Imported here: scipy only loads once a page asks for related tutorials.
+        from app.related import RelatedIndex
+
+        with tracing.span("build:related", rows_in=len(self.planner.visible)):
+            return RelatedIndex.build(self.facet_table, rows=self.planner.visible)
+
+    @cached_property
+    def cube(self) -> FacetCube:
+        """Pre-aggregated facet counts of the visible tutorials for the chart view."""
+        with tracing.span("build:facet_cube", rows_in=len(self.planner.visible)):
+            return FacetCube.build(self.facet_table, rows=self.planner.visible)
+
+
+def dataset_version(source_sha256: str | None, link_states: Mapping[str, str]) -> str:
+    """Fingerprint everything a build reads: the YAML content and the link states joined into it.
+
+    Caches shared across sessions key on this, so it must change whenever a
+    rebuild could produce different rows; without a content hash every build
+    gets a fresh id.
+    """
+    if source_sha256 is None:
+        return uuid.uuid4().hex
+    digest = hashlib.sha256(source_sha256.encode("utf-8"))
+    digest.update(json.dumps(sorted(link_states.items())).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _file_signature(path: Path) -> _Signature | None:
+    """Fingerprint the source file, or every shard of a directory/glob source, and the link cache.
+
+    A bundle is fingerprinted by its manifest alone, which is replaced last when it is rebuilt.
+    """
+    from app.bundle import MANIFEST_NAME, is_bundle
+
+    if is_bundle(path):
+        stat = (path / MANIFEST_NAME).stat()
+        return ((str(path / MANIFEST_NAME), stat.st_mtime_ns, stat.st_size),)
+    try:
+        stats = [(str(shard), shard.stat()) for shard in resolve_sources(path)]
+    except OSError:
+        return None
+    if LINK_CACHE_PATH.exists():
+        stats.append((str(LINK_CACHE_PATH), LINK_CACHE_PATH.stat()))
+    return tuple((name, stat.st_mtime_ns, stat.st_size) for name, stat in stats)
+
+
+class DatasetStore:
+    """Bounded LRU of datasets by source path, hot-swapped when a source file changes.
+
+    A daemon thread polls the watched files; when one changes, the new version
+    and all its indexes are built off to the side and then swapped in with a
+    single reference assignment, so a rerun sees either the old or the new
+    dataset, never a mix.
+    """
+
+    def __init__(self, max_entries: int = 4, poll_interval: float = 2.0) -> None:
+        self.max_entries = max_entries
+        self.poll_interval = poll_interval
+        self._entries: OrderedDict[Path, tuple[Dataset, _Signature | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._watcher: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def get(self, path: Path) -> Dataset:
+        """Return the current dataset for ``path``, building it on first use."""
+        path = Path(path).resolve()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+                return entry[0]
+
+        with self._build_lock:
+            with self._lock:
+                entry = self._entries.get(path)
+            if entry is None:
+                signature = _file_signature(path)
+                entry = (Dataset.load(path), signature)
+                self._store(path, entry)
+                # Serve the first rerun now and build the remaining indexes behind it.
+                threading.Thread(target=entry[0].warm, name="dataset-warm", daemon=True).start()
+        self._ensure_watcher()
+        return entry[0]
+
+    def reload(self, path: Path) -> Dataset:
+        """Rebuild ``path`` and its indexes now and atomically replace the cached version."""
+        path = Path(path).resolve()
+        with self._build_lock:
+            signature = _file_signature(path)
+            dataset = Dataset.load(path)
+            dataset.warm()
+            entry = (dataset, signature)
+            self._store(path, entry)
+        return entry[0]
+
+    def stop(self) -> None:
+        """Stop the file watcher."""
+        self._stopped.set()
+
+    def _store(self, path: Path, entry: tuple[Dataset, _Signature | None]) -> None:
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _ensure_watcher(self) -> None:
+        if self.poll_interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        self._watcher = threading.Thread(target=self._watch, name="dataset-watcher", daemon=True)
+        self._watcher.start()
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.poll_interval):
+            with self._lock:
+                watched = [(path, entry[1]) for path, entry in self._entries.items()]
+            for path, signature in watched:
+                current = _file_signature(path)
+                if current is None or current == signature:
+                    continue
+                try:
+                    self.reload(path)
+                    logger.info("Reloaded tutorial dataset from %s", path)
+                except Exception:  # keep serving the previous version on a bad edit
+                    logger.exception("Failed to reload tutorial dataset from %s", path)
+                    with self._lock:
+                        if path in self._entries:
+                            self._entries[path] = (self._entries[path][0], current)
+
+
+@st.cache_resource(show_spinner=False)
+def get_dataset_store() -> DatasetStore:
+    """Return the process-wide dataset store."""
+    return DatasetStore()
+
+
+def get_dataset(path: Path | None = None) -> Dataset:
+    """Return the shared dataset for ``path`` (defaults to ``tutorial_list.yaml``)."""
+    return get_dataset_store().get(path or DEFAULT_DATA_PATH)
+
+
+@st.cache_resource(show_spinner=False)
+def get_result_cache() -> ResultCache:
+    """Return the process-wide cache of catalog query results."""
+    return ResultCache()
+
+
+def run_query(dataset: Dataset, query: CatalogQuery, search_rows: np.ndarray | None = None) -> CatalogResult:
+    """Evaluate ``query`` on ``dataset``, served from the result cache when any session already ran it."""
+
+    def run() -> CatalogResult:
+        result = dataset.planner.run(query, search_rows=search_rows)
+        result.rows.setflags(write=False)  # shared across sessions from now on
+        return result
+
+    return get_result_cache().get(("query", dataset.version, query), run, lambda result: result.rows.nbytes)
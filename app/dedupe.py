@@ -0,0 +1,226 @@
+"""Near-duplicate tutorial detection with MinHash signatures and LSH banding.
+
+Each tutorial becomes a set of name character shingles, its normalized
+repository URL and its tags. MinHash estimates the Jaccard similarity of two
+sets from a fixed-size signature, and banding the signatures puts likely
+matches in the same bucket, so only bucket members are ever compared.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from app.data import DEFAULT_DATA_PATH, DEFAULT_SNAPSHOT_DIR, TAG_INDEX_COLUMNS, explode_multi_value
+
+DEFAULT_THRESHOLD = 0.7
+DEFAULT_NUM_PERM = 128
+SHINGLE_SIZE = 3
+DEDUPE_TAG_COLUMNS = tuple(column for column in TAG_INDEX_COLUMNS if column != "link_status")
+
+_EMPTY = np.iinfo(np.uint32).max
+# Signature cells gathered per chunk, bounding memory to ~32 MB.
+_CHUNK_ELEMENTS = 1 << 23
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+
+@dataclass(frozen=True)
+class DuplicateGroups:
+    """Clusters of near-duplicate rows and the verified pairs that formed them."""
+
+    labels: np.ndarray
+    pairs: pd.DataFrame
+
+    def groups(self) -> list[np.ndarray]:
+        """Return the row positions of every cluster, in order of their first row."""
+        clustered = np.flatnonzero(self.labels >= 0)
+        order = clustered[np.argsort(self.labels[clustered], kind="stable")]
+        bounds = np.flatnonzero(np.diff(self.labels[order])) + 1
+        return np.split(order, bounds) if order.size else []
+
+
+def _normalize_url(value: str) -> str:
+    text = value.strip().lower()
+    text = re.sub(r"^[a-z]+://(www\.)?", "", text)
+    return text.removesuffix("/").removesuffix(".git")
+
+
+def row_tokens(dataframe: pd.DataFrame, tag_columns: Iterable[str] = DEDUPE_TAG_COLUMNS) -> list[set[str]]:
+    """Return the feature set of every row: name shingles, repository and tags."""
+    names = dataframe["name"] if "name" in dataframe.columns else pd.Series([""] * len(dataframe))
+    repos = dataframe["repo"] if "repo" in dataframe.columns else pd.Series([""] * len(dataframe))
+
+    token_sets: list[set[str]] = []
+    for name, repo in zip(names, repos):
+        text = " " + _NON_ALPHANUMERIC.sub(" ", name.lower()).strip() + " " if isinstance(name, str) else ""
+        tokens = {"n:" + text[start : start + SHINGLE_SIZE] for start in range(max(0, len(text) - SHINGLE_SIZE + 1))}
+        if isinstance(repo, str) and repo.strip():
+            tokens.add("r:" + _normalize_url(repo))
+        token_sets.append(tokens)
+
+    for column in tag_columns:
+        if column not in dataframe.columns:
+            continue
+        exploded = explode_multi_value(dataframe[column])
+        categories = exploded["value"].cat.categories
+        labels = np.array([f"t:{column}={value}" for value in categories], dtype=object)
+        codes = exploded["value"].cat.codes.to_numpy()
+        keep = np.asarray(categories.astype(str).str.lower() != "not-defined")[codes]
+        for row, token in zip(exploded["row"].to_numpy()[keep].tolist(), labels[codes[keep]]):
+            token_sets[row].add(token)
+    return token_sets
+
+
+def minhash_signatures(token_sets: list[set[str]], num_perm: int = DEFAULT_NUM_PERM, seed: int = 1) -> np.ndarray:
+    """Return one ``num_perm``-wide MinHash signature per set; empty sets get all-max rows."""
+    lengths = np.fromiter((len(tokens) for tokens in token_sets), dtype=np.int64, count=len(token_sets))
+    offsets = np.zeros(len(token_sets) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    codes, uniques = pd.factorize(pd.Series([token for tokens in token_sets for token in tokens], dtype=object))
+    base = np.fromiter((zlib.crc32(token.encode("utf-8")) for token in uniques), dtype=np.uint64, count=len(uniques))
+
+    # Multiply-shift hashing, (a * x + b mod 2**64) >> 32, applied once per distinct token.
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+    table = ((base[:, None] * a + b) >> np.uint64(32)).astype(np.uint32)
+
+    signatures = np.full((len(token_sets), num_perm), _EMPTY, dtype=np.uint32)
+    entries_per_chunk = max(1, _CHUNK_ELEMENTS // num_perm)
+    bounds = np.unique(np.searchsorted(offsets, np.arange(0, offsets[-1], entries_per_chunk), side="right") - 1)
+    for first, last in zip(bounds, [*bounds[1:], len(token_sets)]):
+        rows = np.arange(first, last)
+        rows = rows[lengths[rows] > 0]
+        if rows.size == 0:
+            continue
+        start, stop = offsets[rows[0]], offsets[rows[-1] + 1]
+        signatures[rows] = np.minimum.reduceat(table[codes[start:stop]], offsets[rows] - start, axis=0)
+    return signatures
+
+
+def choose_bands(threshold: float, num_perm: int) -> int:
+    """Pick the band count whose LSH S-curve best separates pairs at ``threshold``."""
+    similarity = np.linspace(0.0, 1.0, 201)
+    below = similarity < threshold
+    best, best_error = 1, np.inf
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        candidate = 1.0 - (1.0 - similarity**rows) ** bands
+        error = candidate[below].sum() + (1.0 - candidate[~below]).sum()
+        if error < best_error:
+            best, best_error = bands, error
+    return best
+
+
+def candidate_pairs(signatures: np.ndarray, bands: int, seed: int = 1) -> np.ndarray:
+    """Return ``(anchor, member)`` pairs sharing at least one band bucket.
+
+    Each bucket links its members to its first row only, so a bucket of ``m``
+    rows yields ``m - 1`` pairs instead of ``m²``; union-find restores the
+    transitive clusters.
+    """
+    valid = np.flatnonzero(signatures[:, 0] != _EMPTY)
+    if valid.size < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    width = signatures.shape[1] // bands
+    mixers = np.random.default_rng(seed).integers(1, np.iinfo(np.int64).max, size=width, dtype=np.uint64) | np.uint64(1)
+
+    found = []
+    for band in range(bands):
+        block = signatures[valid, band * width : (band + 1) * width]
+        keys = (block.astype(np.uint64) * mixers).sum(axis=1)  # wraps modulo 2**64
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        anchors = valid[first[inverse]]
+        linked = anchors != valid
+        found.append(np.stack([anchors[linked], valid[linked]], axis=1))
+    pairs = np.concatenate(found)
+    return np.unique(pairs, axis=0) if pairs.size else pairs
+
+
+def _cluster(size: int, pairs: np.ndarray) -> np.ndarray:
+    parent = np.arange(size)
+
+    def root(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for left, right in pairs:
+        left_root, right_root = root(int(left)), root(int(right))
+        if left_root != right_root:
+            parent[max(left_root, right_root)] = min(left_root, right_root)
+
+    roots = np.array([root(node) for node in range(size)], dtype=np.int64)
+    labels = np.full(size, -1, dtype=np.int64)
+    members = np.bincount(roots, minlength=size)
+    clustered = members[roots] > 1
+    labels[clustered] = np.unique(roots[clustered], return_inverse=True)[1]
+    return labels
+
+
+def find_duplicates(
+    dataframe: pd.DataFrame,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    seed: int = 1,
+) -> DuplicateGroups:
+    """Cluster rows whose estimated feature-set Jaccard similarity reaches ``threshold``."""
+    signatures = minhash_signatures(row_tokens(dataframe), num_perm=num_perm, seed=seed)
+    pairs = candidate_pairs(signatures, choose_bands(threshold, num_perm), seed=seed)
+    similarity = (
+        (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1) if len(pairs) else np.empty(0)
+    )
+    keep = similarity >= threshold
+    pairs, similarity = pairs[keep], similarity[keep]
+    return DuplicateGroups(
+        labels=_cluster(len(dataframe), pairs),
+        pairs=pd.DataFrame({"left": pairs[:, 0], "right": pairs[:, 1], "similarity": similarity}),
+    )
+
+
+def duplicate_column(dataframe: pd.DataFrame, duplicates: DuplicateGroups) -> pd.Series:
+    """Name the other members of each row's cluster; empty for rows without duplicates."""
+    names = dataframe["name"].astype(str).to_numpy() if "name" in dataframe.columns else np.full(len(dataframe), "")
+    column = np.full(len(dataframe), "", dtype=object)
+    for members in duplicates.groups():
+        for position in members:
+            column[position] = "; ".join(names[other] for other in members if other != position)
+    return pd.Series(column, index=dataframe.index, dtype="str")
+
+
+def main(argv: list[str] | None = None) -> int:
+    from tutorial_parser import load_tutorials
+
+    parser = argparse.ArgumentParser(description="Report near-duplicate tutorials.")
+    parser.add_argument("source", nargs="?", type=Path, default=DEFAULT_DATA_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="minimum estimated Jaccard similarity")
+    parser.add_argument("--num-perm", type=int, default=DEFAULT_NUM_PERM, help="MinHash signature width")
+    parser.add_argument("--fail-on-duplicates", action="store_true", help="exit 1 if any cluster is found")
+    args = parser.parse_args(argv)
+
+    dataframe = load_tutorials(args.source, snapshot_dir=DEFAULT_SNAPSHOT_DIR)
+    duplicates = find_duplicates(dataframe, threshold=args.threshold, num_perm=args.num_perm)
+    groups = duplicates.groups()
+    best = duplicates.pairs.groupby("right")["similarity"].max() if len(duplicates.pairs) else pd.Series(dtype=float)
+    for number, members in enumerate(groups, start=1):
+        print(f"Group {number}:")
+        for position in members:
+            row = dataframe.iloc[position]
+            score = f"{best[position]:.2f}" if position in best.index else "    "
+            print(f"  {score}  #{row.get('row_index', position)}  {row.get('name', '')} — {row.get('organization', '')}")
+    print(f"{len(groups)} groups of near-duplicates among {len(dataframe)} tutorials.")
+    return 1 if args.fail_on_duplicates and groups else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""Chunked export of catalog rows to CSV, JSON Lines, Parquet and Arrow.
+
+Rows are converted a chunk at a time. The CLI writes each chunk straight to
+a file; an in-app download is built in memory and Streamlit keeps a copy
+until it is served, so in-app exports are capped at ``MAX_APP_EXPORT_ROWS``.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Callable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.data import DEFAULT_DATA_PATH, to_display_frame
+from tutorial_parser import MULTI_VALUE_FIELDS
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+CHUNK_ROWS = 5_000
+# Concurrent in-app exports; further clicks wait instead of multiplying memory use.
+MAX_CONCURRENT_EXPORTS = 2
+# Rows of one in-app export; larger ones are for ``python -m app.export``.
+MAX_APP_EXPORT_ROWS = 20_000
+
+_export_slots = threading.BoundedSemaphore(MAX_CONCURRENT_EXPORTS)
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    """A downloadable file type and whether it can hold list values."""
+
+    label: str
+    suffix: str
+    mime: str
+    native_lists: bool
+
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("CSV", ".csv", "text/csv", native_lists=False),
+    "jsonl": ExportFormat("JSON Lines", ".jsonl", "application/x-ndjson", native_lists=True),
+    "parquet": ExportFormat("Parquet", ".parquet", "application/vnd.apache.parquet", native_lists=True),
+    "arrow": ExportFormat("Arrow", ".arrow", "application/vnd.apache.arrow.file", native_lists=True),
+}
+
+
+def iter_chunks(
+    dataframe: pd.DataFrame,
+    rows: np.ndarray,
+    columns: Sequence[str],
+    joined_lists: bool = False,
+    chunk_rows: int = CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``columns`` of ``rows``, in order, ``chunk_rows`` at a time."""
+    for start in range(0, len(rows), chunk_rows):
+        chunk = dataframe.iloc[rows[start : start + chunk_rows]][list(columns)]
+        yield to_display_frame(chunk) if joined_lists else chunk
+
+
+def iter_csv(
+    dataframe: pd.DataFrame, rows: np.ndarray, columns: Sequence[str], chunk_rows: int = CHUNK_ROWS
+) -> Iterator[bytes]:
+    """Yield UTF-8 CSV, header first; list cells are always joined."""
+    yield pd.DataFrame(columns=list(columns)).to_csv(index=False).encode("utf-8")
+    for chunk in iter_chunks(dataframe, rows, columns, joined_lists=True, chunk_rows=chunk_rows):
+        yield chunk.to_csv(index=False, header=False).encode("utf-8")
+
+
+def iter_jsonl(
+    dataframe: pd.DataFrame,
+    rows: np.ndarray,
+    columns: Sequence[str],
+    joined_lists: bool = False,
+    chunk_rows: int = CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """Yield one JSON object per row."""
+    for chunk in iter_chunks(dataframe, rows, columns, joined_lists, chunk_rows):
+        yield chunk.to_json(orient="records", lines=True, force_ascii=False).encode("utf-8")
+
+
+def arrow_schema(dataframe: pd.DataFrame, columns: Sequence[str], joined_lists: bool = False) -> "pa.Schema":
+    """Fix every column's Arrow type up front so all chunks share one schema."""
+    import pyarrow as pa
+
+    fields = []
+    for column in columns:
+        series = dataframe[column]
+        if column in MULTI_VALUE_FIELDS:
+            kind = pa.string() if joined_lists else pa.list_(pa.string())
+        elif series.dtype == object:
+            kind = pa.string()
+        else:
+            # Typed columns convert without inspecting values; an empty slice gives the type.
+            kind = pa.Array.from_pandas(series.iloc[:0]).type
+        fields.append(pa.field(column, kind))
+    return pa.schema(fields)
+
+
+def write_arrow(
+    sink: str | Path | IO[bytes],
+    dataframe: pd.DataFrame,
+    rows: np.ndarray,
+    columns: Sequence[str],
+    parquet: bool = False,
+    joined_lists: bool = False,
+    chunk_rows: int = CHUNK_ROWS,
+) -> None:
+    """Write rows as an Arrow IPC file (or Parquet) one record batch per chunk."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = arrow_schema(dataframe, columns, joined_lists)
+    writer = pq.ParquetWriter(sink, schema) if parquet else pa.ipc.new_file(sink, schema)
+    try:
+        for chunk in iter_chunks(dataframe, rows, columns, joined_lists, chunk_rows):
+            batch = pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False)
+            if parquet:
+                writer.write_batch(batch)
+            else:
+                writer.write(batch)
+    finally:
+        writer.close()
+
+
+def write_export(
+    sink: IO[bytes],
+    kind: str,
+    dataframe: pd.DataFrame,
+    rows: np.ndarray,
+    columns: Sequence[str],
+    joined_lists: bool = False,
+) -> None:
+    """Write rows to the binary file ``sink`` in the ``EXPORT_FORMATS`` format ``kind``."""
+    if kind in ("parquet", "arrow"):
+        write_arrow(sink, dataframe, rows, columns, parquet=kind == "parquet", joined_lists=joined_lists)
+        return
+    if kind == "csv":
+        chunks = iter_csv(dataframe, rows, columns)
+    else:
+        chunks = iter_jsonl(dataframe, rows, columns, joined_lists)
+    for data in chunks:
+        sink.write(data)
+
+
+def deferred_export(
+    kind: str,
+    dataframe: pd.DataFrame,
+    rows: np.ndarray,
+    columns: Sequence[str],
+    joined_lists: bool = False,
+) -> Callable[[], bytes]:
+    """Return a callable that builds the export of the first ``MAX_APP_EXPORT_ROWS`` rows on download.
+
+    Streamlit runs it off the event loop on click and keeps the returned
+    bytes in its media storage while the download is served, so the file is
+    held in memory twice while it is built. At most ``MAX_CONCURRENT_EXPORTS``
+    run at once.
+    """
+    rows = np.array(rows[:MAX_APP_EXPORT_ROWS], copy=True)
+    columns = list(columns)
+
+    def build() -> bytes:
+        with _export_slots:
+            buffer = io.BytesIO()
+            write_export(buffer, kind, dataframe, rows, columns, joined_lists)
+            return buffer.getvalue()
+
+    return build
+
+
+def _parse_selection(text: str) -> tuple[str, list[str]]:
+    column, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError("expected COLUMN=VALUE[,VALUE...]")
+    return column, [value.strip() for value in values.split(",") if value.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.dataset import Dataset
+    from app.query import CatalogQuery
+
+    parser = argparse.ArgumentParser(description="Export filtered tutorials without loading the result in memory.")
+    parser.add_argument("output", type=Path, help="file to write; the format follows its suffix unless --format is set")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS))
+    parser.add_argument("--source", type=Path, default=DEFAULT_DATA_PATH)
+    parser.add_argument("--search", default="")
+    parser.add_argument("--name-contains", default="")
+    parser.add_argument("--organization-contains", default="")
+    parser.add_argument("--select", type=_parse_selection, action="append", default=[], help="COLUMN=VALUE[,VALUE...]")
+    parser.add_argument("--joined-lists", action="store_true", help="write multi-valued fields as comma-joined text")
+    args = parser.parse_args(argv)
+
+    kind = args.format or next(
+        (name for name, spec in EXPORT_FORMATS.items() if spec.suffix == args.output.suffix), None
+    )
+    if kind is None:
+        parser.error(f"cannot infer the format of {args.output}; pass --format")
+
+    dataset = Dataset.load(args.source)
+    query = CatalogQuery.build(args.search, args.name_contains, args.organization_contains, dict(args.select))
+    rows = dataset.planner.run(query).rows
+    dataframe = dataset.catalog_frame
+    columns = [column for column in dataframe.columns if column not in {"row_index", "legacy"}]
+    with args.output.open("wb") as sink:
+        write_export(sink, kind, dataframe, rows, columns, args.joined_lists)
+    print(f"Wrote {len(rows)} tutorials to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""Facet aggregation over the categorical columns of the tutorial catalog."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from app.data import explode_multi_value
+from tutorial_parser import MULTI_VALUE_FIELDS
+
+FACET_COLUMNS = tuple(sorted(MULTI_VALUE_FIELDS | {"organization", "governance", "doc_type", "date", "link_status"}))
+
+# Dimensions of the facet cube: the single-valued, low-cardinality sidebar filters.
+# Dates and the multi-valued tag columns would give nearly one cell per row, so
+# the cube keeps their co-occurrence counts instead (see MARGINAL_COLUMNS).
+CUBE_COLUMNS = ("governance", "link_status")
+
+# Sidebar filter columns whose labels get a row of co-occurrence counts in the cube,
+# which answers a filter on any one of them without visiting the matching rows.
+MARGINAL_COLUMNS = (
+    "application",
+    "date",
+    "deploy_docker",
+    "deploy_gui",
+    "distro",
+    "governance",
+    "hardware",
+    "language",
+    "link_status",
+    "robot",
+    "stack",
+    "technology",
+)
+
+
+@dataclass(frozen=True)
+class FacetTable:
+    """Row-grouped (CSR) table of facet label codes shared by every column."""
+
+    size: int
+    offsets: np.ndarray
+    codes: np.ndarray
+    label_columns: np.ndarray
+    label_values: np.ndarray
+    column_labels: Mapping[str, np.ndarray]
+
+    @classmethod
+    def build(cls, dataframe: pd.DataFrame, columns: Iterable[str] = FACET_COLUMNS) -> "FacetTable":
+        """Explode every facet column into one global label space."""
+        size = len(dataframe)
+        rows: list[np.ndarray] = []
+        codes: list[np.ndarray] = []
+        label_columns: list[str] = []
+        label_values: list[str] = []
+        column_labels: dict[str, np.ndarray] = {}
+
+        for column in columns:
+            if column not in dataframe.columns:
+                continue
+            exploded = explode_multi_value(dataframe[column])
+            values = exploded["value"]
+            keep = ~values.astype(str).str.lower().eq("not-defined").to_numpy()
+            exploded = exploded[keep]
+            values = exploded["value"].cat.remove_unused_categories()
+
+            offset = len(label_values)
+            categories = [str(value) for value in values.cat.categories]
+            label_columns.extend([column] * len(categories))
+            label_values.extend(categories)
+            column_labels[column] = np.arange(offset, offset + len(categories))
+            rows.append(exploded["row"].to_numpy())
+            codes.append(values.cat.codes.to_numpy().astype(np.int64) + offset)
+
+        all_rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        all_codes = np.concatenate(codes) if codes else np.empty(0, dtype=np.int64)
+        order = np.argsort(all_rows, kind="stable")
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(all_rows, minlength=size), out=offsets[1:])
+
+        return cls(
+            size=size,
+            offsets=offsets,
+            codes=all_codes[order],
+            label_columns=np.asarray(label_columns, dtype=object),
+            label_values=np.asarray(label_values, dtype=object),
+            column_labels=column_labels,
+        )
+
+    def count(self, rows: np.ndarray | None = None) -> np.ndarray:
+        """Count every label over ``rows`` (all rows when ``None``) in one pass."""
+        if rows is None:
+            codes = self.codes
+        else:
+            codes = self.codes[self._entries(rows)]
+        return np.bincount(codes, minlength=len(self.label_values))
+
+    def to_frame(self, counts: np.ndarray, column: str) -> pd.DataFrame:
+        """Return ``value``/``count`` rows for one column, most frequent first."""
+        labels = self.column_labels.get(column)
+        if labels is None:
+            return pd.DataFrame(columns=["value", "count"])
+
+        labels = labels[counts[labels] > 0]
+        if labels.size == 0:
+            return pd.DataFrame(columns=["value", "count"])
+
+        order = np.lexsort((self.label_values[labels], -counts[labels]))
+        labels = labels[order]
+        return pd.DataFrame({"value": self.label_values[labels].astype(str), "count": counts[labels]})
+
+    def _entries(self, rows: np.ndarray) -> np.ndarray:
+        """Return the positions in ``codes`` that belong to ``rows``."""
+        starts = self.offsets[rows]
+        lengths = self.offsets[rows + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        # Expand each [start, start + length) range without a Python loop.
+        shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return shifts + np.arange(total)
+
+
+@dataclass(frozen=True)
+class FacetCube:
+    """Pre-aggregated label counts per combination of the cube dimensions.
+
+    Rows carrying the same labels in every cube dimension collapse into one
+    cell, which keeps the counts of every facet label over its rows. A filter
+    on the cube dimensions selects cells and sums their counts, so its cost
+    depends on the number of cells and labels, not on the number of tutorials.
+    A filter on one marginal column is answered from the co-occurrence counts
+    of its labels instead.
+    """
+
+    table: FacetTable
+    weights: np.ndarray
+    counts: np.ndarray
+    lookup: Mapping[tuple[str, str], int]
+    marginals: np.ndarray
+    marginal_lookup: Mapping[str, Mapping[str, int]]
+    exclusive: frozenset[str]
+
+    @classmethod
+    def build(
+        cls,
+        table: FacetTable,
+        rows: np.ndarray | None = None,
+        columns: Iterable[str] = CUBE_COLUMNS,
+        marginal_columns: Iterable[str] = MARGINAL_COLUMNS,
+    ) -> "FacetCube":
+        """Group ``rows`` of ``table`` (all rows when ``None``) into cells over ``columns``."""
+        columns = [column for column in columns if column in table.column_labels]
+        dimension = np.zeros(len(table.label_values), dtype=bool)
+        for column in columns:
+            dimension[table.column_labels[column]] = True
+
+        rows = np.arange(table.size) if rows is None else np.asarray(rows, dtype=np.int64)
+        row_of_entry = np.repeat(np.arange(len(rows)), table.offsets[rows + 1] - table.offsets[rows])
+        codes = table.codes[table._entries(rows)]
+
+        # A row's cell key is the byte string of its dimension label codes, which are in column order.
+        keep = dimension[codes]
+        bounds = np.searchsorted(row_of_entry[keep], np.arange(1, len(rows)))
+        chunks = np.split(codes[keep], bounds) if len(rows) else []
+        cell_of_row, unique_keys = pd.factorize(pd.Series([chunk.tobytes() for chunk in chunks], dtype=object))
+        cells = len(unique_keys)
+
+        labels = len(table.label_values)
+        counts = np.bincount(cell_of_row[row_of_entry] * labels + codes, minlength=cells * labels)
+        lookup = {
+            (str(table.label_columns[label]), str(table.label_values[label])): int(label)
+            for label in np.flatnonzero(dimension)
+        }
+        marginal_columns = [column for column in marginal_columns if column in table.column_labels]
+        marginal_labels = np.concatenate(
+            [table.column_labels[column] for column in marginal_columns] or [np.empty(0, dtype=np.int64)]
+        )
+        marginal_lookup: dict[str, dict[str, int]] = {}
+        for position, label in enumerate(marginal_labels):
+            marginal_lookup.setdefault(str(table.label_columns[label]), {})[str(table.label_values[label])] = position
+        # Rows in a single-valued column carry at most one of its labels, so their counts add up across values.
+        exclusive = frozenset(
+            column
+            for column in marginal_columns
+            if np.bincount(row_of_entry[np.isin(codes, table.column_labels[column])], minlength=1).max() <= 1
+        )
+        return cls(
+            table=table,
+            weights=np.bincount(cell_of_row, minlength=cells).astype(np.int64),
+            counts=counts.reshape(cells, labels).astype(np.int64),
+            lookup=lookup,
+            marginals=_co_occurrences(table, rows, marginal_labels),
+            marginal_lookup=marginal_lookup,
+            exclusive=exclusive,
+        )
+
+    def covers(self, selections: Iterable[tuple[str, Iterable[str]]]) -> bool:
+        """Whether every filtered column is a cube dimension, or one marginal column is filtered."""
+        selections = [(column, values) for column, values in selections if values]
+        dimensions = {column for column, _ in self.lookup}
+        return all(column in dimensions for column, _ in selections) or self._marginal(selections) is not None
+
+    def count(self, selections: Iterable[tuple[str, Iterable[str]]] = ()) -> np.ndarray:
+        """Label counts over rows matching any value within, and every column across, ``selections``."""
+        selections = [(column, values) for column, values in selections if values]
+        marginal = self._marginal(selections)
+        if marginal is not None:
+            return self.marginals[marginal].sum(axis=0)
+
+        selected = np.ones(len(self.weights), dtype=bool)
+        for column, values in selections:
+            if not values:
+                continue
+            labels = [self.lookup[(column, str(value))] for value in values if (column, str(value)) in self.lookup]
+            # Every row of a cell carries the cell's dimension labels, so a nonzero count marks the cell.
+            selected &= self.counts[:, labels].any(axis=1)
+        return self.counts[selected].sum(axis=0)
+
+    def frames(self, selections: Iterable[tuple[str, Iterable[str]]] = ()) -> dict[str, pd.DataFrame]:
+        """Return per-column ``value``/``count`` frames for ``selections``."""
+        counts = self.count(selections)
+        return {column: self.table.to_frame(counts, column) for column in self.table.column_labels}
+
+    def _marginal(self, selections: list[tuple[str, Iterable[str]]]) -> list[int] | None:
+        """Rows of ``marginals`` that sum to the counts of ``selections``, or ``None`` if they do not."""
+        if len(selections) != 1:
+            return None
+        column, values = selections[0]
+        positions = self.marginal_lookup.get(column)
+        values = [str(value) for value in values]
+        # Rows carrying several selected values would be counted once per value.
+        if positions is None or (len(values) > 1 and column not in self.exclusive):
+            return None
+        return [positions[value] for value in values if value in positions]
+
+def _co_occurrences(table: FacetTable, rows: np.ndarray, labels: np.ndarray, chunk: int = 4096) -> np.ndarray:
+    """Count every label of ``table`` over the ``rows`` carrying each of ``labels``, one row per label."""
+    size = len(table.label_values)
+    position = np.full(size, -1, dtype=np.int32)
+    position[labels] = np.arange(len(labels), dtype=np.int32)
+    counts = np.zeros(len(labels) * size, dtype=np.int64)
+    for start in range(0, len(rows), chunk):
+        part = rows[start : start + chunk]
+        lengths = table.offsets[part + 1] - table.offsets[part]
+        codes = table.codes[table._entries(part)].astype(np.int32)
+        firsts = position[codes]
+        keep = firsts >= 0
+        # Pair every entry of one of ``labels`` with every entry of its row, all within ``codes``.
+        owners = np.repeat(np.arange(len(part)), lengths)[keep]
+        starts = np.cumsum(lengths) - lengths
+        owned = lengths[owners]
+        partners = np.repeat(starts[owners] - np.cumsum(owned) + owned, owned) + np.arange(int(owned.sum()))
+        counts += np.bincount(np.repeat(firsts[keep] * size, owned) + codes[partners], minlength=counts.size)
+    return counts.reshape(len(labels), size)
+
+
+class FacetCounter:
+    """Memoized facet counts keyed by dataset version and filter state.
+
+    Counts for a new row selection are derived from the previous result when
+    the two selections differ by fewer rows than the new one contains.
+    """
+
+    def __init__(self, table: FacetTable, version: str | None = None, max_entries: int = 128) -> None:
+        self.table = table
+        self.version = version
+        self.max_entries = max_entries
+        self._cache: OrderedDict[Hashable, dict[str, pd.DataFrame]] = OrderedDict()
+        self._last: tuple[np.ndarray | None, np.ndarray] | None = None
+        self._lock = threading.Lock()
+
+    def frames(self, rows: np.ndarray | None = None, key: Hashable = ()) -> dict[str, pd.DataFrame]:
+        """Return per-column counts for ``rows``, where ``key`` identifies the filter state."""
+        cache_key = (self.version, key)
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+
+            selection = None if rows is None else np.unique(rows)
+            counts = self._count(selection)
+            self._last = (selection, counts)
+            frames = {column: self.table.to_frame(counts, column) for column in self.table.column_labels}
+            self._cache[cache_key] = frames
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+            return frames
+
+    def _count(self, selection: np.ndarray | None) -> np.ndarray:
+        if self._last is None or selection is None:
+            return self.table.count(selection)
+
+        previous, previous_counts = self._last
+        if previous is None:
+            previous = np.arange(self.table.size)
+
+        removed = np.setdiff1d(previous, selection, assume_unique=True)
+        added = np.setdiff1d(selection, previous, assume_unique=True)
+        if removed.size + added.size >= selection.size:
+            return self.table.count(selection)
+        return previous_counts - self.table.count(removed) + self.table.count(added)
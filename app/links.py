@@ -0,0 +1,254 @@
+"""Concurrent health checks of the catalog's documentation and repository links.
+
+Run ``python -m app.links`` to refresh the cache; the app only reads it.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Mapping
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from app.data import DEFAULT_DATA_PATH, DEFAULT_SNAPSHOT_DIR
+
+if TYPE_CHECKING:
+    import aiohttp
+
+LINK_COLUMNS = ("doc", "repo", "intro")
+DEFAULT_CACHE_PATH = DEFAULT_SNAPSHOT_DIR / "link_status.json"
+DEFAULT_TTL = 24 * 3600.0
+CACHE_VERSION = 1
+
+# Per-row states, worst first; a row takes the worst state of its links.
+LINK_STATES = ("broken", "unreachable", "unchecked", "ok")
+
+# Servers that reject HEAD answer these; the link is then retried with GET.
+_HEAD_UNSUPPORTED = frozenset({403, 405, 501})
+
+
+@dataclass(frozen=True)
+class LinkStatus:
+    """Outcome of one URL check."""
+
+    url: str
+    state: str
+    status_code: int | None
+    checked_at: float
+    detail: str = ""
+
+
+class LinkCache:
+    """Persistent ``url -> LinkStatus`` map whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.entries: dict[str, LinkStatus] = {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if payload.get("version") == CACHE_VERSION:
+            self.entries = {url: LinkStatus(**record) for url, record in payload.get("links", {}).items()}
+
+    def stale(self, urls: Iterable[str], now: float | None = None) -> list[str]:
+        """Return the ``urls`` never checked or checked more than ``ttl`` seconds ago."""
+        now = time.time() if now is None else now
+        return [url for url in urls if url not in self.entries or now - self.entries[url].checked_at > self.ttl]
+
+    def update(self, statuses: Iterable[LinkStatus]) -> None:
+        for status in statuses:
+            self.entries[status.url] = status
+
+    def save(self) -> None:
+        """Write the cache atomically so a running app never reads a partial file."""
+        payload = {"version": CACHE_VERSION, "links": {url: asdict(status) for url, status in self.entries.items()}}
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+class _HostGate:
+    """Admit requests to a host once a connection slot is free and its rate allows.
+
+    Waiting happens here rather than in the connection pool so that the
+    request timeout only measures the request itself.
+    """
+
+    def __init__(self, limit: int, limit_per_host: int, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._overall = asyncio.Semaphore(limit)
+        self._per_host: dict[str, asyncio.Semaphore] = {}
+        self._limit_per_host = limit_per_host
+        self._next: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        semaphore = self._per_host.setdefault(host, asyncio.Semaphore(self._limit_per_host))
+        async with semaphore, self._overall:
+            if self.interval:
+                loop = asyncio.get_running_loop()
+                now = loop.time()
+                # Reserve the slot before sleeping so concurrent callers queue up behind it.
+                start = max(now, self._next.get(host, now))
+                self._next[host] = start + self.interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
+
+
+class LinkChecker:
+    """Check URLs concurrently over pooled connections with per-host limits.
+
+    ``limit_per_host`` caps open connections to one host and ``rate_per_host``
+    caps its requests per second, so large catalogs hosted mostly on one
+    forge do not trip its abuse detection.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        rate_per_host: float = 10.0,
+        timeout: float = 10.0,
+        user_agent: str = "ros-tutorial-catalog-link-checker",
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.rate_per_host = rate_per_host
+        self.timeout = timeout
+        self.user_agent = user_agent
+
+    def run(self, urls: Iterable[str]) -> list[LinkStatus]:
+        """Check ``urls`` from synchronous code."""
+        return asyncio.run(self.check(urls))
+
+    async def check(self, urls: Iterable[str]) -> list[LinkStatus]:
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        gate = _HostGate(self.limit, self.limit_per_host, self.rate_per_host)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers={"User-Agent": self.user_agent}
+        ) as session:
+            return list(await asyncio.gather(*(self._check_one(session, gate, url) for url in urls)))
+
+    async def _check_one(self, session: "aiohttp.ClientSession", gate: _HostGate, url: str) -> LinkStatus:
+        import aiohttp
+
+        host = urlsplit(url).netloc.lower()
+        try:
+            status_code = await self._request(session, gate, host, "HEAD", url)
+            if status_code in _HEAD_UNSUPPORTED:
+                status_code = await self._request(session, gate, host, "GET", url)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as error:
+            return LinkStatus(url, "unreachable", None, time.time(), type(error).__name__)
+        state = "ok" if status_code < 400 else "broken"
+        return LinkStatus(url, state, status_code, time.time())
+
+    @staticmethod
+    async def _request(
+        session: "aiohttp.ClientSession", gate: _HostGate, host: str, method: str, url: str
+    ) -> int:
+        async with gate.slot(host), session.request(method, url, allow_redirects=True) as response:
+            return response.status
+
+
+def collect_urls(dataframe: pd.DataFrame, columns: Iterable[str] = LINK_COLUMNS) -> list[str]:
+    """Return the distinct http(s) URLs of ``columns``, in first-seen order."""
+    urls: dict[str, None] = {}
+    for column in columns:
+        if column not in dataframe.columns:
+            continue
+        for value in dataframe[column]:
+            text = str(value).strip() if isinstance(value, str) else ""
+            if text.startswith(("http://", "https://")):
+                urls.setdefault(text)
+    return list(urls)
+
+
+def check_links(
+    urls: Iterable[str],
+    cache: LinkCache,
+    checker: LinkChecker | None = None,
+    force: bool = False,
+) -> list[LinkStatus]:
+    """Check the stale ``urls`` (all of them with ``force``), record them in ``cache`` and save it."""
+    urls = list(urls)
+    pending = urls if force else cache.stale(urls)
+    statuses = (checker or LinkChecker()).run(pending) if pending else []
+    cache.update(statuses)
+    cache.save()
+    return statuses
+
+
+def load_link_states(path: Path = DEFAULT_CACHE_PATH) -> dict[str, str]:
+    """Return ``url -> state`` from the cache, ignoring its TTL; empty when missing."""
+    return {url: status.state for url, status in LinkCache(path).entries.items()}
+
+
+def link_status_column(
+    dataframe: pd.DataFrame, states: Mapping[str, str], columns: Iterable[str] = LINK_COLUMNS
+) -> pd.Series:
+    """Return each row's worst link state, or ``not-defined`` when it has no links."""
+    rank = {state: position for position, state in enumerate(LINK_STATES)}
+    present = [column for column in columns if column in dataframe.columns]
+
+    def row_state(values: tuple) -> str:
+        found = [
+            states.get(text, "unchecked")
+            for text in (str(value).strip() for value in values if isinstance(value, str))
+            if text.startswith(("http://", "https://"))
+        ]
+        return min(found, key=rank.__getitem__) if found else "not-defined"
+
+    rows = zip(*(dataframe[column] for column in present)) if present else ((),) * len(dataframe)
+    return pd.Series([row_state(values) for values in rows], index=dataframe.index, dtype="str")
+
+
+def main(argv: list[str] | None = None) -> int:
+    from tutorial_parser import load_tutorials
+
+    parser = argparse.ArgumentParser(description="Check the doc, repo and intro links of the tutorial catalog.")
+    parser.add_argument("source", nargs="?", type=Path, default=DEFAULT_DATA_PATH)
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE_PATH)
+    parser.add_argument("--ttl-hours", type=float, default=DEFAULT_TTL / 3600, help="re-check links older than this")
+    parser.add_argument("--force", action="store_true", help="re-check every link regardless of the cache")
+    parser.add_argument("--limit", type=int, default=100, help="open connections overall")
+    parser.add_argument("--limit-per-host", type=int, default=8, help="open connections per host")
+    parser.add_argument("--rate-per-host", type=float, default=10.0, help="requests per second per host")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds per request")
+    parser.add_argument("--fail-on-broken", action="store_true", help="exit 1 if any link is broken")
+    args = parser.parse_args(argv)
+
+    urls = collect_urls(load_tutorials(args.source, snapshot_dir=DEFAULT_SNAPSHOT_DIR))
+    cache = LinkCache(args.cache, ttl=args.ttl_hours * 3600)
+    checker = LinkChecker(args.limit, args.limit_per_host, args.rate_per_host, args.timeout)
+    start = time.perf_counter()
+    statuses = check_links(urls, cache, checker, force=args.force)
+    elapsed = time.perf_counter() - start
+
+    summary = Counter(cache.entries[url].state for url in urls)
+    counts = ", ".join(f"{count} {state}" for state, count in sorted(summary.items()))
+    print(f"Checked {len(statuses)} of {len(urls)} links in {elapsed:.1f}s: {counts}")
+    problems = [cache.entries[url] for url in urls if cache.entries[url].state != "ok"]
+    for status in problems:
+        reason = str(status.status_code or status.detail)
+        print(f"{status.state:<12}{reason:<22}{status.url}")
+    return 1 if args.fail_on_broken and any(status.state == "broken" for status in problems) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
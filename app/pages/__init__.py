@@ -1 +1,40 @@
-"""Views for the Streamlit tutorial catalog."""
+"""Views for the Streamlit tutorial catalog.
+
+Page modules are imported on first use so that starting the app only pays for
+the view the user opens.
+"""
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from app.dataset import Dataset
+
+
+@dataclass(frozen=True)
+class Page:
+    """A navigation entry and the ``module:function`` that renders it."""
+
+    label: str
+    module: str
+    function: str
+
+    def load(self) -> Callable[["Dataset"], None]:
+        """Import the page module if needed and return its render function."""
+        return getattr(importlib.import_module(self.module), self.function)
+
+
+PAGES = (
+    Page("Catalog", "app.pages.catalog", "show_catalog"),
+    Page("Charts", "app.pages.charts", "show_charts"),
+)
+
+
+def get_page(label: str) -> Page:
+    """Return the registered page called ``label``."""
+    for page in PAGES:
+        if page.label == label:
+            return page
+    raise KeyError(label)
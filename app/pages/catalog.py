@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import re
-
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from app.data import unique_comma_separated_values
-from app.ui.search import GlobalSearch
+from app import tracing
+from app.data import SortIndex, to_display_frame
+from app.dataset import Dataset, get_dataset, run_query
+from app.export import EXPORT_FORMATS, MAX_APP_EXPORT_ROWS, deferred_export
+from app.ui.debug import traced_fragment
+from app.ui.filters import render_filters
+from tutorial_parser import VOCABULARIES
 
 CATALOG_COLUMN_ORDER = [
     "name",
@@ -26,6 +30,7 @@ CATALOG_COLUMN_ORDER = [
     "hardware",
     "stack",
     "repo",
+    "link_status",
     "packages",
     "distro",
     "deploy_native",
@@ -35,116 +40,167 @@ CATALOG_COLUMN_ORDER = [
     "docker_image_base",
     "docker_overlay",
     "ci",
+    "duplicate_of",
 ]
 
-COLUMN_HELP_TEXT = {
+_COLUMN_DESCRIPTIONS = {
     "name": "Description of the Training Material.",
     "organization": "Owner of the Material.",
     "date": "Creation or last major update year.",
-    "governance": "[company, consortium, laboratory, university, community, individual] governance type.",
-    "country": "[de, us, es, fr, gb, it] country of origin.",
+    "governance": "governance type.",
+    "country": "country of origin.",
     "maintainer": "Contact of known expert contributors or maintainers.",
     "user": "Contact of known trainers or users.",
     "intro": "Introduction page to the Material (e.g., ROS Discourse).",
     "doc": "Documentation URL (e.g., https://robgineer.github.io/cobot/).",
-    "doc_type": "[pdf, sphinx, markdown, workshop repository] documentation format.",
-    "language": "[de, en, es, fr, gb, it] languages covered by the Material.",
-    "technology": "[manipulation, navigation, perception, software-engineering, fieldbus] robotics technology focus.",
-    "application": "[welding, pickplace, palletizing, conveying, humanoid] robotics application focus.",
-    "robot": "[ur5e, ur10e, panda, pcobot, scara, turtlebot3] robots covered by the Material.",
-    "hardware": "[stm32_f407, raspberry_pi4, jetson_nano, nvidia_gpu, tof_vl53l1x] additional hardware required.",
-    "stack": "[basics, ros2_control, urdf, gazebo, rviz, moveit, nav2, tesseract, opencv, pytorch] software stack coverage.",
+    "doc_type": "documentation format.",
+    "language": "languages covered by the Material.",
+    "technology": "robotics technology focus.",
+    "application": "robotics application focus.",
+    "robot": "robots covered by the Material.",
+    "hardware": "additional hardware required.",
+    "stack": "software stack coverage.",
     "repo": "Code repository URL (e.g., https://github.com/robgineer/cobot).",
+    "link_status": (
+        "Worst state of the doc, repo and intro links at the last `python -m app.links` run: "
+        "ok, broken, unreachable or unchecked."
+    ),
     "packages": "Software packages covered by the Material.",
-    "distro": "[humble, jazzy, rolling, windows10, debian12] ROS distro or specific OS supported.",
-    "deploy_native": "[bash, ansible, iso, fai] native deployment method.",
-    "deploy_gui": "[x11local, x11forward, tigervnc, webapp] method to display ROS GUI.",
-    "deploy_specifics": "[devcontainer, virtualbox, clusterssh] deployment specifics.",
-    "deploy_docker": "[dockerfile, dockercompose, rocker, ade] Docker deployment approach.",
+    "distro": "ROS distro or specific OS supported.",
+    "deploy_native": "native deployment method.",
+    "deploy_gui": "method to display ROS GUI.",
+    "deploy_specifics": "deployment specifics.",
+    "deploy_docker": "Docker deployment approach.",
     "docker_image_base": "Base Docker image (e.g., tiryoh/ros2-desktop-vnc:jazzy).",
-    "docker_overlay": "[builder, dever, visualizer] Docker overlay type.",
+    "docker_overlay": "Docker overlay type.",
     "ci": "Continuous integration availability (true/false).",
+    "duplicate_of": "Likely duplicates of this entry by name, repository and tags (see `python -m app.dedupe`).",
 }
 
+# Fields with a documented vocabulary list its values first, as ingest validates against them.
+COLUMN_HELP_TEXT = {
+    column: f"[{', '.join(VOCABULARIES[column])}] {text}" if column in VOCABULARIES else text
+    for column, text in _COLUMN_DESCRIPTIONS.items()
+}
 
-def _options_from_column(column: pd.Series) -> list[str]:
-    return sorted({str(value) for value in column.dropna() if str(value)})
 
+PAGE_SIZE_OPTIONS = (25, 50, 100, 250)
 
-def _apply_contains_filter(
-    dataframe: pd.DataFrame, column: str, selections: list[str]
-) -> pd.DataFrame:
-    if selections and column in dataframe.columns:
-        pattern = "|".join(re.escape(selection) for selection in selections)
-        return dataframe[dataframe[column].str.contains(pattern, case=False, na=False)]
-    return dataframe
 
+def _paginate(
+    rows: np.ndarray,
+    sort_index: SortIndex,
+    display_columns: list[str],
+    default_order: str = "Catalog order",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Render sort and page controls; return the positions of all ``rows`` in display order and of the visible page."""
+    sort_col, direction_col, size_col, page_col = st.columns([3, 2, 2, 2])
+    sort_column = sort_col.selectbox(
+        "Sort by",
+        options=[None, *display_columns],
+        format_func=lambda column: default_order if column is None else column.replace("_", " ").title(),
+    )
+    descending = direction_col.radio("Direction", options=("Ascending", "Descending"), horizontal=True) == "Descending"
+    page_size = size_col.selectbox("Rows per page", options=PAGE_SIZE_OPTIONS)
+    page_count = max(1, -(-len(rows) // page_size))
+    page = page_col.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+
+    ordered = sort_index.order(rows, sort_column, descending=descending)
+    start = (int(page) - 1) * page_size
+    visible = ordered[start : start + page_size]
+
+    if len(rows):
+        st.caption(
+            f"Showing {start + 1}–{start + len(visible)} of {len(rows)} tutorials (page {page} of {page_count})."
+        )
+    else:
+        st.caption("No tutorials match the current filters.")
+    return ordered, visible
+
+
+def _render_export(dataset: Dataset, rows: np.ndarray, columns: list[str]) -> None:
+    """Offer the filtered rows, in table order, as a file built only when downloaded."""
+    with st.popover("Export", disabled=len(rows) == 0):
+        kind = st.selectbox(
+            "Format",
+            options=list(EXPORT_FORMATS),
+            format_func=lambda name: EXPORT_FORMATS[name].label,
+            key="export_format",
+        )
+        spec = EXPORT_FORMATS[kind]
+        joined = not spec.native_lists or (
+            st.radio("Multi-valued fields", ("Lists", "Joined text"), horizontal=True, key="export_lists")
+            == "Joined text"
+        )
+        label = f"Download {len(rows)} tutorials"
+        if len(rows) > MAX_APP_EXPORT_ROWS:
+            label = f"Download the first {MAX_APP_EXPORT_ROWS} of {len(rows)} tutorials"
+            st.caption("Run `python -m app.export` with the same search and filters to export all of them.")
+        st.download_button(
+            label,
+            data=deferred_export(kind, dataset.catalog_frame, rows, columns, joined_lists=joined),
+            file_name=f"tutorials{spec.suffix}",
+            mime=spec.mime,
+            on_click="ignore",
+        )
+
+
+def _render_related(dataset: Dataset, row: int) -> None:
+    """Render the precomputed most similar tutorials of ``row``."""
+    dataframe = dataset.dataframe
+    st.subheader(f"Related to {dataframe['name'].iat[row]}")
+    with tracing.span("related"):
+        related = dataset.related
+        rows, scores = related.related(row)
+    if len(rows) == 0:
+        st.info("No other tutorial shares its stack, technology, robot, distro or application.")
+        return
 
-def _apply_exact_filter(dataframe: pd.DataFrame, column: str, selections: list[str]) -> pd.DataFrame:
-    if selections and column in dataframe.columns:
-        normalized = {str(selection) for selection in selections}
-        return dataframe[dataframe[column].astype(str).isin(normalized)]
-    return dataframe
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "name": dataframe["name"].iloc[rows].to_numpy(),
+                "organization": dataframe["organization"].iloc[rows].to_numpy(),
+                "similarity": scores,
+                "shared": [", ".join(related.shared_tags(row, other)) for other in rows],
+            }
+        ),
+        hide_index=True,
+        width="stretch",
+        column_config={
+            "name": st.column_config.Column("Name"),
+            "organization": st.column_config.Column("Organization"),
+            "similarity": st.column_config.ProgressColumn("Similarity", min_value=0.0, max_value=1.0, format="%.2f"),
+            "shared": st.column_config.Column("Shared tags"),
+        },
+    )
 
 
-def show_catalog(dataframe: pd.DataFrame) -> None:
+def show_catalog(dataset: Dataset) -> None:
     """Render the main catalog table with global and column filters."""
-    search = GlobalSearch()
-    query = search.render()
-    filtered = search.apply(dataframe, query)
-
-    st.sidebar.header("Filters")
-    name_filter = st.sidebar.text_input("Name contains")
-    org_filter = st.sidebar.text_input("Organization contains")
-    distro_options = unique_comma_separated_values(filtered.get("distro", pd.Series(dtype=str)))
-    distro_filter = st.sidebar.multiselect("ROS distro", options=distro_options)
-    tech_options = unique_comma_separated_values(filtered.get("technology", pd.Series(dtype=str)))
-    tech_filter = st.sidebar.multiselect("Technology", options=tech_options)
-    application_options = unique_comma_separated_values(filtered.get("application", pd.Series(dtype=str)))
-    application_filter = st.sidebar.multiselect("Application", options=application_options)
-    stack_options = unique_comma_separated_values(filtered.get("stack", pd.Series(dtype=str)))
-    stack_filter = st.sidebar.multiselect("Stack", options=stack_options)
-    robot_options = unique_comma_separated_values(filtered.get("robot", pd.Series(dtype=str)))
-    robot_filter = st.sidebar.multiselect("Robot", options=robot_options)
-    hardware_options = unique_comma_separated_values(filtered.get("hardware", pd.Series(dtype=str)))
-    hardware_filter = st.sidebar.multiselect("Hardware", options=hardware_options)
-    deploy_docker_options = unique_comma_separated_values(filtered.get("deploy_docker", pd.Series(dtype=str)))
-    deploy_docker_filter = st.sidebar.multiselect("Deploy (Docker)", options=deploy_docker_options)
-    deploy_gui_options = unique_comma_separated_values(filtered.get("deploy_gui", pd.Series(dtype=str)))
-    deploy_gui_filter = st.sidebar.multiselect("Deploy (GUI)", options=deploy_gui_options)
-    governance_options = _options_from_column(filtered.get("governance", pd.Series(dtype=str)))
-    governance_filter = st.sidebar.multiselect("Governance", options=governance_options)
-    date_options = _options_from_column(filtered.get("date", pd.Series(dtype=str)))
-    date_filter = st.sidebar.multiselect("Date", options=date_options)
-    language_options = unique_comma_separated_values(filtered.get("language", pd.Series(dtype=str)))
-    language_filter = st.sidebar.multiselect("Language", options=language_options)
-
-    if name_filter:
-        filtered = filtered[filtered["name"].str.contains(name_filter, case=False, na=False)]
-
-    if org_filter and "organization" in filtered.columns:
-        filtered = filtered[filtered["organization"].str.contains(org_filter, case=False, na=False)]
-
-    filtered = _apply_contains_filter(filtered, "distro", distro_filter)
-    filtered = _apply_contains_filter(filtered, "technology", tech_filter)
-    filtered = _apply_contains_filter(filtered, "application", application_filter)
-    filtered = _apply_contains_filter(filtered, "stack", stack_filter)
-    filtered = _apply_contains_filter(filtered, "robot", robot_filter)
-    filtered = _apply_contains_filter(filtered, "hardware", hardware_filter)
-    filtered = _apply_contains_filter(filtered, "deploy_docker", deploy_docker_filter)
-    filtered = _apply_contains_filter(filtered, "deploy_gui", deploy_gui_filter)
-    filtered = _apply_contains_filter(filtered, "language", language_filter)
-    filtered = _apply_exact_filter(filtered, "governance", governance_filter)
-    filtered = _apply_exact_filter(filtered, "date", date_filter)
-
-    if "legacy" in filtered.columns:
-        non_legacy_mask = ~filtered["legacy"].astype(str).str.lower().eq("true")
-        filtered = filtered[non_legacy_mask]
-
-    ordered_columns = [column for column in CATALOG_COLUMN_ORDER if column in filtered.columns]
+    _catalog_view(dataset)
+
+
+@traced_fragment("catalog")
+def _catalog_view(dataset: Dataset) -> None:
+    """Filters, table, export and related rows, rerun together without the rest of the app.
+
+    Changing a filter, the sort, the page or the selected row reruns only this
+    fragment: page setup, navigation and dataset loading are skipped and only
+    its elements are sent to the browser again.
+    """
+    # A fragment rerun replays the last full rerun's arguments; pick up a reloaded dataset.
+    dataset = get_dataset(dataset.source)
+    dataframe = dataset.catalog_frame
+    query, search_rows = render_filters(dataset)
+    with tracing.span("filter", rows_in=len(dataframe)) as attributes:
+        rows = run_query(dataset, query, search_rows).rows
+        attributes["rows_out"] = len(rows)
+
+    ordered_columns = [column for column in CATALOG_COLUMN_ORDER if column in dataframe.columns]
     remaining_columns = [
         column
-        for column in filtered.columns
+        for column in dataframe.columns
         if column not in ordered_columns and column not in {"row_index", "legacy"}
     ]
     display_columns = ordered_columns + remaining_columns
@@ -161,9 +217,28 @@ def show_catalog(dataframe: pd.DataFrame) -> None:
             label = column.replace("_", " ").title()
             column_config[column] = st.column_config.Column(label, help=help_text)
 
-    st.dataframe(
-        filtered[display_columns],
-        width="stretch",
-        height=600,
-        column_config=column_config if column_config else None,
-    )
+    with tracing.span("paginate", rows_in=len(rows)):
+        default_order = "Relevance" if query.search else "Catalog order"
+        ordered_rows, page_rows = _paginate(rows, dataset.sort_index, display_columns, default_order)
+        visible = to_display_frame(dataframe.iloc[page_rows][display_columns])
+
+    with tracing.span("render:dataframe", rows_out=len(visible)) as attributes:
+        if tracing.enabled():
+            attributes["payload_bytes"] = tracing.payload_bytes(visible)
+        event = st.dataframe(
+            visible,
+            width="stretch",
+            height=600,
+            column_config=column_config if column_config else None,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="catalog_table",
+        )
+
+    _render_export(dataset, ordered_rows, display_columns)
+
+    selected = event.selection.rows
+    if selected and selected[0] < len(page_rows):
+        _render_related(dataset, int(page_rows[selected[0]]))
+    else:
+        st.caption("Select a row to see related tutorials.")
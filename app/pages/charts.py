@@ -1,62 +1,110 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from app import tracing
 from app.charts.factory import ChartFactory
-
-
-def show_charts(dataframe: pd.DataFrame) -> None:
+from app.dataset import Dataset, get_dataset, run_query
+from app.query import CatalogQuery
+from app.ui.debug import traced_fragment
+from app.ui.filters import render_filters
+
+_EMPTY_COUNTS = pd.DataFrame(columns=["value", "count"])
+
+
+@dataclass(frozen=True)
+class ChartPanel:
+    """One chart of the view: the facet it counts and the ``ChartFactory`` method drawing it."""
+
+    column: str
+    title: str
+    chart: str
+    empty_message: str
+
+
+CHART_PANELS = (
+    ChartPanel(
+        "deploy_docker",
+        "Docker Deployment Overview",
+        "deployment_distribution",
+        "No Docker deployment information available.",
+    ),
+    ChartPanel(
+        "technology",
+        "Robotics Technology Distribution",
+        "technology_distribution",
+        "No robotics technology information available.",
+    ),
+    ChartPanel("language", "Language Distribution", "language_distribution", "No language information available."),
+    ChartPanel("distro", "ROS Distro Coverage", "distro_distribution", "No ROS distro information available."),
+)
+
+
+def show_charts(dataset: Dataset) -> None:
     """Render aggregated charts for deployment methods and ROS distros."""
-    st.sidebar.info("Charts aggregate all tutorials currently loaded.")
+    _charts_view(dataset)
 
-    factory = ChartFactory()
 
-    _render_deployment_chart(factory, dataframe.get("deploy_docker", pd.Series(dtype=str)))
-    _render_technology_chart(factory, dataframe.get("technology", pd.Series(dtype=str)))
-    _render_language_chart(factory, dataframe.get("language", pd.Series(dtype=str)))
-    _render_distro_chart(factory, dataframe.get("distro", pd.Series(dtype=str)))
+@traced_fragment("charts")
+def _charts_view(dataset: Dataset) -> None:
+    """Filters and every chart panel; a filter change reruns only this fragment."""
+    # A fragment rerun replays the last full rerun's arguments; pick up a reloaded dataset.
+    dataset = get_dataset(dataset.source)
+    query, search_rows = render_filters(dataset)
+    st.sidebar.info("Charts follow the search and filters above.")
 
+    with tracing.span("facet_counts") as attributes:
+        counts, attributes["source"] = _facet_counts(dataset, query, search_rows)
 
-def _render_deployment_chart(factory: ChartFactory, column: pd.Series) -> None:
-    """Render the donut chart summarizing deployment methods."""
-    st.subheader("Docker Deployment Overview")
-    data, spec = factory.deployment_distribution(column)
-    if data.empty:
-        st.info("No Docker deployment information available.")
-        return
+    for panel in CHART_PANELS:
+        _chart_panel(panel, dataset.version, counts.get(panel.column, _EMPTY_COUNTS))
 
-    st.vega_lite_chart(data, spec, use_container_width=True)
 
+def _facet_counts(
+    dataset: Dataset, query: CatalogQuery, search_rows: np.ndarray | None
+) -> tuple[dict[str, pd.DataFrame], str]:
+    """Answer filters the facet cube covers from its counts; other filters need the matching rows."""
+    if not (query.search or query.name_contains or query.organization_contains) and dataset.cube.covers(
+        query.selections
+    ):
+        return dataset.cube.frames(query.selections), "cube"
+    rows = run_query(dataset, query, search_rows).rows
+    return dataset.facets.frames(rows, key=query), "rows"
 
-def _render_technology_chart(factory: ChartFactory, column: pd.Series) -> None:
-    """Render the donut chart summarizing robotics technologies."""
-    st.subheader("Robotics Technology Distribution")
-    data, spec = factory.technology_distribution(column)
-    if data.empty:
-        st.info("No robotics technology information available.")
-        return
 
-    st.vega_lite_chart(data, spec, use_container_width=True)
+@st.cache_resource(max_entries=512, show_spinner=False)
+def _chart_spec(chart: str, version: str | None, counts: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    """Build a chart once per dataset version and counts, shared by every session.
+
+    The counts are hashed into the key; they are one small row per facet value.
+    Filter states with equal counts share the chart.
+    """
+    return getattr(ChartFactory(), chart)(counts)
 
 
-def _render_language_chart(factory: ChartFactory, column: pd.Series) -> None:
-    """Render the donut chart summarizing languages."""
-    st.subheader("Language Distribution")
-    data, spec = factory.language_distribution(column)
+@traced_fragment("chart_panel")
+def _chart_panel(panel: ChartPanel, version: str | None, counts: pd.DataFrame) -> None:
+    """Render one chart; toggling its counts table reruns and resends this panel alone."""
+    st.subheader(panel.title)
+    with tracing.span(f"chart:{panel.chart}"):
+        data, spec = _chart_spec(panel.chart, version, counts)
     if data.empty:
-        st.info("No language information available.")
+        st.info(panel.empty_message)
         return
 
-    st.vega_lite_chart(data, spec, use_container_width=True)
-
+    if st.toggle("Show counts", key=f"chart_counts_{panel.column}"):
+        st.dataframe(data, hide_index=True, width="stretch")
+    else:
+        _vega_lite_chart(data, spec)
 
-def _render_distro_chart(factory: ChartFactory, column: pd.Series) -> None:
-    """Render the bar chart summarizing ROS distros."""
-    st.subheader("ROS Distro Coverage")
-    data, spec = factory.distro_distribution(column)
-    if data.empty:
-        st.info("No ROS distro information available.")
-        return
 
-    st.vega_lite_chart(data, spec, use_container_width=True)
+def _vega_lite_chart(data: pd.DataFrame, spec: dict) -> None:
+    """Send one chart to the browser, recording its payload size when tracing."""
+    with tracing.span("render:vega_lite_chart", rows_out=len(data)) as attributes:
+        if tracing.enabled():
+            attributes["payload_bytes"] = tracing.payload_bytes(data)
+        st.vega_lite_chart(data, spec, width="stretch")
@@ -0,0 +1,239 @@
+"""Single-pass evaluation of the catalog search box and sidebar filters."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Mapping, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from app import tracing
+from app.data import TagIndex
+from app.facets import FacetTable
+from app.ui.search import GlobalSearch, SearchIndex
+
+T = TypeVar("T")
+
+# URL query parameters of the text filters; tag filters use their column name.
+SEARCH_PARAM = "q"
+NAME_PARAM = "name"
+ORGANIZATION_PARAM = "organization"
+
+
+@dataclass(frozen=True)
+class CatalogQuery:
+    """Canonical, hashable description of the search box and sidebar filters."""
+
+    search: str = ""
+    name_contains: str = ""
+    organization_contains: str = ""
+    selections: tuple[tuple[str, tuple[str, ...]], ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        search: str = "",
+        name_contains: str = "",
+        organization_contains: str = "",
+        selections: Mapping[str, Iterable[str]] | None = None,
+    ) -> "CatalogQuery":
+        """Normalize the inputs so equivalent filter states compare equal."""
+        canonical = tuple(
+            sorted(
+                (column, tuple(sorted({str(value) for value in values})))
+                for column, values in (selections or {}).items()
+                if values
+            )
+        )
+        return cls(
+            search=(search or "").strip(),
+            name_contains=(name_contains or "").strip(),
+            organization_contains=(organization_contains or "").strip(),
+            selections=canonical,
+        )
+
+    def to_query_params(self) -> dict[str, list[str]]:
+        """Serialize to URL query parameters; equal queries give identical, ordered parameters.
+
+        Multi-valued filters repeat their key, e.g. ``?distro=humble&distro=jazzy``.
+        """
+        params = {
+            key: [value]
+            for key, value in (
+                (SEARCH_PARAM, self.search),
+                (NAME_PARAM, self.name_contains),
+                (ORGANIZATION_PARAM, self.organization_contains),
+            )
+            if value
+        }
+        params.update((column, list(values)) for column, values in self.selections)
+        return params
+
+    @classmethod
+    def from_query_params(cls, params: Mapping[str, Iterable[str]], columns: Iterable[str]) -> "CatalogQuery":
+        """Parse URL query parameters; keys other than the text filters and ``columns`` are ignored."""
+
+        def first(key: str) -> str:
+            return next(iter(params.get(key, ())), "")
+
+        return cls.build(
+            first(SEARCH_PARAM),
+            first(NAME_PARAM),
+            first(ORGANIZATION_PARAM),
+            {column: list(params[column]) for column in columns if column in params},
+        )
+
+
+@dataclass(frozen=True)
+class CatalogResult:
+    """Rows matching a query, in display order, plus the predicate order used."""
+
+    rows: np.ndarray
+    plan: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a ``ResultCache`` since it was created."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """Bounded LRU of query results shared by every session of the process.
+
+    Keys must include the dataset version, so a reloaded dataset is never
+    answered with stale rows; entries of the old version simply age out.
+    Cached values are shared, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 2**20) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, compute: Callable[[], T], nbytes: Callable[[T], int]) -> T:
+        """Return the cached value of ``key``, computing and storing it on a miss."""
+        with tracing.span("result_cache") as attributes, self._lock:
+            entry = self._entries.get(key)
+            attributes["hit"] = entry is not None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        # Computed outside the lock so one slow query does not hold up other sessions.
+        value = compute()
+        size = nbytes(value)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, size)
+                self._nbytes += size
+                while self._entries and (len(self._entries) > self.max_entries or self._nbytes > self.max_bytes):
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._nbytes -= evicted
+                    self._evictions += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._nbytes)
+
+
+class FilterPlanner:
+    """Combine every catalog predicate into one row selection without intermediate frames."""
+
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        tag_index: TagIndex,
+        search_index: SearchIndex,
+        facets: FacetTable,
+    ) -> None:
+        self.dataframe = dataframe
+        self.tag_index = tag_index
+        self.search = GlobalSearch(index=search_index)
+        self.facets = facets
+        if "legacy" in dataframe.columns:
+            legacy = dataframe["legacy"].astype(str).str.lower().eq("true").to_numpy()
+            self.visible = np.flatnonzero(~legacy)
+        else:
+            self.visible = np.arange(len(dataframe))
+        self._all_options = self._options_from_counts(facets.count())
+
+    def search_rows(self, search: str) -> np.ndarray | None:
+        """Return rows matching the search box, best first; ``None`` when it is empty."""
+        if not search:
+            return None
+        with tracing.span("search", rows_in=len(self.dataframe)) as attributes:
+            matched = self.search.apply(self.dataframe, search)
+            attributes["rows_out"] = len(matched)
+        return self.dataframe.index.get_indexer(matched.index)
+
+    def options(self, search_rows: np.ndarray | None) -> dict[str, list[str]]:
+        """Return the selectable values of every facet column for the searched rows."""
+        if search_rows is None:
+            return self._all_options
+        return self._options_from_counts(self.facets.count(search_rows))
+
+    def run(self, query: CatalogQuery, search_rows: np.ndarray | None = None) -> CatalogResult:
+        """Evaluate ``query``, cheapest and most selective predicates first."""
+        if search_rows is None and query.search:
+            search_rows = self.search_rows(query.search)
+
+        # Index-backed predicates are row sets whose size is their selectivity estimate.
+        candidates: list[tuple[int, str, np.ndarray]] = [(len(self.visible), "not legacy", self.visible)]
+        if search_rows is not None:
+            candidates.append((len(search_rows), "search", np.sort(search_rows)))
+        for column, values in query.selections:
+            rows = self.tag_index.rows_for(column, values)
+            candidates.append((len(rows), column, rows))
+        candidates.sort(key=lambda candidate: candidate[0])
+
+        plan: list[str] = []
+        rows = candidates[0][2]
+        for _, label, predicate_rows in candidates:
+            plan.append(label)
+            with tracing.span(f"filter:{label}", rows_in=len(rows)) as attributes:
+                if predicate_rows is not rows:
+                    rows = np.intersect1d(rows, predicate_rows, assume_unique=True)
+                attributes["rows_out"] = len(rows)
+            if rows.size == 0:
+                break
+
+        # Substring predicates cannot use an index, so they only scan the survivors.
+        for column, text in (("name", query.name_contains), ("organization", query.organization_contains)):
+            if text and rows.size and column in self.dataframe.columns:
+                plan.append(f"{column} contains")
+                with tracing.span(f"filter:{column} contains", rows_in=len(rows)) as attributes:
+                    values = self.dataframe[column].iloc[rows].astype(str)
+                    rows = rows[values.str.contains(text, case=False, na=False, regex=False).to_numpy()]
+                    attributes["rows_out"] = len(rows)
+
+        if search_rows is not None:
+            rows = search_rows[np.isin(search_rows, rows, assume_unique=True)]
+        return CatalogResult(rows=rows, plan=tuple(plan))
+
+    def _options_from_counts(self, counts: np.ndarray) -> dict[str, list[str]]:
+        options: dict[str, list[str]] = {}
+        for column, labels in self.facets.column_labels.items():
+            present = labels[counts[labels] > 0]
+            options[column] = sorted(str(value) for value in self.facets.label_values[present])
+        return options
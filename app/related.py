@@ -0,0 +1,92 @@
+"""Precomputed "related tutorials" from a sparse tutorial-by-tag matrix."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+from scipy import sparse
+
+from app.facets import FacetTable
+
+RELATED_COLUMNS = ("stack", "technology", "robot", "distro", "application")
+DEFAULT_NEIGHBOURS = 5
+# Dense similarity cells materialized per chunk of rows, bounding memory to ~64 MB.
+_CHUNK_CELLS = 1 << 24
+
+
+@dataclass(frozen=True)
+class RelatedIndex:
+    """Top-``k`` most similar rows of every row, by IDF-weighted cosine over shared tags.
+
+    ``neighbours`` and ``scores`` are ``(rows, k)`` arrays, best first and
+    padded with ``-1`` / ``0`` where fewer than ``k`` rows share a tag.
+    """
+
+    table: FacetTable
+    labels: np.ndarray
+    neighbours: np.ndarray
+    scores: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        table: FacetTable,
+        rows: np.ndarray | None = None,
+        columns: Iterable[str] = RELATED_COLUMNS,
+        k: int = DEFAULT_NEIGHBOURS,
+    ) -> "RelatedIndex":
+        """Score every pair of ``rows`` (all rows when ``None``) in chunks and keep the top ``k``."""
+        labels = np.concatenate(
+            [table.column_labels[column] for column in columns if column in table.column_labels]
+            or [np.empty(0, dtype=np.int64)]
+        )
+        rows = np.arange(table.size) if rows is None else np.asarray(rows, dtype=np.int64)
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(table.codes), dtype=np.float32), table.codes, table.offsets),
+            shape=(table.size, len(table.label_values)),
+        )[rows][:, labels]
+        matrix.data[:] = 1.0  # repeated tags count once
+
+        # Rare tags say more about a tutorial than ones nearly everything has.
+        frequency = np.bincount(matrix.indices, minlength=matrix.shape[1])
+        idf = np.log((1 + len(rows)) / (1 + frequency)).astype(np.float32) + 1.0
+        weighted = matrix @ sparse.diags(idf)
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        weighted = sparse.csr_matrix(sparse.diags(1.0 / norms) @ weighted, dtype=np.float32)
+        # Tags are few, so the transposed side is small enough to keep dense.
+        transposed = np.ascontiguousarray(weighted.T.toarray())
+
+        neighbours = np.full((table.size, k), -1, dtype=np.int64)
+        scores = np.zeros((table.size, k), dtype=np.float32)
+        width = min(k, len(rows) - 1)
+        chunk = max(1, _CHUNK_CELLS // max(1, len(rows)))
+        for start in range(0, len(rows) if width > 0 else 0, chunk):
+            stop = min(start + chunk, len(rows))
+            similarity = np.asarray(weighted[start:stop] @ transposed)
+            similarity[np.arange(stop - start), np.arange(start, stop)] = -1.0  # never recommend itself
+            top = np.argpartition(similarity, -width, axis=1)[:, -width:]
+            top_scores = np.take_along_axis(similarity, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            found = top_scores > 0
+            neighbours[rows[start:stop], :width] = np.where(found, rows[top], -1)
+            scores[rows[start:stop], :width] = np.where(found, top_scores, 0.0)
+        return cls(table=table, labels=labels, neighbours=neighbours, scores=scores)
+
+    def related(self, row: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the related rows of ``row`` and their similarity, best first."""
+        found = self.neighbours[row] >= 0
+        return self.neighbours[row][found], self.scores[row][found]
+
+    def shared_tags(self, row: int, other: int) -> list[str]:
+        """Return the ``column: value`` tags that ``row`` and ``other`` have in common."""
+        codes = np.intersect1d(self._codes(row), self._codes(other))
+        return [f"{self.table.label_columns[code]}: {self.table.label_values[code]}" for code in codes]
+
+    def _codes(self, row: int) -> np.ndarray:
+        codes = self.table.codes[self.table.offsets[row] : self.table.offsets[row + 1]]
+        return codes[np.isin(codes, self.labels)]
@@ -0,0 +1,141 @@
+"""Lightweight per-rerun spans with JSON Lines and Chrome trace export."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Append every traced rerun to this JSON Lines file, e.g. in production.
+TRACE_FILE_ENV = "CATALOG_TRACE_FILE"
+
+_current: ContextVar["Tracer | None"] = ContextVar("catalog_tracer", default=None)
+_file_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    """One timed section of a rerun; ``attributes`` carries row counts and payload sizes."""
+
+    name: str
+    start_us: float
+    duration_us: float
+    depth: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Collect the spans of a single Streamlit rerun."""
+
+    def __init__(self, run_id: str = "") -> None:
+        self.run_id = run_id
+        self.wall_time = time.time()
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block; callers may add attributes to the yielded dict."""
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield attributes
+        finally:
+            self._depth -= 1
+            end = time.perf_counter()
+            self.spans.append(
+                Span(
+                    name=name,
+                    start_us=(start - self._origin) * 1e6,
+                    duration_us=(end - start) * 1e6,
+                    depth=self._depth,
+                    attributes=attributes,
+                )
+            )
+
+    def to_frame(self) -> "pd.DataFrame":
+        """Return the spans in start order for display."""
+        import pandas as pd
+
+        rows = [
+            {"span": "  " * item.depth + item.name, "ms": round(item.duration_us / 1000, 2), **item.attributes}
+            for item in sorted(self.spans, key=lambda item: item.start_us)
+        ]
+        return pd.DataFrame(rows)
+
+    def records(self) -> list[dict[str, Any]]:
+        return [{"run_id": self.run_id, "wall_time": self.wall_time, **asdict(item)} for item in self.spans]
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+    """Record a span on the active tracer; a cheap no-op when tracing is off."""
+    tracer = _current.get()
+    if tracer is None:
+        yield attributes
+        return
+    with tracer.span(name, **attributes) as recorded:
+        yield recorded
+
+
+def start_trace(run_id: str = "") -> Tracer:
+    """Activate a new tracer for the current thread's rerun."""
+    tracer = Tracer(run_id)
+    _current.set(tracer)
+    return tracer
+
+
+def finish_trace() -> Tracer | None:
+    """Deactivate the current tracer, appending it to ``$CATALOG_TRACE_FILE`` if set."""
+    tracer = _current.get()
+    _current.set(None)
+    path = os.environ.get(TRACE_FILE_ENV)
+    if tracer is not None and path:
+        with _file_lock, open(path, "a", encoding="utf-8") as handle:
+            handle.write(to_jsonl([tracer]))
+    return tracer
+
+
+def enabled() -> bool:
+    """Whether a tracer is active, so callers can skip costly measurements otherwise."""
+    return _current.get() is not None
+
+
+def payload_bytes(frame: "pd.DataFrame") -> int:
+    """Size of ``frame`` once serialized to Arrow, as sent to the browser."""
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(frame, preserve_index=False).nbytes
+
+
+def to_jsonl(tracers: Iterable[Tracer]) -> str:
+    """One JSON object per span."""
+    return "".join(json.dumps(record, default=str) + "\n" for tracer in tracers for record in tracer.records())
+
+
+def to_chrome_trace(tracers: Iterable[Tracer]) -> str:
+    """Chrome ``chrome://tracing`` / Perfetto JSON, one track per rerun."""
+    events = []
+    for track, tracer in enumerate(tracers):
+        offset = tracer.wall_time * 1e6
+        for item in tracer.spans:
+            events.append(
+                {
+                    "name": item.name,
+                    "ph": "X",
+                    "ts": offset + item.start_us,
+                    "dur": item.duration_us,
+                    "pid": 1,
+                    "tid": track,
+                    "args": {"run_id": tracer.run_id, **item.attributes},
+                }
+            )
+    return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, default=str)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import uuid
+from collections import deque
+from typing import Any, Callable, TypeVar
+
+import streamlit as st
+
+from app import tracing
+from app.tracing import Tracer, to_chrome_trace, to_jsonl
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEBUG_ENV = "CATALOG_DEBUG"
+HISTORY_KEY = "_trace_history"
+HISTORY_LENGTH = 50
+
+
+def debug_panel_enabled() -> bool:
+    """Show the panel with ``?debug=1`` in the URL or ``CATALOG_DEBUG=1`` in the environment."""
+    return st.query_params.get("debug") == "1" or os.environ.get(DEBUG_ENV) == "1"
+
+
+def render_debug_panel(tracer: Tracer, title: str = "Performance") -> None:
+    """Render this rerun's spans in the sidebar with exports of the session's recent reruns."""
+    history: deque[Tracer] = st.session_state.setdefault(HISTORY_KEY, deque(maxlen=HISTORY_LENGTH))
+    history.append(tracer)
+
+    with st.sidebar.expander(title, expanded=True):
+        total_ms = sum(item.duration_us for item in tracer.spans if item.depth == 0) / 1000
+        st.caption(f"Rerun {tracer.run_id}: {total_ms:.1f} ms traced across {len(tracer.spans)} spans.")
+        st.dataframe(tracer.to_frame(), hide_index=True, width="stretch")
+        _render_cache_stats()
+        st.download_button(
+            "Export JSON Lines",
+            data=to_jsonl(history),
+            file_name="catalog-trace.jsonl",
+            mime="application/x-ndjson",
+        )
+        st.download_button(
+            "Export Chrome trace",
+            data=to_chrome_trace(history),
+            file_name="catalog-trace.json",
+            mime="application/json",
+        )
+
+
+def _render_cache_stats() -> None:
+    """Show the process-wide result cache counters, for tuning its size."""
+    if "app.dataset" not in sys.modules:  # no dataset loaded yet, so nothing was cached
+        return
+    from app.dataset import get_result_cache
+
+    cache = get_result_cache()
+    stats = cache.stats()
+    st.caption(
+        f"Result cache: {stats.hits} hits, {stats.misses} misses ({stats.hit_rate:.0%} hit rate), "
+        f"{stats.entries}/{cache.max_entries} entries, {stats.nbytes / 2**20:.1f}/{cache.max_bytes / 2**20:.0f} MB, "
+        f"{stats.evictions} evictions since the process started."
+    )
+
+
+def traced_fragment(name: str) -> Callable[[F], F]:
+    """Turn a view into an ``st.fragment`` whose partial reruns are traced too.
+
+    Inside a full rerun the fragment is a ``fragment:<name>`` span of the app's
+    trace. A rerun of the fragment alone gets a trace of its own, shown in a
+    separate debug panel because the full rerun's panel is not redrawn.
+    """
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def run(*args: Any, **kwargs: Any) -> Any:
+            if tracing.enabled():
+                with tracing.span(f"fragment:{name}"):
+                    return func(*args, **kwargs)
+            debug = debug_panel_enabled()
+            if not (debug or os.environ.get(tracing.TRACE_FILE_ENV)):
+                return func(*args, **kwargs)
+            tracing.start_trace(run_id=f"{uuid.uuid4().hex[:8]}:{name}")
+            try:
+                with tracing.span(f"fragment:{name}"):
+                    return func(*args, **kwargs)
+            finally:
+                tracer = tracing.finish_trace()
+                if debug and tracer is not None:
+                    render_debug_panel(tracer, title=f"Performance ({name} rerun)")
+
+        return st.fragment(run)
+
+    return decorate
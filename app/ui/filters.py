@@ -0,0 +1,100 @@
+"""Search box and sidebar filters shared by the catalog and chart views."""
+from __future__ import annotations
+
+import numpy as np
+import streamlit as st
+
+from app import tracing
+from app.dataset import Dataset, get_result_cache
+from app.query import NAME_PARAM, ORGANIZATION_PARAM, SEARCH_PARAM, CatalogQuery
+
+# Sidebar multiselects, in display order: (column, label).
+FILTER_WIDGETS = (
+    ("distro", "ROS distro"),
+    ("technology", "Technology"),
+    ("application", "Application"),
+    ("stack", "Stack"),
+    ("robot", "Robot"),
+    ("hardware", "Hardware"),
+    ("deploy_docker", "Deploy (Docker)"),
+    ("deploy_gui", "Deploy (GUI)"),
+    ("governance", "Governance"),
+    ("date", "Date"),
+    ("language", "Language"),
+    ("link_status", "Link status"),
+)
+
+SEARCH_KEY = "filter_search"
+# Tag selections read from the URL, applied once their widget's options are known.
+_URL_SELECTIONS_KEY = "_url_selections"
+
+
+def _restore_from_url() -> None:
+    """Seed the widgets from the URL on a session's first run, so shared links reproduce the view."""
+    if _URL_SELECTIONS_KEY in st.session_state:
+        return
+    params = {key: st.query_params.get_all(key) for key in st.query_params}
+    query = CatalogQuery.from_query_params(params, [column for column, _ in FILTER_WIDGETS])
+    st.session_state[SEARCH_KEY] = query.search
+    st.session_state["filter_name"] = query.name_contains
+    st.session_state["filter_organization"] = query.organization_contains
+    st.session_state[_URL_SELECTIONS_KEY] = dict(query.selections)
+
+
+def _sync_url(query: CatalogQuery) -> None:
+    """Mirror ``query`` into the URL in canonical order, after any unrelated parameters."""
+    managed = {SEARCH_PARAM, NAME_PARAM, ORGANIZATION_PARAM, *(column for column, _ in FILTER_WIDGETS)}
+    params = {key: st.query_params.get_all(key) for key in st.query_params}
+    others = {key: values for key, values in params.items() if key not in managed}
+    wanted = {**others, **query.to_query_params()}
+    if list(params.items()) != list(wanted.items()):
+        st.query_params.from_dict(wanted)
+
+
+def _search_state(dataset: Dataset, search: str) -> tuple[np.ndarray | None, dict[str, list[str]]]:
+    """Rows matching the search box and the filter options left, cached across sessions."""
+    planner = dataset.planner
+
+    def compute() -> tuple[np.ndarray | None, dict[str, list[str]]]:
+        rows = planner.search_rows(search)
+        if rows is not None:
+            rows.setflags(write=False)
+        with tracing.span("options"):
+            return rows, planner.options(rows)
+
+    def nbytes(state: tuple[np.ndarray | None, dict[str, list[str]]]) -> int:
+        rows, options = state
+        # Option lists are small; count their characters as a rough size.
+        return (rows.nbytes if rows is not None else 0) + sum(len(value) for values in options.values() for value in values)
+
+    if not search:
+        return None, planner.options(None)
+    return get_result_cache().get(("search", dataset.version, search), compute, nbytes)
+
+
+def render_filters(dataset: Dataset) -> tuple[CatalogQuery, np.ndarray | None]:
+    """Render the search box and sidebar filters; return the query and the searched rows.
+
+    Widgets carry fixed keys so their state survives switching between views,
+    and the filter state is kept in the URL so a link reopens the same view.
+    """
+    _restore_from_url()
+    search = dataset.planner.search.render(key=SEARCH_KEY)
+    search_rows, options = _search_state(dataset, search.strip())
+
+    st.sidebar.header("Filters")
+    name_filter = st.sidebar.text_input("Name contains", key="filter_name")
+    org_filter = st.sidebar.text_input("Organization contains", key="filter_organization")
+    from_url = st.session_state[_URL_SELECTIONS_KEY]
+    selections = {}
+    for column, label in FILTER_WIDGETS:
+        if column not in dataset.dataframe.columns:
+            continue
+        column_options = options.get(column, [])
+        if column in from_url:
+            st.session_state[f"filter_{column}"] = [value for value in from_url.pop(column) if value in column_options]
+        selections[column] = st.sidebar.multiselect(label, options=column_options, key=f"filter_{column}")
+
+    query = CatalogQuery.build(search, name_filter, org_filter, selections)
+    _sync_url(query)
+    return query, search_rows
@@ -1,35 +1,158 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
 
+import numpy as np
 import pandas as pd
 
+# Words are runs of letters/digits; trailing "+" or "#" keep names like "c++" intact.
+TOKEN_PATTERN = re.compile(r"[^\W_]+[+#]*")
+
+SEARCH_FIELD_WEIGHTS = {"name": 3.0, "organization": 2.0}
+# Bookkeeping and derived facet columns; their values are filters, not text.
+SEARCH_EXCLUDED_COLUMNS = frozenset({"row_index", "legacy", "link_status", "duplicate_of"})
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower-cased search tokens; regex metacharacters are ignored."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _cell_text(entry: object) -> str:
+    if isinstance(entry, list):
+        return " ".join(str(item) for item in entry)
+    if entry is None or entry is pd.NA or (isinstance(entry, float) and math.isnan(entry)):
+        return ""
+    return str(entry)
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """Inverted index with BM25 scores and prefix lookup over a sorted vocabulary."""
+
+    size: int
+    terms: list[str]
+    postings: list[tuple[np.ndarray, np.ndarray]] = field(repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        dataframe: pd.DataFrame,
+        field_weights: Mapping[str, float] = SEARCH_FIELD_WEIGHTS,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> "SearchIndex":
+        """Tokenize every text column once and precompute per-term BM25 scores."""
+        size = len(dataframe)
+        frequencies: defaultdict[str, Counter[int]] = defaultdict(Counter)
+        lengths = np.zeros(size, dtype=np.float64)
+
+        for column in dataframe.columns:
+            if column in SEARCH_EXCLUDED_COLUMNS:
+                continue
+            weight = field_weights.get(column, 1.0)
+            for position, entry in enumerate(dataframe[column].tolist()):
+                tokens = tokenize(_cell_text(entry))
+                lengths[position] += weight * len(tokens)
+                for token in tokens:
+                    frequencies[token][position] += weight
+
+        average_length = float(lengths.mean()) if size and lengths.any() else 1.0
+        norms = k1 * (1.0 - b + b * lengths / average_length)
+
+        terms = sorted(frequencies)
+        postings: list[tuple[np.ndarray, np.ndarray]] = []
+        for term in terms:
+            counts = frequencies[term]
+            rows = np.fromiter(sorted(counts), dtype=np.int64, count=len(counts))
+            tf = np.fromiter((counts[row] for row in rows), dtype=np.float64, count=len(rows))
+            idf = math.log(1.0 + (size - len(rows) + 0.5) / (len(rows) + 0.5))
+            postings.append((rows, idf * tf * (k1 + 1.0) / (tf + norms[rows])))
+
+        return cls(size=size, terms=terms, postings=postings)
+
+    def search(self, query: str) -> np.ndarray | None:
+        """Return matching row positions, best first; ``None`` if the query has no tokens.
+
+        Every query token must match, either exactly or as the prefix of an
+        indexed term.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+
+        rows: np.ndarray | None = None
+        scores: np.ndarray | None = None
+        for token in dict.fromkeys(tokens):
+            token_rows, token_scores = self._prefix_matches(token)
+            if rows is None:
+                rows, scores = token_rows, token_scores
+            else:
+                rows, left, right = np.intersect1d(rows, token_rows, assume_unique=True, return_indices=True)
+                scores = scores[left] + token_scores[right]
+            if rows.size == 0:
+                return rows
+
+        return rows[np.argsort(-scores, kind="stable")]
+
+    def _prefix_matches(self, token: str) -> tuple[np.ndarray, np.ndarray]:
+        """Union the postings of every term starting with ``token``, keeping the best score per row."""
+        start = bisect.bisect_left(self.terms, token)
+        stop = bisect.bisect_left(self.terms, token + "\U0010ffff", lo=start)
+        if start == stop:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        if stop - start == 1:
+            return self.postings[start]
+
+        rows = np.concatenate([self.postings[index][0] for index in range(start, stop)])
+        scores = np.concatenate([self.postings[index][1] for index in range(start, stop)])
+        unique_rows, inverse = np.unique(rows, return_inverse=True)
+        best = np.zeros(len(unique_rows), dtype=np.float64)
+        np.maximum.at(best, inverse, scores)
+        return unique_rows, best
+
 
 @dataclass(frozen=True)
 class GlobalSearch:
     """Perform a case-insensitive search across all string columns."""
 
     placeholder: str = "Search tutorials…"
+    index: Optional[SearchIndex] = None
 
-    def render(self) -> str:
+    def render(self, key: str | None = None) -> str:
         """Render the Streamlit text input and return the query."""
         import streamlit as st
 
-        return st.text_input("Search", placeholder=self.placeholder)
+        return st.text_input("Search", placeholder=self.placeholder, key=key)
 
     def apply(self, dataframe: pd.DataFrame, query: Optional[str]) -> pd.DataFrame:
-        """Filter the dataframe to rows containing the query in any column."""
+        """Filter the dataframe to rows matching the query, best matches first when indexed."""
         if not query:
             return dataframe
 
+        if self.index is not None and self.index.size == len(dataframe):
+            rows = self.index.search(query)
+            if rows is not None:
+                return dataframe.iloc[rows]
+
+        return self._scan(dataframe, query)
+
+    def _scan(self, dataframe: pd.DataFrame, query: str) -> pd.DataFrame:
+        """Literal substring match over every text column."""
         lowered = query.lower()
         mask = pd.Series(False, index=dataframe.index)
 
-        for column in dataframe.columns:
+        for column in dataframe.columns.difference(sorted(SEARCH_EXCLUDED_COLUMNS), sort=False):
             values = dataframe[column]
             if values.dtype == object or pd.api.types.is_string_dtype(values):
-                matches = values.astype(str).str.contains(lowered, case=False, na=False)
+                if values.map(lambda entry: isinstance(entry, list)).any():
+                    values = values.map(lambda entry: ", ".join(entry) if isinstance(entry, list) else entry)
+                matches = values.astype(str).str.contains(lowered, case=False, na=False, regex=False)
                 mask = mask | matches
 
         return dataframe[mask]
@@ -0,0 +1 @@
+"""Benchmarks for the tutorial catalog pipeline."""
@@ -0,0 +1,176 @@
+"""Measure cold import time of the app entry point and each page.
+
+Every sample imports the module in a fresh interpreter with ``-X importtime``.
+The check fails when startup or a page eagerly imports a module that should load lazily,
+when a target exceeds its ``--budget``, or when it regressed against a
+previous ``--output``.
+
+Example::
+
+    python -m benchmarks.import_time --output imports.json
+    python -m benchmarks.import_time --budget startup=600 --compare imports.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Name -> module imported by a cold start of that part of the app.
+TARGETS = {
+    "startup": "streamlit_app",
+    "catalog": "app.pages.catalog",
+    "charts": "app.pages.charts",
+}
+
+# Modules the entry point must leave to the first page render.
+DEFERRED_AT_STARTUP = (
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "scipy",
+    "yaml",
+    "tutorial_parser",
+    "app.dataset",
+    "app.pages.catalog",
+    "app.pages.charts",
+)
+
+# Target -> modules that page must leave until a view first needs them.
+DEFERRED_BY_PAGE = {
+    "catalog": ("scipy", "app.related", "app.bundle"),
+    "charts": ("scipy", "app.related", "app.bundle"),
+}
+
+
+@dataclass(frozen=True)
+class ImportMeasurement:
+    """Cumulative import time of one target and its heaviest direct imports."""
+
+    target: str
+    module: str
+    ms_median: float
+    ms_min: float
+    heaviest: list[tuple[str, float]]
+
+
+def _import_profile(module: str) -> dict[str, tuple[int, float]]:
+    """Return ``{module: (depth, cumulative ms)}`` for one cold import of ``module``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile: dict[str, tuple[int, float]] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        profile[stripped.strip()] = (depth, int(cumulative) / 1000)
+    return profile
+
+
+def measure(target: str, module: str, repeat: int, top: int = 5) -> ImportMeasurement:
+    """Import ``module`` ``repeat`` times after one warm-up that fills ``__pycache__``."""
+    _import_profile(module)
+    profiles = [_import_profile(module) for _ in range(repeat)]
+    totals = [profile[module][1] for profile in profiles]
+    last = profiles[-1]
+    children = sorted(
+        ((name, ms) for name, (depth, ms) in last.items() if depth == 1),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return ImportMeasurement(
+        target=target,
+        module=module,
+        ms_median=statistics.median(totals),
+        ms_min=min(totals),
+        heaviest=children[:top],
+    )
+
+
+def eager_imports(module: str = TARGETS["startup"], deferred: tuple[str, ...] = DEFERRED_AT_STARTUP) -> list[str]:
+    """Return the ``deferred`` modules that importing ``module`` loads anyway."""
+    loaded = _import_profile(module)
+    return [name for name in deferred if name in loaded]
+
+
+def check(
+    measurements: list[ImportMeasurement],
+    budgets: dict[str, float],
+    baseline: list[dict[str, Any]] | None,
+    threshold: float,
+) -> list[str]:
+    """Return a line per target over its budget or slower than ``baseline`` by more than ``threshold``."""
+    previous = {entry["target"]: entry for entry in baseline or []}
+    failures = []
+    for item in measurements:
+        budget = budgets.get(item.target)
+        if budget is not None and item.ms_median > budget:
+            failures.append(f"{item.target}: {item.ms_median:.0f} ms exceeds the {budget:.0f} ms budget")
+        entry = previous.get(item.target)
+        if entry and entry["ms_median"] and item.ms_median / entry["ms_median"] > 1.0 + threshold:
+            failures.append(
+                f"{item.target}: {entry['ms_median']:.0f} ms -> {item.ms_median:.0f} ms "
+                f"({item.ms_median / entry['ms_median']:.2f}x)"
+            )
+    return failures
+
+
+def _parse_budget(text: str) -> tuple[str, float]:
+    target, _, milliseconds = text.partition("=")
+    if target not in TARGETS or not milliseconds:
+        raise argparse.ArgumentTypeError(f"expected TARGET=MS with TARGET in {', '.join(TARGETS)}")
+    return target, float(milliseconds)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check the import-time budget of the Streamlit app.")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=_parse_budget, action="append", default=[], help="TARGET=MS, repeatable")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    failures = [f"startup imports {name} eagerly" for name in eager_imports()]
+    for target, deferred in DEFERRED_BY_PAGE.items():
+        failures.extend(f"{target} imports {name} eagerly" for name in eager_imports(TARGETS[target], deferred))
+    measurements = [measure(target, TARGETS[target], args.repeat) for target in args.targets]
+
+    print(f"{'target':<10}{'module':<22}{'median ms':>11}{'min ms':>9}  heaviest imports")
+    for item in measurements:
+        heaviest = ", ".join(f"{name} {ms:.0f}" for name, ms in item.heaviest)
+        print(f"{item.target:<10}{item.module:<22}{item.ms_median:>11.1f}{item.ms_min:>9.1f}  {heaviest}")
+
+    if args.output:
+        payload = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": [asdict(item) for item in measurements],
+        }
+        args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"] if args.compare else None
+    failures.extend(check(measurements, dict(args.budget), baseline, args.threshold))
+    for line in failures:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Time the link checker against local stand-in HTTP servers.
+
+Each server plays one host and answers ``/ok/<n>`` with 200, ``/missing/<n>``
+with 404, ``/moved/<n>`` with a redirect, ``/chain/<n>`` with a redirect to
+``/moved/<n>``, ``/get-only/<n>`` with 405 to HEAD, and ``/slow/<n>`` after the
+checker's timeout. No request leaves the machine.
+
+Example::
+
+    python -m benchmarks.link_check --links 5000 --hosts 4
+    python -m benchmarks.link_check --links 5000 --hosts 4 --rate-per-host 0
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from aiohttp import web
+
+from app.links import LinkCache, LinkChecker, check_links
+
+# Path kind -> expected link state.
+EXPECTED = {"ok": "ok", "missing": "broken", "moved": "ok", "chain": "ok", "get-only": "ok", "slow": "unreachable"}
+_KIND_CYCLE = ["ok"] * 16 + ["missing", "moved", "get-only"]
+
+
+def _application(slow_seconds: float) -> web.Application:
+    async def respond(request: web.Request) -> web.StreamResponse:
+        kind = request.match_info["kind"]
+        if kind == "missing":
+            raise web.HTTPNotFound()
+        if kind == "moved":
+            raise web.HTTPFound(f"/ok/{request.match_info['number']}")
+        if kind == "chain":
+            raise web.HTTPFound(f"/moved/{request.match_info['number']}")
+        if kind == "get-only" and request.method == "HEAD":
+            raise web.HTTPMethodNotAllowed("HEAD", ["GET"])
+        if kind == "slow":
+            await asyncio.sleep(slow_seconds)
+        return web.Response(text="ok")
+
+    application = web.Application()
+    application.router.add_route("*", "/{kind}/{number}", respond)
+    return application
+
+
+async def _serve(hosts: int, slow_seconds: float) -> tuple[list[web.AppRunner], list[str]]:
+    runners, bases = [], []
+    for _ in range(hosts):
+        runner = web.AppRunner(_application(slow_seconds), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        runners.append(runner)
+        bases.append(f"http://127.0.0.1:{port}")
+    return runners, bases
+
+
+async def run(links: int, hosts: int, slow: int, checker: LinkChecker, cache_path: Path) -> int:
+    runners, bases = await _serve(hosts, slow_seconds=checker.timeout * 2)
+    try:
+        urls, expected = [], {}
+        for number in range(links):
+            kind = "slow" if number < slow else _KIND_CYCLE[number % len(_KIND_CYCLE)]
+            url = f"{bases[number % hosts]}/{kind}/{number}"
+            urls.append(url)
+            expected[url] = EXPECTED[kind]
+
+        cache = LinkCache(cache_path)
+        start = time.perf_counter()
+        statuses = await asyncio.to_thread(check_links, urls, cache, checker)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        repeated = await asyncio.to_thread(check_links, urls, LinkCache(cache_path), checker)
+        second = time.perf_counter() - start
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+    wrong = [status for status in statuses if status.state != expected[status.url]]
+    states = Counter(status.state for status in statuses)
+    rate = f"{checker.rate_per_host:g} requests/s" if checker.rate_per_host else "unlimited requests"
+    print(f"settings: {checker.limit_per_host} connections and {rate} per host, {checker.timeout:g}s timeout")
+    print(f"checked {len(statuses)} links on {hosts} hosts in {first:.2f}s ({len(statuses) / first:.0f} links/s)")
+    print("states: " + ", ".join(f"{count} {state}" for state, count in sorted(states.items())))
+    print(f"cached re-run re-checked {len(repeated)} links in {second:.3f}s")
+    for status in wrong[:10]:
+        print(f"UNEXPECTED {status.state} ({status.status_code or status.detail}) for {status.url}", file=sys.stderr)
+    return 1 if wrong or repeated else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the link checker on local stand-in servers.")
+    parser.add_argument("--links", type=int, default=5000)
+    parser.add_argument("--hosts", type=int, default=4)
+    parser.add_argument("--slow", type=int, default=20, help="links that only answer after the timeout")
+    parser.add_argument("--limit-per-host", type=int, default=32)
+    parser.add_argument(
+        "--rate-per-host", type=float, default=10.0, help="requests per second per host, as in the app (0 = unlimited)"
+    )
+    parser.add_argument("--timeout", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    checker = LinkChecker(
+        limit=args.limit_per_host * args.hosts,
+        limit_per_host=args.limit_per_host,
+        rate_per_host=args.rate_per_host,
+        timeout=args.timeout,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        return asyncio.run(run(args.links, args.hosts, args.slow, checker, Path(directory) / "links.json"))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
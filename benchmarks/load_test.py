@@ -0,0 +1,235 @@
+"""Measure app throughput and memory as Streamlit replicas are added.
+
+Every virtual user opens a real Streamlit session over the app's websocket
+and reruns the script back to back, as a user clicking through the catalog
+would. ``--spawn`` starts local replicas that map one prebuilt bundle and
+spreads users over them round-robin, like the compose load balancer.
+``--url`` drives an already running deployment instead.
+
+Example::
+
+    python -m app.bundle --output .cache/bundle
+    python -m benchmarks.load_test --spawn 1 2 4 --bundle .cache/bundle --users 16
+    docker compose -f docker/docker-compose.yml --profile replicas up -d
+    python -m benchmarks.load_test --url http://localhost:8080 --users 16
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator
+
+import aiohttp
+
+from app.bundle import DEFAULT_BUNDLE_DIR, is_bundle
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASE_PORT = 8600
+# ScriptFinishedStatus values of a completed run.
+_FINISHED = frozenset({0, 3})
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    """Throughput and latency of one load level, plus the memory of each spawned replica."""
+
+    replicas: int
+    users: int
+    reruns: int
+    errors: int
+    seconds: float
+    reruns_per_second: float
+    p50_ms: float
+    p95_ms: float
+    rss_mb: float | None
+    pss_mb: float | None
+
+
+async def _user(
+    session: aiohttp.ClientSession, url: str, start: float, stop: float, latencies: list[float], errors: list[str]
+) -> None:
+    """Run one session's script repeatedly until ``stop``; only reruns finishing after ``start`` count."""
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    rerun = BackMsg()
+    rerun.rerun_script.query_string = ""
+    payload = rerun.SerializeToString()
+    loop = asyncio.get_running_loop()
+    stream = url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+    try:
+        async with session.ws_connect(stream, protocols=("streamlit",), max_msg_size=0) as websocket:
+            while loop.time() < stop:
+                began = loop.time()
+                await websocket.send_bytes(payload)
+                while True:
+                    message = await websocket.receive()
+                    if message.type != aiohttp.WSMsgType.BINARY:
+                        raise ConnectionError(f"websocket closed: {message.type.name}")
+                    forward = ForwardMsg()
+                    forward.ParseFromString(message.data)
+                    if forward.WhichOneof("type") == "script_finished":
+                        break
+                finished = loop.time()
+                if forward.script_finished not in _FINISHED:
+                    errors.append(f"script finished with status {forward.script_finished}")
+                elif start <= finished <= stop:
+                    latencies.append(finished - began)
+    except (aiohttp.ClientError, ConnectionError, asyncio.TimeoutError) as error:
+        errors.append(f"{type(error).__name__}: {error}")
+
+
+async def drive(urls: list[str], users: int, duration: float, warmup: float) -> tuple[list[float], list[str]]:
+    """Spread ``users`` over ``urls`` and return rerun latencies measured after ``warmup`` seconds."""
+    latencies: list[float] = []
+    errors: list[str] = []
+    loop = asyncio.get_running_loop()
+    start = loop.time() + warmup
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(
+            *(
+                _user(session, urls[user % len(urls)], start, start + duration, latencies, errors)
+                for user in range(users)
+            )
+        )
+    return latencies, errors
+
+
+def _memory_mb(pid: int) -> tuple[float, float] | None:
+    """Return the resident and proportional set size of ``pid``; ``None`` off Linux."""
+    try:
+        fields = dict(line.split(":", 1) for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:])
+    except OSError:
+        return None
+    return int(fields["Rss"].split()[0]) / 1024, int(fields["Pss"].split()[0]) / 1024
+
+
+def _wait_healthy(url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    import urllib.request
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"replica at {url} exited with status {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.25)
+    raise TimeoutError(f"replica at {url} did not become healthy within {timeout:.0f}s")
+
+
+@contextmanager
+def spawn_replicas(count: int, bundle: Path, base_port: int = BASE_PORT) -> Iterator[list[tuple[str, int]]]:
+    """Start ``count`` local Streamlit replicas serving ``bundle``; yield their ``(url, pid)``."""
+    environment = {**os.environ, "TUTORIAL_LIST_PATH": str(bundle.resolve())}
+    processes = []
+    try:
+        for replica in range(count):
+            port = base_port + replica
+            command = [
+                sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
+                "--server.headless=true", f"--server.port={port}",
+                "--server.fileWatcherType=none", "--browser.gatherUsageStats=false",
+            ]  # fmt: skip
+            process = subprocess.Popen(
+                command, cwd=REPO_ROOT, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            processes.append((f"http://localhost:{port}", process))
+        for url, process in processes:
+            _wait_healthy(url, process)
+        yield [(url, process.pid) for url, process in processes]
+    finally:
+        for _, process in processes:
+            process.terminate()
+        for _, process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def measure(
+    urls: list[str], users: int, duration: float, warmup: float, pids: list[int] | None = None
+) -> LoadResult:
+    """Drive ``urls`` for ``warmup + duration`` seconds and summarize the measured window."""
+    latencies, errors = asyncio.run(drive(urls, users, duration, warmup))
+    memory = [sample for sample in (_memory_mb(pid) for pid in pids or []) if sample is not None]
+    ordered = sorted(latencies)
+    return LoadResult(
+        replicas=len(urls),
+        users=users,
+        reruns=len(latencies),
+        errors=len(errors),
+        seconds=duration,
+        reruns_per_second=len(latencies) / duration,
+        p50_ms=statistics.median(ordered) * 1000 if ordered else float("nan"),
+        p95_ms=ordered[int(0.95 * (len(ordered) - 1))] * 1000 if ordered else float("nan"),
+        rss_mb=statistics.mean(rss for rss, _ in memory) if memory else None,
+        pss_mb=statistics.mean(pss for _, pss in memory) if memory else None,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the Streamlit app across replicas.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--spawn", type=int, nargs="+", metavar="N", help="replica counts to start locally, in turn")
+    target.add_argument("--url", nargs="+", help="base URLs of running replicas or of a load balancer")
+    parser.add_argument("--bundle", type=Path, default=DEFAULT_BUNDLE_DIR, help="bundle the spawned replicas map")
+    parser.add_argument("--users", type=int, default=16, help="concurrent sessions")
+    parser.add_argument("--duration", type=float, default=20.0, help="measured seconds per load level")
+    parser.add_argument("--warmup", type=float, default=5.0, help="seconds run before measuring")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    results: list[LoadResult] = []
+    if args.url:
+        results.append(measure(args.url, args.users, args.duration, args.warmup))
+    else:
+        if not is_bundle(args.bundle):
+            parser.error(f"{args.bundle} is not a bundle; build one with python -m app.bundle --output {args.bundle}")
+        cpus = os.cpu_count() or 1
+        for count in args.spawn or [1, 2]:
+            if count > cpus:
+                print(f"note: {count} replicas share {cpus} CPUs; throughput cannot scale past the CPU count")
+            with spawn_replicas(count, args.bundle) as replicas:
+                urls, pids = [url for url, _ in replicas], [pid for _, pid in replicas]
+                results.append(measure(urls, args.users, args.duration, args.warmup, pids))
+
+    baseline = results[0].reruns_per_second / results[0].replicas if results[0].reruns_per_second else 0.0
+    print(f"{'replicas':>8}{'users':>7}{'reruns/s':>10}{'scaling':>9}{'p50 ms':>9}{'p95 ms':>9}{'errors':>8}"
+          f"{'RSS MB':>9}{'PSS MB':>9}")  # fmt: skip
+    for item in results:
+        scaling = item.reruns_per_second / (baseline * item.replicas) if baseline else float("nan")
+        rss = f"{item.rss_mb:>9.0f}" if item.rss_mb is not None else f"{'-':>9}"
+        pss = f"{item.pss_mb:>9.0f}" if item.pss_mb is not None else f"{'-':>9}"
+        print(
+            f"{item.replicas:>8}{item.users:>7}{item.reruns_per_second:>10.1f}{scaling:>9.2f}"
+            f"{item.p50_ms:>9.0f}{item.p95_ms:>9.0f}{item.errors:>8}{rss}{pss}"
+        )
+
+    if args.output:
+        payload = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "results": [asdict(item) for item in results],
+        }
+        args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return 1 if any(item.errors for item in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Time the catalog pipeline outside Streamlit on synthetic catalogs.
+
+Example::
+
+    python -m benchmarks.run --sizes 1000 10000 --output bench.json
+    python -m benchmarks.run --sizes 1000 10000 --compare bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from app.charts.factory import ChartFactory
+from app.data import TagIndex, prepare_dataframe
+from app.dedupe import find_duplicates
+from app.facets import FacetCounter, FacetCube, FacetTable
+from app.query import CatalogQuery, FilterPlanner, ResultCache
+from app.related import RelatedIndex
+from app.ui.search import GlobalSearch, SearchIndex
+from benchmarks.synthetic import write_catalog
+from tutorial_parser import TutorialListParser, validate_tutorials
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".data"
+
+SEARCH_QUERIES = ("ros", "navigation", "moveit gazebo", "c++", "tutorial 42", "(")
+FILTER_QUERIES = (
+    CatalogQuery.build(selections={"distro": ["humble"]}),
+    CatalogQuery.build(selections={"distro": ["humble"], "technology": ["manipulation"], "deploy_docker": ["dockerfile"]}),
+    CatalogQuery.build(search="navigation", selections={"stack": ["nav2", "gazebo"], "language": ["en"]}),
+    CatalogQuery.build(name_contains="course", selections={"governance": ["university"]}),
+)
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Timing and peak memory of one benchmark case at one catalog size."""
+
+    case: str
+    size: int
+    seconds_median: float
+    seconds_min: float
+    rows_per_second: float
+    peak_mb: float
+
+
+@dataclass(frozen=True)
+class CubeShape:
+    """Cells of the facet cube against the rows they aggregate; a ratio near 1 means no aggregation."""
+
+    size: int
+    rows: int
+    cells: int
+    cells_per_row: float
+
+
+def _measure(case: str, size: int, func: Callable[[], Any], repeat: int) -> Measurement:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    # Trace memory in a separate call so allocation tracking does not skew timings.
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return Measurement(
+        case=case,
+        size=size,
+        seconds_median=median,
+        seconds_min=min(timings),
+        rows_per_second=size / median if median else float("inf"),
+        peak_mb=peak / 2**20,
+    )
+
+
+def run_size(size: int, repeat: int, cache_dir: Path, seed: int = 0) -> tuple[list[Measurement], CubeShape]:
+    """Benchmark every pipeline stage on a catalog of ``size`` tutorials and measure its facet cube."""
+    source = cache_dir / f"catalog-{size}-{seed}.yaml"
+    if not source.exists():
+        write_catalog(source, size, seed=seed)
+
+    parser = TutorialListParser(source)
+    raw = parser.load_dataframe()
+    dataframe = prepare_dataframe(raw)
+    tag_index = TagIndex.build(dataframe)
+    search_index = SearchIndex.build(dataframe)
+    facet_table = FacetTable.build(dataframe)
+    planner = FilterPlanner(dataframe, tag_index, search_index, facet_table)
+    cube = FacetCube.build(facet_table, rows=planner.visible)
+    rows = len(planner.visible)
+    shape = CubeShape(size, rows, len(cube.weights), len(cube.weights) / rows if rows else 0.0)
+    search = GlobalSearch(index=search_index)
+    factory = ChartFactory()
+
+    def search_all() -> None:
+        for query in SEARCH_QUERIES:
+            search.apply(dataframe, query)
+
+    def filter_all() -> None:
+        for query in FILTER_QUERIES:
+            planner.run(query)
+
+    # Every query was already answered once, as when sessions repeat popular filters.
+    cache = ResultCache()
+    for query in FILTER_QUERIES:
+        cache.get(query, lambda: planner.run(query), lambda result: result.rows.nbytes)
+
+    def filter_cached() -> None:
+        for query in FILTER_QUERIES:
+            cache.get(query, lambda: planner.run(query), lambda result: result.rows.nbytes)
+
+    def charts() -> None:
+        counts = FacetCounter(facet_table).frames()
+        factory.deployment_distribution(counts["deploy_docker"])
+        factory.technology_distribution(counts["technology"])
+        factory.language_distribution(counts["language"])
+        factory.distro_distribution(counts["distro"])
+
+    def filtered_charts() -> None:
+        for query in FILTER_QUERIES:
+            if query.search or query.name_contains or not cube.covers(query.selections):
+                FacetCounter(facet_table).frames(planner.run(query).rows)
+            else:
+                cube.frames(query.selections)
+
+    cases: dict[str, Callable[[], Any]] = {
+        "parse": parser.load_dataframe,
+        "validate": lambda: validate_tutorials(raw),
+        "prepare": lambda: prepare_dataframe(raw),
+        "build_indexes": lambda: (
+            TagIndex.build(dataframe),
+            SearchIndex.build(dataframe),
+            FacetTable.build(dataframe),
+            FacetCube.build(facet_table, rows=planner.visible),
+        ),
+        "search": search_all,
+        "filter": filter_all,
+        "charts": charts,
+        "filtered_charts": filtered_charts,
+        "filter_cached": filter_cached,
+        "dedupe": lambda: find_duplicates(raw),
+        "related": lambda: RelatedIndex.build(facet_table, rows=planner.visible),
+    }
+    return [_measure(case, size, func, repeat) for case, func in cases.items()], shape
+
+
+def compare(current: list[Measurement], baseline: list[dict[str, Any]], threshold: float) -> list[str]:
+    """Return a line per case slower than ``baseline`` by more than ``threshold``."""
+    previous = {(entry["case"], entry["size"]): entry for entry in baseline}
+    regressions = []
+    for measurement in current:
+        entry = previous.get((measurement.case, measurement.size))
+        if entry is None or not entry["seconds_median"]:
+            continue
+        ratio = measurement.seconds_median / entry["seconds_median"]
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{measurement.case}@{measurement.size}: {entry['seconds_median']:.4f}s -> "
+                f"{measurement.seconds_median:.4f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def _print_table(measurements: list[Measurement]) -> None:
+    print(f"{'case':<14}{'size':>10}{'median s':>12}{'min s':>12}{'rows/s':>14}{'peak MB':>10}")
+    for item in measurements:
+        print(
+            f"{item.case:<14}{item.size:>10}{item.seconds_median:>12.4f}{item.seconds_min:>12.4f}"
+            f"{item.rows_per_second:>14.0f}{item.peak_mb:>10.1f}"
+        )
+
+
+def _print_cube(shapes: list[CubeShape]) -> None:
+    print(f"\n{'cube':<14}{'size':>10}{'rows':>12}{'cells':>12}{'cells/row':>14}")
+    for shape in shapes:
+        print(f"{'':<14}{shape.size:>10}{shape.rows:>12}{shape.cells:>12}{shape.cells_per_row:>14.4f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the tutorial catalog pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="where generated catalogs are kept")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before failing (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    measurements: list[Measurement] = []
+    shapes: list[CubeShape] = []
+    for size in args.sizes:
+        results, shape = run_size(size, args.repeat, args.cache_dir, seed=args.seed)
+        measurements.extend(results)
+        shapes.append(shape)
+    _print_table(measurements)
+    _print_cube(shapes)
+
+    if args.output:
+        payload = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": [asdict(item) for item in measurements],
+            "cube": [asdict(shape) for shape in shapes],
+        }
+        args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+        regressions = compare(measurements, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
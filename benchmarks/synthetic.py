@@ -0,0 +1,110 @@
+"""Generate synthetic tutorial catalogs that follow the documented schema."""
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+from typing import Any, Iterator
+
+import yaml
+
+from tutorial_parser import VOCABULARIES
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # libyaml bindings are optional
+    from yaml import SafeDumper
+
+# Fields with a documented vocabulary that hold a single value.
+SINGLE_VALUE_FIELDS = frozenset({"governance", "doc_type"})
+
+_WORDS = (
+    "ros",
+    "robot",
+    "workshop",
+    "tutorial",
+    "course",
+    "training",
+    "introduction",
+    "advanced",
+    "control",
+    "navigation",
+    "manipulation",
+    "simulation",
+    "perception",
+    "bootcamp",
+    "notebooks",
+    "labs",
+    "summer",
+    "school",
+)
+
+
+def documented_vocabularies() -> dict[str, list[str]]:
+    """Return the allowed values of every field with a documented vocabulary."""
+    return {field: list(values) for field, values in VOCABULARIES.items()}
+
+
+def generate_entries(count: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield ``count`` tutorial mappings with realistic field coverage."""
+    rng = random.Random(seed)
+    vocabularies = documented_vocabularies()
+    organizations = [f"Organization {index}" for index in range(max(10, count // 20))]
+
+    for index in range(count):
+        organization = rng.choice(organizations)
+        slug = f"tutorial-{index}"
+        entry: dict[str, Any] = {
+            "name": " ".join(rng.sample(_WORDS, 3)).title() + f" {index}",
+            "organization": organization,
+            "date": rng.randint(2015, 2025),
+            "repo": f"https://github.com/{organization.lower().replace(' ', '-')}/{slug}",
+        }
+        if rng.random() < 0.6:
+            entry["doc"] = f"https://{slug}.example.org/"
+        if rng.random() < 0.3:
+            entry["maintainer"] = f"maintainer{rng.randrange(count)}"
+        if rng.random() < 0.5:
+            entry["packages"] = [f"pkg_{rng.randrange(200)}" for _ in range(rng.randint(1, 4))]
+
+        for column, vocabulary in vocabularies.items():
+            if rng.random() < 0.25:
+                continue
+            if column in SINGLE_VALUE_FIELDS:
+                entry[column] = rng.choice(vocabulary)
+            else:
+                entry[column] = rng.sample(vocabulary, rng.randint(1, min(3, len(vocabulary))))
+
+        if rng.random() < 0.2:
+            entry["ci"] = True
+        if rng.random() < 0.05:
+            entry["legacy"] = True
+        yield entry
+
+
+def write_catalog(path: Path, count: int, seed: int = 0, batch_size: int = 1000) -> Path:
+    """Write a synthetic ``tutorial_list.yaml`` of ``count`` entries to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    batch: list[dict[str, Any]] = []
+    with path.open("w", encoding="utf-8") as handle:
+        for entry in generate_entries(count, seed=seed):
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                yaml.dump(batch, handle, Dumper=SafeDumper, sort_keys=False, allow_unicode=True)
+                batch.clear()
+        if batch:
+            yaml.dump(batch, handle, Dumper=SafeDumper, sort_keys=False, allow_unicode=True)
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("count", type=int, help="number of tutorials to generate")
+    parser.add_argument("output", type=Path, help="YAML file to write")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    write_catalog(args.output, args.count, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
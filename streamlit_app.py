@@ -1,19 +1,45 @@
 from __future__ import annotations
 
+import os
+import uuid
+
 import streamlit as st
 
-from app.data import DEFAULT_DATA_PATH, load_app_data, prepare_dataframe
-from app.pages.catalog import show_catalog
-from app.pages.charts import show_charts
+from app import tracing
+from app.pages import PAGES, get_page
+from app.ui.debug import debug_panel_enabled, render_debug_panel
 
 
 def main() -> None:
     st.set_page_config(page_title="ROS Tutorial Survey", layout="wide")
+
+    debug = debug_panel_enabled()
+    if debug or os.environ.get(tracing.TRACE_FILE_ENV):
+        tracing.start_trace(run_id=uuid.uuid4().hex[:8])
+    try:
+        with tracing.span("rerun"):
+            _render_app()
+    finally:
+        tracer = tracing.finish_trace()
+        if debug and tracer is not None:
+            render_debug_panel(tracer)
+
+
+def _render_app() -> None:
     st.title("ROS Tutorial Survey")
-    st.caption("Data sourced from `tutorial_list.yaml`.")
+
+    st.sidebar.header("Navigation")
+    label = st.sidebar.radio("Select view", options=[page.label for page in PAGES], index=0)
+    with tracing.span("load_page", page=label):
+        show_page = get_page(label).load()
+
+    # Imported here, not at module level, so importing this script stays free of pandas and the parser.
+    from app.data import DEFAULT_DATA_PATH
+    from app.dataset import get_dataset
 
     try:
-        dataframe = load_app_data(DEFAULT_DATA_PATH)
+        with tracing.span("load_dataset"):
+            dataset = get_dataset(DEFAULT_DATA_PATH)
     except FileNotFoundError:
         st.error(f"Could not find the YAML file at {DEFAULT_DATA_PATH}.")
         st.stop()
@@ -21,19 +47,14 @@ def main() -> None:
         st.exception(error)
         st.stop()
 
-    if dataframe.empty:
+    # The source may also be a directory of shards, a glob or a bundle.
+    st.caption(f"Data sourced from `{dataset.source.name}`.")
+
+    if dataset.dataframe.empty:
         st.warning("No tutorials available to display.")
         st.stop()
 
-    dataframe = prepare_dataframe(dataframe)
-
-    st.sidebar.header("Navigation")
-    page = st.sidebar.radio("Select view", options=("Catalog", "Charts"), index=0)
-
-    if page == "Catalog":
-        show_catalog(dataframe)
-    else:
-        show_charts(dataframe)
+    show_page(dataset)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app.dataset
+from app.bundle import BUNDLE_FORMAT, KEEP_GENERATIONS, MANIFEST_NAME, read_bundle, write_bundle
+from app.dataset import Dataset, run_query
+from app.query import CatalogQuery
+
+REPO_CATALOG = Path(__file__).resolve().parent.parent / "tutorial_list.yaml"
+
+
+@pytest.fixture
+def source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(app.dataset, "LINK_CACHE_PATH", tmp_path / "link_status.json")
+    monkeypatch.setattr(app.dataset, "DEFAULT_SNAPSHOT_DIR", tmp_path / "snapshots")
+    path = tmp_path / "tutorials.yaml"
+    shutil.copyfile(REPO_CATALOG, path)
+    return path
+
+
+def _cells(frame: pd.DataFrame) -> dict[str, list[Any]]:
+    """Column values as Python objects, with every missing value as ``None``."""
+    return {
+        column: [None if not isinstance(value, list) and pd.isna(value) else value for value in frame[column].tolist()]
+        for column in frame.columns
+    }
+
+
+def test_bundle_maps_what_a_build_computes(source: Path, tmp_path: Path) -> None:
+    built = Dataset.build(source)
+    write_bundle(built, tmp_path / "bundle")
+    mapped = Dataset.load(tmp_path / "bundle")
+
+    assert mapped.version == built.version
+    assert _cells(mapped.catalog_frame) == _cells(built.catalog_frame)
+    assert mapped.sort_index.orders.keys() == built.sort_index.orders.keys()
+    for column, (ranked, missing) in built.sort_index.orders.items():
+        np.testing.assert_array_equal(mapped.sort_index.orders[column][0], ranked)
+        np.testing.assert_array_equal(mapped.sort_index.orders[column][1], missing)
+    np.testing.assert_array_equal(mapped.related.neighbours, built.related.neighbours)
+    np.testing.assert_array_equal(mapped.related.scores, built.related.scores)
+    for query in (
+        CatalogQuery.build(search="moveit"),
+        CatalogQuery.build(selections={"distro": ["humble", "jazzy"], "governance": ["university"]}),
+        CatalogQuery.build(name_contains="ros"),
+    ):
+        np.testing.assert_array_equal(run_query(mapped, query).rows, run_query(built, query).rows)
+
+
+def test_bundle_arrays_are_memory_mapped(source: Path, tmp_path: Path) -> None:
+    write_bundle(Dataset.build(source), tmp_path / "bundle")
+    bundle = read_bundle(tmp_path / "bundle")
+    assert isinstance(bundle.facet_table.codes.base, np.memmap)
+    assert not bundle.related.neighbours.flags.writeable
+
+
+def test_a_new_generation_replaces_the_old_ones(source: Path, tmp_path: Path) -> None:
+    directory = tmp_path / "bundle"
+    for _ in range(KEEP_GENERATIONS + 1):
+        current = write_bundle(Dataset.build(source), directory)
+    generations = [path for path in directory.iterdir() if path.is_dir()]
+    assert len(generations) == KEEP_GENERATIONS
+    assert json.loads((directory / MANIFEST_NAME).read_text())["generation"] == current.name
+
+
+def test_an_older_bundle_format_is_rejected(source: Path, tmp_path: Path) -> None:
+    directory = tmp_path / "bundle"
+    write_bundle(Dataset.build(source), directory)
+    manifest = json.loads((directory / MANIFEST_NAME).read_text())
+    (directory / MANIFEST_NAME).write_text(json.dumps({**manifest, "format": BUNDLE_FORMAT - 1}))
+    with pytest.raises(ValueError, match="older bundle format"):
+        Dataset.load(directory)
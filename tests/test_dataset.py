@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+import app.dataset
+from app.dataset import Dataset, run_query
+from app.links import LinkCache, LinkStatus
+from app.query import CatalogQuery
+
+CATALOG = """\
+- name: Navigation Course
+  organization: Example University
+  repo: https://example.org/navigation
+- name: Manipulation Workshop
+  organization: Example Lab
+  doc: https://example.org/manipulation
+"""
+
+
+@pytest.fixture
+def link_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "link_status.json"
+    monkeypatch.setattr(app.dataset, "LINK_CACHE_PATH", path)
+    monkeypatch.setattr(app.dataset, "DEFAULT_SNAPSHOT_DIR", tmp_path / "snapshots")
+    return path
+
+
+def _mark_links(path: Path, state: str) -> None:
+    cache = LinkCache(path)
+    now = time.time()
+    cache.update(
+        LinkStatus(url, state, 200, now)
+        for url in ("https://example.org/navigation", "https://example.org/manipulation")
+    )
+    cache.save()
+
+
+def test_link_cache_refresh_changes_version_and_results(tmp_path: Path, link_cache: Path) -> None:
+    source = tmp_path / "tutorials.yaml"
+    source.write_text(CATALOG, encoding="utf-8")
+    unchecked = CatalogQuery.build(selections={"link_status": ["unchecked"]})
+
+    before = Dataset.build(source)
+    assert len(run_query(before, unchecked).rows) == 2
+
+    _mark_links(link_cache, "ok")
+    after = Dataset.build(source)
+
+    assert after.version != before.version
+    assert len(run_query(after, unchecked).rows) == 0
+    assert len(run_query(after, CatalogQuery.build(selections={"link_status": ["ok"]})).rows) == 2
+
+
+def test_version_is_stable_for_unchanged_inputs(tmp_path: Path, link_cache: Path) -> None:
+    source = tmp_path / "tutorials.yaml"
+    source.write_text(CATALOG, encoding="utf-8")
+    _mark_links(link_cache, "broken")
+
+    assert Dataset.build(source).version == Dataset.build(source).version
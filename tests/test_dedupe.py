@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from app.dedupe import duplicate_column, find_duplicates
+
+COMMON = {"distro": ["humble", "jazzy"], "technology": ["navigation"], "governance": "university"}
+
+ORIGINALS = [
+    ("Navigation with Nav2", "https://github.com/example/nav2-course", ["nav2", "gazebo", "rviz"]),
+    ("MoveIt Pick and Place", "https://github.com/example/moveit-pick", ["moveit", "gazebo", "rviz"]),
+    ("SLAM Toolbox Workshop", "https://gitlab.com/lab/slam-workshop", ["nav2", "slam_toolbox", "rviz"]),
+    ("Perception Pipelines", "https://github.com/other/perception", ["opencv", "pcl", "rviz"]),
+    ("ros2_control Basics", "https://github.com/other/control-basics", ["ros2_control", "gazebo"]),
+    # Every tag as the first entry, but a different tutorial.
+    ("Behavior Trees in Practice", "https://github.com/lab/bt-practice", ["nav2", "gazebo", "rviz"]),
+]
+
+
+def _frame() -> pd.DataFrame:
+    rows = [{"name": name, "repo": repo, "stack": stack, **COMMON} for name, repo, stack in ORIGINALS]
+    # Planted near-duplicates: a renamed title with the same repository, and a copy with its tags reordered.
+    renamed = {"name": "Navigation with Nav2 (2024)", "repo": "https://www.github.com/example/nav2-course.git"}
+    rows.append({**rows[0], **renamed})
+    rows.append({**rows[1], "stack": ["rviz", "moveit", "gazebo"], "distro": ["jazzy", "humble"]})
+    return pd.DataFrame(rows)
+
+
+def test_planted_near_duplicates_are_grouped() -> None:
+    duplicates = find_duplicates(_frame())
+    assert [members.tolist() for members in duplicates.groups()] == [[0, 6], [1, 7]]
+    assert (duplicates.pairs["similarity"] >= 0.7).all()
+
+
+def test_entries_sharing_common_tags_are_not_flagged() -> None:
+    frame = _frame().iloc[: len(ORIGINALS)]
+    duplicates = find_duplicates(frame)
+    assert duplicates.groups() == []
+    assert (duplicates.labels == -1).all()
+
+
+def test_duplicate_column_names_the_other_members() -> None:
+    frame = _frame()
+    column = duplicate_column(frame, find_duplicates(frame))
+    assert column.tolist() == [
+        "Navigation with Nav2 (2024)",
+        "MoveIt Pick and Place",
+        "",
+        "",
+        "",
+        "",
+        "Navigation with Nav2",
+        "MoveIt Pick and Place",
+    ]
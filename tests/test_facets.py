@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.facets import FacetCounter, FacetCube, FacetTable
+
+FRAME = pd.DataFrame(
+    {
+        "governance": ["university", "university", "company", "company", "not-defined", "university"],
+        "link_status": ["ok", "broken", "ok", "ok", "unchecked", "ok"],
+        "date": [2020, 2021, 2022, 2023, 2024, 2025],
+        "distro": [["humble"], ["noetic", "humble"], ["jazzy"], [], ["humble"], ["humble", "jazzy"]],
+        "technology": [["navigation"], ["manipulation"], ["navigation", "perception"], [], [], ["navigation"]],
+    }
+)
+
+
+def test_cube_aggregates_rows_into_few_cells() -> None:
+    cube = FacetCube.build(FacetTable.build(FRAME))
+    assert len(cube.weights) == 4
+    assert cube.weights.sum() == len(FRAME)
+
+
+@pytest.mark.parametrize(
+    "selections",
+    [
+        {},
+        {"governance": ("university",)},
+        {"governance": ("university", "company"), "link_status": ("ok",)},
+        {"link_status": ("unchecked",)},
+        {"distro": ("humble",)},
+        {"technology": ("perception",)},
+        {"date": ("2020", "2023", "2025")},
+        {"distro": ("rolling",)},
+    ],
+)
+def test_cube_counts_match_the_rows(selections: dict[str, tuple[str, ...]]) -> None:
+    table = FacetTable.build(FRAME)
+    cube = FacetCube.build(table)
+    mask = pd.Series(True, index=FRAME.index)
+    for column, values in selections.items():
+        mask &= FRAME[column].map(lambda cell: bool({str(value) for value in np.atleast_1d(cell)} & set(values)))
+
+    expected = FacetCounter(table).frames(mask.to_numpy().nonzero()[0])
+    actual = cube.frames(tuple(selections.items()))
+    assert actual.keys() == expected.keys()
+    for column in expected:
+        pd.testing.assert_frame_equal(actual[column], expected[column], check_dtype=False)
+
+
+def test_cube_covers_its_dimensions_and_single_marginal_filters() -> None:
+    cube = FacetCube.build(FacetTable.build(FRAME))
+    assert cube.covers([("governance", ["university"]), ("link_status", ["ok"])])
+    assert cube.covers([("distro", ["humble"])])
+    assert cube.covers([("date", ["2020", "2021"])])
+    # A row can carry several distros, so two of them need the matching rows.
+    assert not cube.covers([("distro", ["humble", "jazzy"])])
+    assert not cube.covers([("distro", ["humble"]), ("technology", ["navigation"])])
+    assert not cube.covers([("organization", ["Example"])])
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from app.links import LinkCache, LinkChecker, LinkStatus, check_links
+from benchmarks.link_check import EXPECTED, _serve
+
+
+async def _check(paths: list[str], checker: LinkChecker, hosts: int = 1) -> tuple[list[LinkStatus], float]:
+    """Check ``paths`` on local stand-in servers; return the statuses and the elapsed seconds."""
+    runners, bases = await _serve(hosts, slow_seconds=checker.timeout * 4)
+    try:
+        urls = [f"{bases[number % hosts]}{path}" for number, path in enumerate(paths)]
+        start = time.perf_counter()
+        statuses = await checker.check(urls)
+        return statuses, time.perf_counter() - start
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+@pytest.mark.parametrize(
+    ("kind", "status_code"),
+    [("ok", 200), ("missing", 404), ("moved", 200), ("chain", 200), ("get-only", 200), ("slow", None)],
+    ids=["200", "404", "redirect", "redirect-chain", "head-405-then-get", "timeout"],
+)
+def test_link_states(kind: str, status_code: int | None) -> None:
+    checker = LinkChecker(rate_per_host=0, timeout=0.5)
+    (status,), _ = asyncio.run(_check([f"/{kind}/1"], checker))
+    assert (status.state, status.status_code) == (EXPECTED[kind], status_code)
+    if status_code is None:
+        assert status.detail == "TimeoutError"
+
+
+def test_rate_gate_spaces_requests_to_one_host() -> None:
+    paths = [f"/ok/{number}" for number in range(6)]
+    # 20 requests/s: the sixth request to a host starts 0.25 s after the first.
+    _, one_host = asyncio.run(_check(paths, LinkChecker(rate_per_host=20.0)))
+    assert one_host >= 0.25
+    # Spread over three hosts, each host only sees two requests.
+    _, three_hosts = asyncio.run(_check(paths, LinkChecker(rate_per_host=20.0), hosts=3))
+    assert three_hosts < one_host
+
+
+def test_head_fallback_counts_against_the_rate() -> None:
+    # HEAD then GET: two gated requests, the second 0.2 s after the first at 5 requests/s.
+    (status,), elapsed = asyncio.run(_check(["/get-only/1"], LinkChecker(rate_per_host=5.0)))
+    assert status.state == "ok"
+    assert elapsed >= 0.2
+
+
+def test_cache_rechecks_only_expired_links(tmp_path: Path) -> None:
+    now = time.time()
+    cache = LinkCache(tmp_path / "links.json", ttl=60.0)
+    cache.update([LinkStatus("https://a.org", "ok", 200, now - 30), LinkStatus("https://b.org", "ok", 200, now - 90)])
+    assert cache.stale(["https://a.org", "https://b.org", "https://c.org"], now=now) == [
+        "https://b.org",
+        "https://c.org",
+    ]
+    assert cache.stale(["https://a.org"], now=now + 31) == ["https://a.org"]
+
+
+def test_check_links_saves_fresh_results_and_skips_them_next_time(tmp_path: Path) -> None:
+    async def run() -> tuple[list[LinkStatus], list[LinkStatus], dict[str, LinkStatus]]:
+        runners, bases = await _serve(1, slow_seconds=1.0)
+        try:
+            urls = [f"{bases[0]}/ok/1", f"{bases[0]}/missing/2"]
+            checker = LinkChecker(rate_per_host=0, timeout=0.5)
+            path = tmp_path / "links.json"
+            first = await asyncio.to_thread(check_links, urls, LinkCache(path), checker)
+            second = await asyncio.to_thread(check_links, urls, LinkCache(path), checker)
+            return first, second, LinkCache(path).entries
+        finally:
+            for runner in runners:
+                await runner.cleanup()
+
+    first, second, saved = asyncio.run(run())
+    assert [status.state for status in first] == ["ok", "broken"]
+    assert second == []
+    assert {status.url: status.state for status in saved.values()} == {status.url: status.state for status in first}
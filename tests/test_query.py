@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.data import TagIndex
+from app.facets import FacetTable
+from app.query import CacheStats, CatalogQuery, FilterPlanner, ResultCache
+from app.ui.search import SearchIndex
+
+DISTROS = ["humble", "jazzy", "noetic", "Rolling"]
+TECHNOLOGIES = ["navigation", "manipulation", "perception"]
+
+
+def _frame(size: int = 200, seed: int = 0) -> pd.DataFrame:
+    generator = np.random.default_rng(seed)
+
+    def tags(values: list[str]) -> list[list[str]]:
+        return [list(generator.choice(values, size=generator.integers(0, 3), replace=False)) for _ in range(size)]
+
+    distros: list[object] = tags(DISTROS)
+    # Some cells are comma-separated text, as written in older YAML entries.
+    distros[::7] = [", ".join(values) for values in distros[::7]]
+    return pd.DataFrame(
+        {
+            "name": [f"{generator.choice(['Intro', 'Advanced', 'ROS'])} course {row}" for row in range(size)],
+            "organization": generator.choice(["Example University", "Example Lab", "ACME Robotics"], size=size),
+            "governance": generator.choice(["university", "company", None], size=size),
+            "distro": distros,
+            "technology": tags(TECHNOLOGIES),
+            "legacy": generator.choice(["true", "false", "True", None], size=size, p=[0.1, 0.6, 0.1, 0.2]),
+        }
+    )
+
+
+def _expected(frame: pd.DataFrame, query: CatalogQuery) -> list[int]:
+    """The rows ``query`` selects, computed with plain pandas masks."""
+    mask = ~frame["legacy"].astype(str).str.lower().eq("true")
+    for column, values in query.selections:
+        wanted = {value.lower() for value in values}
+
+        def tagged(cell: object) -> bool:
+            cell_values = cell if isinstance(cell, list) else [] if cell is None else str(cell).split(",")
+            return bool({str(value).strip().lower() for value in cell_values} & wanted)
+
+        mask &= frame[column].map(tagged)
+    for column, text in (("name", query.name_contains), ("organization", query.organization_contains)):
+        if text:
+            mask &= frame[column].str.contains(text, case=False, regex=False)
+    return np.flatnonzero(mask.to_numpy()).tolist()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        CatalogQuery.build(),
+        CatalogQuery.build(selections={"distro": ["humble"]}),
+        CatalogQuery.build(selections={"distro": ["humble", "jazzy"]}),
+        CatalogQuery.build(selections={"distro": ["rolling"]}),
+        CatalogQuery.build(selections={"distro": ["noetic", "jazzy"], "technology": ["navigation", "perception"]}),
+        CatalogQuery.build(selections={"governance": ["university"], "technology": ["manipulation"]}),
+        CatalogQuery.build(selections={"distro": ["unknown"]}),
+        CatalogQuery.build(name_contains="course 1"),
+        CatalogQuery.build(name_contains="INTRO", organization_contains="example"),
+        CatalogQuery.build(organization_contains="acme", selections={"distro": ["humble"]}),
+        CatalogQuery.build(name_contains="(", selections={"technology": ["navigation"]}),
+    ],
+    ids=lambda query: repr(query.selections) + query.name_contains + query.organization_contains,
+)
+def test_planner_matches_a_pandas_mask(query: CatalogQuery) -> None:
+    frame = _frame()
+    planner = FilterPlanner(frame, TagIndex.build(frame), SearchIndex.build(frame), FacetTable.build(frame))
+    assert planner.run(query).rows.tolist() == _expected(frame, query)
+
+
+def test_planner_hides_legacy_rows() -> None:
+    frame = _frame()
+    planner = FilterPlanner(frame, TagIndex.build(frame), SearchIndex.build(frame), FacetTable.build(frame))
+    legacy = set(np.flatnonzero(frame["legacy"].astype(str).str.lower().eq("true")))
+    assert legacy
+    assert not legacy & set(planner.run(CatalogQuery.build()).rows.tolist())
+    assert not legacy & set(planner.visible.tolist())
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        CatalogQuery.build(),
+        CatalogQuery.build(search="moveit", name_contains="intro", organization_contains="lab"),
+        CatalogQuery.build(selections={"distro": ["jazzy", "humble"], "technology": ["navigation"]}),
+    ],
+)
+def test_query_round_trips_through_url_params(query: CatalogQuery) -> None:
+    params = query.to_query_params()
+    assert CatalogQuery.from_query_params(params, ["distro", "technology"]) == query
+
+
+def test_url_params_are_canonical() -> None:
+    params = {"distro": ["jazzy", "humble", "jazzy"], "q": [" moveit "], "utm_source": ["mail"], "robot": ["panda"]}
+    query = CatalogQuery.from_query_params(params, ["distro", "technology"])
+    assert query.to_query_params() == {"q": ["moveit"], "distro": ["humble", "jazzy"]}
+    assert list(query.to_query_params()) == ["q", "distro"]
+
+
+def test_url_filters_drop_values_the_catalog_does_not_offer() -> None:
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file("../streamlit_app.py", default_timeout=60)
+    app.query_params["distro"] = ["jazzy", "humble"]
+    app.query_params["technology"] = "bogus"
+    app.query_params["utm_source"] = "mail"
+    app.run()
+    assert not app.exception
+    assert app.session_state["filter_distro"] == ["humble", "jazzy"]
+    assert app.session_state["filter_technology"] == []
+    assert dict(app.query_params) == {"utm_source": "mail", "distro": ["humble", "jazzy"]}
+
+
+def test_result_cache_evicts_the_least_recently_used_entry() -> None:
+    cache = ResultCache(max_entries=2)
+    computed: list[str] = []
+
+    def get(key: str) -> str:
+        def compute() -> str:
+            computed.append(key)
+            return key.upper()
+
+        return cache.get(key, compute, len)
+
+    assert [get("a"), get("b"), get("a"), get("c")] == ["A", "B", "A", "C"]
+    # "b" was the least recently used when "c" arrived.
+    assert [get("a"), get("b")] == ["A", "B"]
+    assert computed == ["a", "b", "c", "b"]
+    assert cache.stats() == CacheStats(hits=2, misses=4, evictions=2, entries=2, nbytes=2)
+    assert cache.stats().hit_rate == pytest.approx(1 / 3)
+
+
+def test_result_cache_is_bounded_by_bytes() -> None:
+    cache = ResultCache(max_entries=10, max_bytes=10)
+    for key in ("a", "b", "c"):
+        cache.get(key, lambda: np.zeros(4, dtype=np.uint8), lambda value: value.nbytes)
+    assert cache.stats() == CacheStats(hits=0, misses=3, evictions=1, entries=2, nbytes=8)
+    assert CacheStats(0, 0, 0, 0, 0).hit_rate == 0.0
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.facets import FacetTable
+from app.related import RELATED_COLUMNS, RelatedIndex
+
+TAGS = {
+    "stack": ["nav2", "moveit", "gazebo", "rviz"],
+    "technology": ["navigation", "manipulation", "perception"],
+    "robot": ["panda", "turtlebot3", "ur5e"],
+    "distro": ["humble", "jazzy", "noetic"],
+    "application": ["education", "industry"],
+}
+
+
+def _frame(size: int, seed: int = 0) -> pd.DataFrame:
+    generator = np.random.default_rng(seed)
+    columns = {
+        column: [list(generator.choice(values, size=generator.integers(0, 3), replace=False)) for _ in range(size)]
+        for column, values in TAGS.items()
+    }
+    return pd.DataFrame({"name": [f"Tutorial {row}" for row in range(size)], **columns})
+
+
+def _brute_force(frame: pd.DataFrame, rows: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every pair of ``rows``, IDF-weighted as in RelatedIndex, itself excluded."""
+    tags = [(column, value) for column in RELATED_COLUMNS for value in TAGS[column]]
+    matrix = np.array([[value in frame.at[row, column] for column, value in tags] for row in rows], dtype=float)
+    idf = np.log((1 + len(rows)) / (1 + matrix.sum(axis=0))) + 1.0
+    weighted = matrix * idf
+    norms = np.linalg.norm(weighted, axis=1)
+    weighted /= np.where(norms == 0, 1.0, norms)[:, None]
+    similarity = weighted @ weighted.T
+    np.fill_diagonal(similarity, -1.0)
+    return similarity
+
+
+@pytest.mark.parametrize("visible", [None, "even"], ids=["all-rows", "subset"])
+def test_top_k_matches_brute_force_cosine(visible: str | None) -> None:
+    frame = _frame(60)
+    rows = np.arange(len(frame)) if visible is None else np.arange(0, len(frame), 2)
+    index = RelatedIndex.build(FacetTable.build(frame), rows=None if visible is None else rows, k=5)
+    similarity = _brute_force(frame, rows)
+    position = {row: offset for offset, row in enumerate(rows)}
+
+    for offset, row in enumerate(rows):
+        neighbours, scores = index.related(row)
+        expected = np.sort(similarity[offset][similarity[offset] > 0])[::-1][:5]
+        # Ties may pick different rows, but never different scores.
+        np.testing.assert_allclose(scores, expected, rtol=1e-5)
+        np.testing.assert_allclose([similarity[offset, position[other]] for other in neighbours], scores, rtol=1e-5)
+        assert row not in neighbours
+    if visible is not None:
+        assert (index.neighbours[1::2] == -1).all()
+
+
+def test_shared_tags_lists_common_related_tags() -> None:
+    frame = pd.DataFrame(
+        {
+            "stack": [["nav2", "gazebo"], ["nav2"], ["moveit"]],
+            "distro": [["humble"], ["humble"], ["jazzy"]],
+            "governance": ["university", "university", "company"],
+        }
+    )
+    index = RelatedIndex.build(FacetTable.build(frame))
+    neighbours, _ = index.related(0)
+    assert neighbours.tolist() == [1]
+    assert index.shared_tags(0, 1) == ["distro: humble", "stack: nav2"]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from app.ui.search import GlobalSearch, SearchIndex, tokenize
+
+FRAME = pd.DataFrame(
+    {
+        "name": [
+            "Nav2 Basics",
+            "Nav2 Intro",
+            "Nav2 Tips",
+            "Navigation Basics",
+            "Path planning with Nav2",
+            "Path-planning in C++ (advanced)",
+            "IsaacSim bridge",
+            "Docker images",
+            "Dockercompose setups",
+        ],
+        "organization": ["Example"] * 9,
+        "language": ["en", "en", "en", "en", "en", "en", "en", "C", "en"],
+        "stack": [["nav2"], ["nav2"], ["nav2"], [], ["nav2"], [], ["isaacsim", "cyclonedds"], [], []],
+        "deploy_docker": [[], [], [], [], [], [], [], ["dockercompose"], ["dockercompose"]],
+    }
+)
+
+
+def _indexed(query: str) -> list[str]:
+    return GlobalSearch(index=SearchIndex.build(FRAME)).apply(FRAME, query)["name"].tolist()
+
+
+def _baseline(query: str) -> list[str]:
+    """The search before the index: a case-insensitive regex over every text column, in row order."""
+    mask = pd.Series(False, index=FRAME.index)
+    for column in FRAME.columns:
+        values = FRAME[column].map(lambda entry: ", ".join(entry) if isinstance(entry, list) else entry)
+        mask |= values.astype(str).str.contains(query, case=False, na=False)
+    return FRAME[mask]["name"].tolist()
+
+
+def test_tokens_keep_language_suffixes_and_drop_punctuation() -> None:
+    assert tokenize("Path-planning in C++ (advanced)") == ["path", "planning", "in", "c++", "advanced"]
+    assert tokenize("(") == []
+
+
+def test_a_rarer_term_ranks_higher() -> None:
+    # "nav" is a prefix of "nav2", in four names, and of "navigation", in one; the rarer match scores higher.
+    assert _indexed("nav")[0] == "Navigation Basics"
+    assert len(_indexed("nav")) == 5
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("navi", ["Navigation Basics"]),
+        ("NAV2 bas", ["Nav2 Basics"]),
+        ("zzz", []),
+        ("basics nav", ["Navigation Basics", "Nav2 Basics"]),
+    ],
+)
+def test_every_token_matches_a_prefix(query: str, expected: list[str]) -> None:
+    assert _indexed(query) == expected
+
+
+def test_regex_metacharacters_are_literal() -> None:
+    assert _indexed("c++") == ["Path-planning in C++ (advanced)"]
+    # No word characters: the literal scan, which would raise on an unbalanced regex group.
+    assert _indexed("(") == ["Path-planning in C++ (advanced)"]
+
+
+def test_scan_without_an_index_matches_literal_substrings() -> None:
+    search = GlobalSearch()
+    assert search.apply(FRAME, "c++")["name"].tolist() == ["Path-planning in C++ (advanced)"]
+    assert search.apply(FRAME, "PATH-PLANNING")["name"].tolist() == ["Path-planning in C++ (advanced)"]
+    assert search.apply(FRAME, "")["name"].tolist() == FRAME["name"].tolist()
+    # An index of another frame is not used.
+    stale = GlobalSearch(index=SearchIndex.build(FRAME.iloc[:3]))
+    assert stale.apply(FRAME, "dds")["name"].tolist() == ["IsaacSim bridge"]
+
+
+@pytest.mark.parametrize(
+    ("query", "baseline", "indexed"),
+    [
+        # Tokens match on their own, so the unhyphenated spelling is found too.
+        (
+            "path-planning",
+            ["Path-planning in C++ (advanced)"],
+            ["Path planning with Nav2", "Path-planning in C++ (advanced)"],
+        ),
+        # Tokens match term prefixes only, not text inside a word.
+        ("dds", ["IsaacSim bridge"], []),
+        # Rows are ranked: a match in the name outweighs one in a tag.
+        ("dockercompose", ["Docker images", "Dockercompose setups"], ["Dockercompose setups", "Docker images"]),
+    ],
+)
+def test_differences_from_the_substring_search(query: str, baseline: list[str], indexed: list[str]) -> None:
+    assert _baseline(query) == baseline
+    assert _indexed(query) == indexed
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+import pytest
+
+from tutorial_parser import TutorialListParser
+
+CATALOG = """\
+- name: Navigation Course
+  organization: Example University
+  governance: University
+  repo: https://example.org/navigation
+  robot: [ABB, Panda]
+  stack: [nav2, Gazebo]
+- name: Manipulation Workshop
+  organization: Example Lab
+  doc: https://example.org/manipulation
+  robot: abb
+  deploy_image_base: ros:humble
+- name: Docker Tutorial
+  organization: Example Company
+  governance: company
+  repo: https://example.org/docker
+  robot: [ABB]
+  deploy_docker: docker-compose
+- name: Unlinked Notes
+  organization: Example Individual
+  date: 1800
+"""
+
+INSERTED = """\
+- name: Inserted Course
+  organization: Example Consortium
+  repo: https://example.org/inserted
+  robot: [abb, Mirte]
+- name: Inserted Workshop
+  organization: Example Consortium
+  repo: https://example.org/inserted-workshop
+  robot: abb
+"""
+
+
+def _insert(text: str) -> str:
+    return INSERTED + text
+
+
+def _edit(text: str) -> str:
+    return text.replace("robot: [ABB]\n", "robot: [abb, UR5e]\n")
+
+
+def _fix_field_alias(text: str) -> str:
+    return text.replace("deploy_image_base:", "docker_image_base:")
+
+
+def _delete(text: str) -> str:
+    return text[: text.index("- name: Docker Tutorial")] + text[text.index("- name: Unlinked Notes") :]
+
+
+def _touch(text: str) -> str:
+    return text
+
+
+def _plain(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    """Rows with list cells as lists and every missing value as ``None``."""
+
+    def cell(value: Any) -> Any:
+        if hasattr(value, "tolist") and not isinstance(value, str):
+            return value.tolist()
+        if isinstance(value, list):
+            return value
+        return None if pd.isna(value) else value
+
+    columns = sorted(frame.columns)
+    return [{column: cell(value) for column, value in zip(columns, row)} for row in frame[columns].itertuples(False)]
+
+
+def _write(path: Path, text: str, generation: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    # Give every write its own mtime so the snapshot is never served by accident.
+    os.utime(path, ns=(generation * 10**9, generation * 10**9))
+
+
+@pytest.fixture
+def reparsed(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Indexes of the entries the parser normalizes from YAML rather than reusing."""
+    calls: list[int] = []
+    normalize = TutorialListParser._normalize_record
+
+    def counting(self: TutorialListParser, record: Any, index: int) -> dict[str, Any]:
+        calls.append(index)
+        return normalize(self, record, index)
+
+    monkeypatch.setattr(TutorialListParser, "_normalize_record", counting)
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("change", "expected_reparsed"),
+    [(_insert, [0, 1]), (_edit, [2]), (_fix_field_alias, [1]), (_delete, []), (_touch, [])],
+    ids=["insert", "edit", "field-alias-fix", "delete", "touch"],
+)
+def test_incremental_reload_matches_a_full_parse(
+    tmp_path: Path, reparsed: list[int], change: Callable[[str], str], expected_reparsed: list[int]
+) -> None:
+    source = tmp_path / "tutorials.yaml"
+    snapshots = tmp_path / "snapshots"
+    _write(source, CATALOG, generation=1)
+    TutorialListParser(source, snapshot_dir=snapshots).load_dataframe()
+
+    _write(source, change(CATALOG), generation=2)
+    reparsed.clear()
+    incremental = TutorialListParser(source, snapshot_dir=snapshots)
+    frame = incremental.load_dataframe()
+    assert reparsed == expected_reparsed
+
+    full = TutorialListParser(source)
+    assert _plain(frame) == _plain(full.load_dataframe())
+    assert incremental.report.to_dict() == full.report.to_dict()
+    assert frame.attrs["source_sha256"] == hashlib.sha256(source.read_bytes()).hexdigest()
+
+    # The refreshed snapshot is served as is, with the same report.
+    reparsed.clear()
+    cached = TutorialListParser(source, snapshot_dir=snapshots)
+    assert _plain(cached.load_dataframe()) == _plain(frame)
+    assert cached.report.to_dict() == full.report.to_dict()
+    assert reparsed == []
+
+
+def test_insert_can_change_the_spelling_of_reused_rows(tmp_path: Path) -> None:
+    source = tmp_path / "tutorials.yaml"
+    snapshots = tmp_path / "snapshots"
+    _write(source, CATALOG, generation=1)
+    before = TutorialListParser(source, snapshot_dir=snapshots).load_dataframe()
+    assert before["robot"].tolist()[:3] == [["ABB", "panda"], ["ABB"], ["ABB"]]
+
+    # Two more entries spell it "abb", which then outnumbers "ABB" in the whole catalog.
+    _write(source, _insert(CATALOG), generation=2)
+    after = TutorialListParser(source, snapshot_dir=snapshots).load_dataframe()
+    assert after["robot"].tolist()[:5] == [["abb", "Mirte"], ["abb"], ["abb", "panda"], ["abb"], ["abb"]]
+
+
+ANCHORED = """\
+- &defaults
+  name: Navigation Course
+  organization: Example University
+  governance: university
+  repo: https://example.org/navigation
+  robot: &robots [ABB, Panda]
+- <<: *defaults
+  name: Navigation Course, Part 2
+  repo: https://example.org/navigation-2
+- name: Manipulation Workshop
+  organization: Example Lab
+  doc: https://example.org/manipulation
+  robot: *robots
+"""
+
+
+def test_aliases_across_entries_fall_back_to_a_full_parse(tmp_path: Path) -> None:
+    source = tmp_path / "tutorials.yaml"
+    snapshots = tmp_path / "snapshots"
+    for generation, text in enumerate([ANCHORED, ANCHORED.replace("[ABB, Panda]", "[ABB, UR5e]")], start=1):
+        _write(source, text, generation)
+        loaded = TutorialListParser(source, snapshot_dir=snapshots)
+        frame = loaded.load_dataframe()
+        full = TutorialListParser(source)
+        assert _plain(frame) == _plain(full.load_dataframe())
+        assert loaded.report.to_dict() == full.report.to_dict()
+    assert frame["robot"].tolist() == [["ABB", "ur5e"]] * 3
+    assert frame["organization"].tolist()[:2] == ["Example University"] * 2
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import tutorial_parser
+from tutorial_parser import ISSUE_KINDS, TutorialListParser, ValidationReport, validate_tutorials
+
+
+def _frame(**columns: list) -> pd.DataFrame:
+    size = len(next(iter(columns.values())))
+    base = {"name": [f"Tutorial {row}" for row in range(size)], "organization": ["Example"] * size}
+    base["repo"] = [f"https://example.org/{row}" for row in range(size)]
+    return pd.DataFrame({**base, **columns})
+
+
+def _issues(report: ValidationReport, kind: str) -> list[tuple[int, str, object, object]]:
+    issues = report.issues[report.issues["kind"] == kind]
+    return list(zip(issues["row"], issues["field"], issues["value"], issues["normalized"]))
+
+
+def test_documented_tags_take_their_documented_spelling() -> None:
+    frame, report = validate_tutorials(
+        _frame(robot=[["Panda", "UR5e"], ["franka_panda"]], governance=["University", "university"])
+    )
+    assert frame["robot"].tolist() == [["panda", "ur5e"], ["panda"]]
+    assert frame["governance"].tolist() == ["university", "university"]
+    assert _issues(report, "normalized") == [
+        (0, "governance", "University", "university"),
+        (0, "robot", "Panda", "panda"),
+        (0, "robot", "UR5e", "ur5e"),
+        (1, "robot", "franka_panda", "panda"),
+    ]
+
+
+def test_undocumented_tags_keep_the_most_frequent_spelling() -> None:
+    frame, report = validate_tutorials(
+        _frame(robot=[["ABB", "Mirte"], ["abb"], ["ABB"], ["Ufactory  xArm6"], ["Robotiq-2F-85"]])
+    )
+    assert frame["robot"].tolist() == [["ABB", "Mirte"], ["ABB"], ["ABB"], ["Ufactory xArm6"], ["Robotiq-2F-85"]]
+    assert _issues(report, "normalized") == [
+        (1, "robot", "abb", "ABB"),
+        (3, "robot", "Ufactory  xArm6", "Ufactory xArm6"),
+    ]
+    assert {value for _, _, value, _ in _issues(report, "unknown_value")} == {
+        "ABB",
+        "Mirte",
+        "Ufactory xArm6",
+        "Robotiq-2F-85",
+    }
+
+
+def test_spelling_ties_go_to_the_first_in_sort_order() -> None:
+    frame, _ = validate_tutorials(_frame(robot=[["mirte"], ["Mirte"]]))
+    assert frame["robot"].tolist() == [["Mirte"], ["Mirte"]]
+
+
+def test_spellings_of_one_tag_are_merged_within_a_row() -> None:
+    frame, _ = validate_tutorials(_frame(stack=[["MoveIt", "moveit2", "Gazebo"]]))
+    assert frame["stack"].tolist() == [["moveit", "gazebo"]]
+
+
+def test_links_in_tag_fields_are_kept_as_written() -> None:
+    url = "https://github.com/Example/Docker"
+    frame, report = validate_tutorials(_frame(deploy_docker=[[url]]))
+    assert frame["deploy_docker"].tolist() == [[url]]
+    assert _issues(report, "unknown_value") == [(0, "deploy_docker", url, None)]
+
+
+def test_validation_is_idempotent() -> None:
+    frame, _ = validate_tutorials(
+        _frame(robot=[["ABB", "Panda"], ["abb"], ["ABB"]], governance=["Company", "company, University", None])
+    )
+    again, report = validate_tutorials(frame)
+    pd.testing.assert_frame_equal(again, frame)
+    assert _issues(report, "normalized") == []
+
+
+def test_field_aliases_and_missing_values_are_reported() -> None:
+    frame = _frame(deploy_image_base=["ros:humble", None], date=[2024, 1800])
+    frame.loc[1, "organization"] = " "
+    frame.loc[1, "repo"] = None
+    validated, report = validate_tutorials(frame)
+    assert "deploy_image_base" not in validated.columns
+    assert validated["docker_image_base"].tolist()[0] == "ros:humble"
+    assert _issues(report, "normalized") == [(0, "deploy_image_base", "deploy_image_base", "docker_image_base")]
+    assert _issues(report, "missing") == [(1, "doc/repo", None, None), (1, "organization", None, None)]
+    assert _issues(report, "invalid") == [(1, "date", "1800", None)]
+    assert report.issues["name"].tolist() == ["Tutorial 0", "Tutorial 1", "Tutorial 1", "Tutorial 1"]
+
+
+def test_report_counts_every_kind() -> None:
+    _, report = validate_tutorials(_frame(robot=[["Panda"], ["ABB"]], colour=["red", None]))
+    assert report.counts() == {"normalized": 1, "unknown_value": 1, "unknown_field": 1, "invalid": 0, "missing": 0}
+    assert list(report.counts()) == list(ISSUE_KINDS)
+    assert len(report) == 3
+
+
+def test_report_round_trips_through_its_dict() -> None:
+    _, report = validate_tutorials(_frame(robot=[["Panda"], ["ABB"]], date=[2024, "soon"]))
+    data = report.to_dict()
+    assert data["rows_with_issues"] == 2
+    assert data["counts"] == report.counts()
+    assert ValidationReport.from_dict(data).to_dict() == data
+
+
+def test_concat_shifts_rows_by_offset_and_keeps_the_order() -> None:
+    _, first = validate_tutorials(_frame(robot=[["Panda"], ["ABB"]]))
+    _, second = validate_tutorials(_frame(robot=[["UR5e"]], date=[1800]))
+    combined = ValidationReport.concat([first, None, second], offsets=[0, 2, 2])
+    assert list(zip(combined.issues["row"], combined.issues["field"], combined.issues["kind"])) == [
+        (0, "robot", "normalized"),
+        (1, "robot", "unknown_value"),
+        (2, "date", "invalid"),
+        (2, "robot", "normalized"),
+    ]
+    assert len(ValidationReport.concat([])) == 0
+
+
+def test_shards_share_one_spelling_per_tag(tmp_path: Path) -> None:
+    first = "- name: A\n  organization: X\n  repo: https://a.org\n  robot: [Mirte, abb]\n"
+    second = (
+        "- name: B\n  organization: X\n  repo: https://b.org\n  robot: mirte\n"
+        "- name: C\n  organization: Y\n  repo: https://c.org\n  robot: [mirte, ABB]\n"
+    )
+    (tmp_path / "shards").mkdir()
+    (tmp_path / "shards" / "a.yaml").write_text(first, encoding="utf-8")
+    (tmp_path / "shards" / "b.yaml").write_text(second, encoding="utf-8")
+    (tmp_path / "all.yaml").write_text(first + second, encoding="utf-8")
+
+    whole = TutorialListParser(tmp_path / "all.yaml")
+    expected = whole.load_dataframe()
+    for snapshot_dir in (None, tmp_path / "snapshots", tmp_path / "snapshots"):
+        sharded = TutorialListParser(tmp_path / "shards", snapshot_dir=snapshot_dir, workers=1)
+        frame = sharded.load_dataframe()
+        assert frame["robot"].tolist() == expected["robot"].tolist() == [["mirte", "ABB"], ["mirte"], ["mirte", "ABB"]]
+        assert sharded.report.to_dict() == whole.report.to_dict()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_parser_records_the_report(tmp_path: Path, streaming: bool) -> None:
+    source = tmp_path / "tutorials.yaml"
+    source.write_text("- name: A\n  organization: X\n  robot: Panda\n", encoding="utf-8")
+    parser = TutorialListParser(source, streaming=streaming)
+    assert parser.load_dataframe()["robot"].tolist() == [["panda"]]
+    assert parser.report.counts()["normalized"] == 1
+    assert parser.report.counts()["missing"] == 1
+
+
+def test_large_sources_are_streamed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "tutorials.yaml"
+    source.write_text("- &a\n  name: A\n  organization: X\n  robot: Panda\n- <<: *a\n  name: B\n", encoding="utf-8")
+    whole = TutorialListParser(source).load_dataframe()
+
+    monkeypatch.setattr(tutorial_parser, "STREAMING_MIN_BYTES", source.stat().st_size)
+    monkeypatch.setattr(TutorialListParser, "_load_yaml", lambda self: pytest.fail("loaded as one document"))
+    streamed = TutorialListParser(source).load_dataframe()
+    pd.testing.assert_frame_equal(streamed, whole)
+    assert streamed["robot"].tolist() == [["panda"], ["panda"]]
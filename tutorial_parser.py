@@ -1,33 +1,331 @@
 from __future__ import annotations
 
+import glob
+import hashlib
 import json
+import math
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Mapping
+from typing import IO, Any, Iterable, Iterator, Mapping
 
+import numpy as np
 import pandas as pd
 import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+    from yaml._yaml import CParser
+except ImportError:  # libyaml bindings are optional
+    from yaml import SafeLoader
+
+    _StreamingLoader: type = SafeLoader
+else:
+
+    class _StreamingLoader(CParser, Composer, SafeConstructor, Resolver):
+        """libyaml events with the Python composer, so entries can be built one node at a time."""
+
+        def __init__(self, stream: str | IO[str]) -> None:
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+# Bump whenever normalization changes so stale snapshots are rebuilt.
+SNAPSHOT_VERSION = 4
+SNAPSHOT_METADATA_KEY = b"tutorial_parser"
+
+SHARD_PATTERNS = ("*.yaml", "*.yml")
+# Without a snapshot, files at least this large are streamed entry by entry rather than loaded whole.
+STREAMING_MIN_BYTES = 1 << 20
+
+# Fields that may hold several values; they are kept as lists of strings.
+MULTI_VALUE_FIELDS = frozenset(
+    {
+        "country",
+        "language",
+        "technology",
+        "application",
+        "robot",
+        "hardware",
+        "stack",
+        "packages",
+        "distro",
+        "deploy_native",
+        "deploy_gui",
+        "deploy_specifics",
+        "deploy_docker",
+        "docker_overlay",
+    }
+)
+
+# Fields holding tags: compared case-insensitively and counted in the facets.
+TAG_FIELDS = MULTI_VALUE_FIELDS | {"governance", "doc_type"}
+
+# Every field an entry may set; anything else is kept but reported.
+SCHEMA_FIELDS = TAG_FIELDS | {
+    "name",
+    "organization",
+    "date",
+    "maintainer",
+    "user",
+    "intro",
+    "doc",
+    "repo",
+    "docker_image_base",
+    "ci",
+    "legacy",
+    "row_index",
+}
+REQUIRED_FIELDS = ("name", "organization")
+# An entry must link to its material through at least one of these.
+LINK_FIELDS = ("doc", "repo")
+URL_FIELDS = ("doc", "repo", "intro")
+BOOLEAN_FIELDS = ("ci", "legacy")
+YEAR_RANGE = (1970, 2100)
+
+# Placeholder every tag field accepts for "does not apply".
+NOT_DEFINED = "not-defined"
+
+# Documented values of each tag field, in the order the catalog's column help shows them.
+# Undocumented values are kept and reported, so the catalog may run ahead of the lists.
+VOCABULARIES: dict[str, tuple[str, ...]] = {
+    "governance": ("company", "consortium", "laboratory", "university", "community", "individual"),
+    "country": ("de", "us", "es", "fr", "gb", "it"),
+    "doc_type": ("pdf", "sphinx", "markdown", "workshop repository"),
+    "language": ("de", "en", "es", "fr", "gb", "it"),
+    "technology": ("manipulation", "navigation", "perception", "software-engineering", "fieldbus"),
+    "application": ("welding", "pickplace", "palletizing", "conveying", "humanoid"),
+    "robot": ("ur5e", "ur10e", "panda", "pcobot", "scara", "turtlebot3"),
+    "hardware": ("stm32_f407", "raspberry_pi4", "jetson_nano", "nvidia_gpu", "tof_vl53l1x"),
+    "stack": ("basics", "ros2_control", "urdf", "gazebo", "rviz", "moveit", "nav2", "tesseract", "opencv", "pytorch"),
+    "distro": ("humble", "jazzy", "rolling", "windows10", "debian12"),
+    "deploy_native": ("bash", "ansible", "iso", "fai"),
+    "deploy_gui": ("x11local", "x11forward", "tigervnc", "webapp"),
+    "deploy_specifics": ("devcontainer", "virtualbox", "clusterssh"),
+    "deploy_docker": ("dockerfile", "dockercompose", "rocker", "ade"),
+    "docker_overlay": ("builder", "dever", "visualizer"),
+}
+
+# Other spellings of a tag, keyed by their case-folded form.
+VALUE_ALIASES: dict[str, dict[str, str]] = {
+    "country": {"uk": "gb"},
+    "application": {"pick-place": "pickplace", "pick_place": "pickplace", "pick-and-place": "pickplace"},
+    "robot": {"franka_panda": "panda", "festo_pcobot": "pcobot"},
+    "stack": {"ros_basics": "basics", "ros-basics": "basics", "moveit2": "moveit", "rviz2": "rviz"},
+    "deploy_docker": {"docker-compose": "dockercompose", "docker_compose": "dockercompose"},
+}
+
+# Misspelled field names and the field they stand for.
+FIELD_ALIASES = {"deploy_image_base": "docker_image_base"}
+
+# Issue kinds of a ValidationReport. Only ``normalized`` values were changed; the rest are kept as written.
+ISSUE_KINDS = ("normalized", "unknown_value", "unknown_field", "invalid", "missing")
+REPORT_COLUMNS = ("row", "name", "field", "value", "kind", "normalized")
 
 
 class TutorialListParser:
-    """Load tutorial metadata from YAML into a pandas DataFrame."""
+    """Load tutorial metadata from YAML into a pandas DataFrame.
 
-    def __init__(self, source: str | Path) -> None:
+    Every load validates and normalizes the entries (see ``validate_tutorials``);
+    ``report`` holds the outcome of the last load.
+    """
+
+    def __init__(
+        self,
+        source: str | Path,
+        snapshot_dir: str | Path | None = None,
+        streaming: bool = False,
+        batch_size: int = 1000,
+        workers: int | None = None,
+    ) -> None:
         self.source = Path(source)
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir is not None else None
+        self.streaming = streaming
+        self.batch_size = batch_size
+        self.workers = workers
+        self.report: ValidationReport | None = None
+        # Input values of the cells the last validation rewrote; see ``_original_cells``.
+        self._originals: dict[str, dict[str, Any]] = {}
 
     def load_dataframe(self) -> pd.DataFrame:
-        """Return the tutorials as a pandas DataFrame."""
+        """Return the tutorials as a pandas DataFrame.
+
+        ``source`` may also be a directory or glob of YAML shards, which are
+        loaded in parallel and concatenated in file-name order.
+        """
+        shards = resolve_sources(self.source)
+        if shards != [self.source]:
+            return self._load_shards(shards)
+
+        if self.snapshot_dir is not None:
+            return self._load_with_snapshot()
+
+        if self.streaming or (self.source.exists() and self.source.stat().st_size >= STREAMING_MIN_BYTES):
+            return self._load_streaming()
+
         records = self._load_yaml()
         normalized = [self._normalize_record(item, index) for index, item in enumerate(records)]
+        return self._validate(pd.DataFrame(normalized))
+
+    def _load_streaming(self) -> pd.DataFrame:
+        """Construct and normalize one entry at a time into columnar buffers."""
+        if not self.source.exists():
+            raise FileNotFoundError(f"YAML file not found: {self.source}")
+
+        buffer = _ColumnBuffer(self.batch_size)
+        with self.source.open("r", encoding="utf-8") as handle:
+            for index, entry in enumerate(iter_yaml_entries(handle)):
+                if not isinstance(entry, Mapping):
+                    raise ValueError(f"Tutorial entry at index {index} must be a mapping.")
+                buffer.append(self._normalize_record(entry, index))
+        return self._validate(buffer.to_frame())
+
+    def _load_shards(self, shards: list[Path]) -> pd.DataFrame:
+        """Load every shard, in parallel processes when there are several."""
+        if not shards:
+            raise FileNotFoundError(f"No YAML files found for: {self.source}")
+
+        options = (self.snapshot_dir, self.streaming, self.batch_size)
+        workers = min(len(shards), self.workers or os.cpu_count() or 1)
+        if workers <= 1:
+            loaded = [_load_shard(shard, *options) for shard in shards]
+        else:
+            # Spawn rather than fork: the caller (e.g. Streamlit) is usually multi-threaded.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                loaded = list(pool.map(_load_shard, shards, *([option] * len(shards) for option in options)))
+        frames = [frame for frame, _, _ in loaded]
+        offsets = np.cumsum([0, *(len(frame) for frame in frames[:-1])]).tolist()
+        combined = _concat_shards(frames)
+        self.report = ValidationReport.concat([report for _, report, _ in loaded], offsets)
+        self._originals = {
+            str(int(row) + offset): cells
+            for (_, _, originals), offset in zip(loaded, offsets)
+            for row, cells in originals.items()
+        }
+        if len(frames) > 1:
+            combined, self.report = _respell_tags(combined, self.report, self._originals)
+        return combined
+
+    @property
+    def snapshot_path(self) -> Path | None:
+        """Location of the binary snapshot for this source, if enabled."""
+        if self.snapshot_dir is None:
+            return None
+        key = hashlib.sha1(str(self.source.resolve()).encode("utf-8")).hexdigest()[:12]
+        return self.snapshot_dir / f"{self.source.stem}-{key}.arrow"
+
+    def _load_with_snapshot(self) -> pd.DataFrame:
+        """Serve the snapshot when it is current, re-parsing only changed entries otherwise."""
+        if not self.source.exists():
+            raise FileNotFoundError(f"YAML file not found: {self.source}")
+
+        stat = self.source.stat()
+        snapshot = _read_snapshot(self.snapshot_path)
+        if snapshot is not None:
+            frame, meta = snapshot
+            # The snapshot holds validated rows, so its report is reused rather than recomputed.
+            self.report = ValidationReport.from_dict(meta.get("report", {}))
+            self._originals = meta.get("originals", {})
+            if meta.get("mtime_ns") == stat.st_mtime_ns and meta.get("size") == stat.st_size:
+                frame.attrs["source_sha256"] = meta["sha256"]
+                return frame
+
+        raw = self.source.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if snapshot is not None and meta.get("sha256") == digest:
+            # Content is unchanged (e.g. a fresh checkout); only refresh the key.
+            entry_hashes = meta.get("entry_hashes", [])
+        else:
+            frame, entry_hashes = self._parse_incrementally(raw.decode("utf-8"), snapshot)
+            frame = self._validate(frame)
+
+        meta = {
+            "version": SNAPSHOT_VERSION,
+            "sha256": digest,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "entry_hashes": entry_hashes,
+            "report": self.report.to_dict(),
+            "originals": self._originals,
+        }
+        _write_snapshot(self.snapshot_path, frame, meta)
+        frame.attrs["source_sha256"] = digest
+        return frame
+
+    def _parse_incrementally(
+        self, text: str, snapshot: tuple[pd.DataFrame, dict[str, Any]] | None
+    ) -> tuple[pd.DataFrame, list[str]]:
+        """Normalize the entries of ``text``, reusing snapshot rows whose source is unchanged."""
+        chunks = _split_entries(text)
+        if chunks is None:
+            return self._parse_text(text), []
+
+        previous: dict[str, tuple[int, dict[str, Any]]] = {}
+        if snapshot is not None:
+            old_frame, old_meta = snapshot
+            old_hashes = old_meta.get("entry_hashes", [])
+            originals = old_meta.get("originals", {})
+            if len(old_hashes) == len(old_frame):
+                for position, (entry_hash, row) in enumerate(zip(old_hashes, old_frame.to_dict("records"))):
+                    previous[entry_hash] = (position, {**row, **originals.get(str(position), {})})
+
+        entry_hashes: list[str] = []
+        buffer = _ColumnBuffer(self.batch_size)
+        for index, chunk in enumerate(chunks):
+            entry_hash = hashlib.sha1(chunk.encode("utf-8")).hexdigest()
+            entry_hashes.append(entry_hash)
+            if entry_hash in previous:
+                position, row = previous[entry_hash]
+                buffer.append(_reuse_row(position, row, index))
+                continue
+
+            try:
+                content = yaml.load(chunk, Loader=SafeLoader)
+            except yaml.YAMLError:
+                # E.g. an alias to an anchor in another entry, which only resolves in the whole document.
+                return self._parse_text(text), []
+            if not isinstance(content, list) or len(content) != 1:
+                # The line-based split misjudged the document; parse it as a whole.
+                return self._parse_text(text), []
+            record = self._parse_content(content, offset=index)[0]
+            buffer.append(self._normalize_record(record, index))
+
+        return buffer.to_frame(), entry_hashes
+
+    def _parse_text(self, text: str) -> pd.DataFrame:
+        """Parse and normalize a complete YAML document."""
+        records = self._parse_content(yaml.load(text, Loader=SafeLoader))
+        normalized = [self._normalize_record(item, index) for index, item in enumerate(records)]
         return pd.DataFrame(normalized)
 
+    def _validate(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Validate and normalize ``frame``, recording the report and the values it rewrote."""
+        validated, self.report = validate_tutorials(frame)
+        self._originals = _original_cells(frame, self.report)
+        return validated
+
     def _load_yaml(self) -> list[dict[str, Any]]:
         """Load and validate the YAML content."""
         if not self.source.exists():
             raise FileNotFoundError(f"YAML file not found: {self.source}")
 
         with self.source.open("r", encoding="utf-8") as handle:
-            content = yaml.safe_load(handle)
+            content = yaml.load(handle, Loader=SafeLoader)
+
+        return self._parse_content(content)
 
+    def _parse_content(self, content: Any, offset: int = 0) -> list[dict[str, Any]]:
+        """Validate the loaded YAML document as a sequence of mappings."""
         if content is None:
             return []
 
@@ -35,7 +333,7 @@ class TutorialListParser:
             raise ValueError("Expected top-level YAML sequence of tutorial entries.")
 
         cleaned: list[dict[str, Any]] = []
-        for index, entry in enumerate(content):
+        for index, entry in enumerate(content, start=offset):
             if not isinstance(entry, Mapping):
                 raise ValueError(f"Tutorial entry at index {index} must be a mapping.")
             cleaned.append(dict(entry))
@@ -50,6 +348,8 @@ class TutorialListParser:
                 normalized["doc"] = self._normalize_value(value)
             elif key == "repo":
                 normalized["repo"] = self._normalize_value(value)
+            elif key in MULTI_VALUE_FIELDS:
+                normalized[key] = self._normalize_list(value)
             else:
                 normalized[key] = self._normalize_value(value)
 
@@ -67,7 +367,468 @@ class TutorialListParser:
 
         return value
 
+    def _normalize_list(self, value: Any) -> list[str]:
+        """Convert list or comma-separated values into a list of interned strings."""
+        if value is None:
+            return []
+
+        if isinstance(value, (str, bytes, bytearray)) or not isinstance(value, Iterable):
+            items: Iterable[Any] = str(value).split(",")
+        else:
+            items = value
+
+        values: list[str] = []
+        for item in items:
+            if item is None:
+                continue
+            text = str(item).strip()
+            if text:
+                values.append(sys.intern(text))
+        return values
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    """What ingest validation changed and found: one row per entry, field and value."""
+
+    issues: pd.DataFrame
+
+    @classmethod
+    def from_issues(cls, parts: Iterable[pd.DataFrame]) -> "ValidationReport":
+        """Collect issue frames, ordered by row, field and kind."""
+        frames = [part for part in parts if len(part)]
+        if not frames:
+            return cls(pd.DataFrame(columns=list(REPORT_COLUMNS)))
+        issues = pd.concat(frames, ignore_index=True)
+        rank = issues["kind"].map({kind: position for position, kind in enumerate(ISSUE_KINDS)})
+        order = np.lexsort((rank.to_numpy(), issues["field"].to_numpy(dtype=object), issues["row"].to_numpy()))
+        return cls(issues.iloc[order].reset_index(drop=True)[list(REPORT_COLUMNS)])
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ValidationReport":
+        """Rebuild a report from ``to_dict`` output."""
+        issues = pd.DataFrame(data.get("issues", []), columns=list(REPORT_COLUMNS))
+        return cls(issues.astype({"row": "int64"}))
+
+    @classmethod
+    def concat(
+        cls, reports: Iterable["ValidationReport | None"], offsets: Iterable[int] | None = None
+    ) -> "ValidationReport":
+        """Combine reports, shifting each one's rows by its ``offsets`` entry (e.g. a shard's first row)."""
+        reports = list(reports)
+        shifts = list(offsets) if offsets is not None else [0] * len(reports)
+        return cls.from_issues(
+            report.issues.assign(row=report.issues["row"] + shift)
+            for report, shift in zip(reports, shifts)
+            if report is not None
+        )
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def counts(self) -> dict[str, int]:
+        """Number of issues of every kind, in ``ISSUE_KINDS`` order."""
+        found = self.issues["kind"].value_counts()
+        return {kind: int(found.get(kind, 0)) for kind in ISSUE_KINDS}
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready form of the report: counts by kind and every issue as a record."""
+        issues = self.issues.astype(object)
+        records = issues.where(issues.notna(), None).to_dict("records")
+        return {"rows_with_issues": int(self.issues["row"].nunique()), "counts": self.counts(), "issues": records}
+
+
+def validate_tutorials(frame: pd.DataFrame) -> tuple[pd.DataFrame, ValidationReport]:
+    """Check every field of every entry, canonicalize tag spellings and move misspelled fields.
+
+    Everything else found is reported but left as written; rows are labelled by position.
+    """
+    parts: list[pd.DataFrame] = []
+    frame = frame.copy(deep=False)
+
+    for alias, target in FIELD_ALIASES.items():
+        if alias not in frame.columns:
+            continue
+        moved = frame[alias].notna()
+        if target in frame.columns:
+            moved &= frame[target].isna()
+            frame[target] = frame[target].where(~moved, frame[alias])
+        else:
+            frame[target] = frame[alias].where(moved)
+        parts.append(_issue_frame(frame.index[moved.to_numpy()], alias, "normalized", alias, target))
+        remaining = frame[alias].where(~moved)
+        if remaining.notna().any():
+            frame[alias] = remaining
+        else:
+            frame = frame.drop(columns=alias)
+
+    for field in sorted(TAG_FIELDS.intersection(frame.columns)):
+        frame[field], found = _canonical_tags(frame[field], field)
+        parts.extend(found)
+
+    for field in frame.columns.difference(sorted(SCHEMA_FIELDS)):
+        values = frame[field].dropna()
+        parts.append(_issue_frame(values.index, field, "unknown_field", values.astype(str)))
+
+    for field in REQUIRED_FIELDS:
+        if field not in frame.columns:
+            parts.append(_issue_frame(frame.index, field, "missing"))
+            continue
+        values = frame[field]
+        blank = values.isna() | values.astype(str).str.strip().eq("")
+        parts.append(_issue_frame(frame.index[blank.to_numpy()], field, "missing"))
+
+    linked = frame.reindex(columns=list(LINK_FIELDS)).notna().any(axis=1)
+    parts.append(_issue_frame(frame.index[~linked.to_numpy()], "/".join(LINK_FIELDS), "missing"))
+
+    for field in URL_FIELDS:
+        if field in frame.columns:
+            values = frame[field].dropna().astype(str)
+            parts.append(_invalid(values, ~values.str.fullmatch(r"https?://\S+"), field))
+
+    for field in BOOLEAN_FIELDS:
+        if field in frame.columns:
+            values = frame[field].dropna().astype(str)
+            parts.append(_invalid(values, ~values.str.casefold().isin(["true", "false"]), field))
 
-def load_tutorials(path: str | Path) -> pd.DataFrame:
+    if "date" in frame.columns:
+        values = frame["date"].dropna()
+        years = pd.to_numeric(values, errors="coerce")
+        plausible = years.between(*YEAR_RANGE) & (years % 1 == 0)
+        parts.append(_invalid(values.astype(str), ~plausible, "date"))
+
+    return frame, _with_names(ValidationReport.from_issues(parts), frame)
+
+
+def _with_names(report: ValidationReport, frame: pd.DataFrame) -> ValidationReport:
+    """Fill in the name of the entry behind every issue."""
+    if len(report) and "name" in frame.columns:
+        names = frame["name"].to_numpy(dtype=object)[report.issues["row"].to_numpy()]
+        report.issues["name"] = pd.Series(names, dtype=object).where(pd.notna(names), None)
+    return report
+
+
+def _respell_tags(
+    frame: pd.DataFrame, report: ValidationReport, originals: Mapping[str, Mapping[str, Any]]
+) -> tuple[pd.DataFrame, ValidationReport]:
+    """Canonicalize the tag columns of ``frame`` again as one catalog, from the values they were read with."""
+    frame = frame.copy(deep=False)
+    fields = sorted(TAG_FIELDS.intersection(frame.columns))
+    parts: list[pd.DataFrame] = []
+    for field in fields:
+        cells = frame[field].to_numpy(dtype=object).copy()
+        for row, values in originals.items():
+            if field in values:
+                cells[int(row)] = values[field]
+        column = pd.Series(cells, index=frame.index, name=field, dtype=object)
+        frame[field], found = _canonical_tags(column, field)
+        parts.extend(found)
+
+    issues = report.issues
+    stale = issues["field"].isin(fields) & issues["kind"].isin(["normalized", "unknown_value"])
+    return frame, _with_names(ValidationReport.from_issues([issues[~stale], *parts]), frame)
+
+
+def _original_cells(frame: pd.DataFrame, report: ValidationReport) -> dict[str, dict[str, Any]]:
+    """The values ``frame`` held in every cell its validation rewrote, by row and field."""
+    changed = report.issues[report.issues["kind"] == "normalized"]
+    originals: dict[str, dict[str, Any]] = {}
+    for row, field, normalized in zip(changed["row"].tolist(), changed["field"].tolist(), changed["normalized"]):
+        # A misspelled field moved its value into the field it stands for.
+        for name in (field, normalized) if field in FIELD_ALIASES else (field,):
+            value = frame[name].iat[row] if name in frame.columns else None
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            originals.setdefault(str(row), {})[name] = None if _is_missing(value) else value
+    return originals
+
+
+def _canonical_tags(column: pd.Series, field: str) -> tuple[pd.Series, list[pd.DataFrame]]:
+    """Canonicalize one tag column; return it with its ``normalized`` and ``unknown_value`` issues."""
+    multi = field in MULTI_VALUE_FIELDS
+    present = column.dropna()
+    if multi:
+        values = present.explode().dropna()
+    else:
+        values = present.astype(str).str.split(",").explode().str.strip()
+        values = values[values != ""]
+    if values.empty:
+        return column, []
+
+    rows = values.index.to_numpy()
+    codes, uniques = pd.factorize(values.to_numpy(dtype=object))
+    spellings = np.array([str(value) for value in uniques], dtype=object)
+    vocabulary = VOCABULARIES.get(field)
+    documented = {value.casefold(): value for value in (*(vocabulary or ()), NOT_DEFINED)}
+    aliases = VALUE_ALIASES.get(field, {})
+    documented.update(aliases)
+
+    # Distinct spellings are few, so they are resolved in Python rather than in a frame each.
+    keys: list[str] = []
+    written: dict[str, Counter[str]] = {}
+    for spelling, count in zip(spellings.tolist(), np.bincount(codes, minlength=len(uniques)).tolist()):
+        text = " ".join(spelling.split())
+        # Case only matters for matching; a link pasted into a tag field is compared as written.
+        key = text if "://" in spelling else text.casefold()
+        key = aliases.get(key, key)
+        keys.append(key)
+        written.setdefault(key, Counter())[text] += count
+    # Undocumented tags keep the spelling most entries use; ties go to the first in sort order.
+    preferred = {
+        key: documented.get(key) or min(counts, key=lambda text: (-counts[text], text))
+        for key, counts in written.items()
+    }
+    canonical = np.array([sys.intern(preferred[key]) for key in keys], dtype=object)
+
+    issues = []
+    changed = (canonical != spellings)[codes]
+    if changed.any():
+        hits = codes[changed]
+        issues.append(_issue_frame(rows[changed], field, "normalized", spellings[hits], canonical[hits]))
+        column = _rebuild_tags(column, rows, canonical[codes], np.unique(rows[changed]), multi)
+
+    if vocabulary is not None:
+        unknown = ~np.isin(canonical, [*vocabulary, NOT_DEFINED])[codes]
+        if unknown.any():
+            issues.append(_issue_frame(rows[unknown], field, "unknown_value", canonical[codes[unknown]]))
+    return column, issues
+
+
+def _rebuild_tags(
+    column: pd.Series, rows: np.ndarray, canonical: np.ndarray, affected: np.ndarray, multi: bool
+) -> pd.Series:
+    """Replace the ``affected`` cells of ``column`` with their canonical, de-duplicated tags."""
+    selected = np.isin(rows, affected)
+    grouped: dict[int, list[str]] = {}
+    for row, value in zip(rows[selected].tolist(), canonical[selected].tolist()):
+        grouped.setdefault(row, []).append(value)
+
+    cells = column.to_numpy(dtype=object).copy()
+    for row, items in grouped.items():
+        unique = list(dict.fromkeys(items))
+        cells[row] = unique if multi else ", ".join(unique)
+    return pd.Series(cells, index=column.index, name=column.name, dtype=object)
+
+
+def _invalid(values: pd.Series, mask: pd.Series, field: str) -> pd.DataFrame:
+    return _issue_frame(values.index[mask.to_numpy(dtype=bool)], field, "invalid", values[mask.to_numpy(dtype=bool)])
+
+
+def _issue_frame(rows: Any, field: str, kind: str, values: Any = None, normalized: Any = None) -> pd.DataFrame:
+    """Issues of one field and kind, one per row in ``rows``."""
+    rows = np.asarray(rows, dtype=np.int64)
+    if isinstance(values, pd.Series):
+        values = values.to_numpy(dtype=object)
+    return pd.DataFrame(
+        {"row": rows, "field": field, "value": values, "kind": kind, "normalized": normalized},
+        columns=list(REPORT_COLUMNS),
+    )
+
+
+def resolve_sources(source: str | Path) -> list[Path]:
+    """Expand a directory or glob into its YAML shards; a plain path is returned as is."""
+    path = Path(source)
+    if path.is_dir():
+        return sorted({shard for pattern in SHARD_PATTERNS for shard in path.glob(pattern)})
+    if any(character in str(source) for character in "*?["):
+        return sorted(Path(match) for match in glob.glob(str(source)))
+    return [path]
+
+
+def iter_yaml_entries(stream: str | IO[str]) -> Iterator[Any]:
+    """Yield the items of a top-level YAML sequence without loading the whole document."""
+    loader = _StreamingLoader(stream)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStartEvent
+        if not loader.check_event(yaml.SequenceStartEvent):
+            if loader.construct_document(loader.compose_node(None, None)) is None:
+                return
+            raise ValueError("Expected top-level YAML sequence of tutorial entries.")
+
+        loader.get_event()  # SequenceStartEvent
+        while not loader.check_event(yaml.SequenceEndEvent):
+            yield loader.construct_document(loader.compose_node(None, None))
+    finally:
+        loader.dispose()
+
+
+class _ColumnBuffer:
+    """Accumulate normalized records column by column, one fixed-size batch at a time."""
+
+    def __init__(self, batch_size: int) -> None:
+        self.batch_size = max(1, batch_size)
+        self.columns: dict[str, list[Any]] = {}
+        self.size = 0
+        self._batch: list[dict[str, Any]] = []
+
+    def append(self, record: dict[str, Any]) -> None:
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        for record in self._batch:
+            for key in record:
+                if key not in self.columns:
+                    self.columns[key] = [None] * self.size
+        for key, values in self.columns.items():
+            values.extend(record.get(key) for record in self._batch)
+        self.size += len(self._batch)
+        self._batch = []
+
+    def to_frame(self) -> pd.DataFrame:
+        self.flush()
+        return pd.DataFrame(self.columns)
+
+
+def _load_shard(
+    path: Path, snapshot_dir: Path | None, streaming: bool, batch_size: int
+) -> tuple[pd.DataFrame, ValidationReport, dict[str, dict[str, Any]]]:
+    parser = TutorialListParser(path, snapshot_dir=snapshot_dir, streaming=streaming, batch_size=batch_size)
+    frame = parser.load_dataframe()
+    return frame, parser.report, parser._originals
+
+
+def _concat_shards(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate shard frames, renumbering default ``row_index`` values globally."""
+    offset = 0
+    renumbered = []
+    for frame in frames:
+        if "row_index" in frame.columns:
+            local = pd.Series(range(len(frame)), index=frame.index)
+            frame = frame.assign(row_index=frame["row_index"].mask(frame["row_index"] == local, local + offset))
+        renumbered.append(frame)
+        offset += len(frame)
+
+    combined = pd.concat(renumbered, ignore_index=True) if renumbered else pd.DataFrame()
+    digests = [frame.attrs.get("source_sha256") for frame in frames]
+    if digests and all(digests):
+        combined.attrs["source_sha256"] = hashlib.sha256("".join(digests).encode("utf-8")).hexdigest()
+    return combined
+
+
+def _split_entries(text: str) -> list[str] | None:
+    """Split a block-style top-level sequence into the source text of each entry.
+
+    Returns ``None`` when the document does not follow that layout, in which
+    case the caller falls back to parsing the whole file.
+    """
+    chunks: list[str] = []
+    current: list[str] | None = None
+    for line in text.splitlines(keepends=True):
+        if line.startswith("- ") or line.rstrip("\r\n") == "-":
+            if current is not None:
+                chunks.append("".join(current))
+            current = [line]
+        elif current is not None and (line[:1] in (" ", "\t", "#") or not line.strip()):
+            current.append(line)
+        elif current is None and (not line.strip() or line.startswith(("#", "---", "%"))):
+            continue
+        else:
+            return None
+
+    if current is not None:
+        chunks.append("".join(current))
+    return chunks
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value is pd.NA or (isinstance(value, float) and math.isnan(value))
+
+
+def _reuse_row(position: int, row: Mapping[str, Any], index: int) -> dict[str, Any]:
+    """Turn a snapshot row back into a normalized record placed at ``index``."""
+    record = {key: value for key, value in row.items() if not _is_missing(value)}
+    if record.get("row_index") == position:
+        record["row_index"] = index
+    return record
+
+
+def _read_snapshot(path: Path | None) -> tuple[pd.DataFrame, dict[str, Any]] | None:
+    """Return the snapshot frame and its metadata, or ``None`` if unusable."""
+    if path is None or not path.exists():
+        return None
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+    except ImportError:
+        return None
+
+    try:
+        table = feather.read_table(path)
+        meta = json.loads((table.schema.metadata or {})[SNAPSHOT_METADATA_KEY])
+        if meta.get("version") != SNAPSHOT_VERSION:
+            return None
+        frame = table.to_pandas()
+    except (OSError, KeyError, ValueError, pa.ArrowException):
+        return None
+
+    for column in MULTI_VALUE_FIELDS.intersection(frame.columns):
+        frame[column] = frame[column].map(_as_list, na_action="ignore")
+    return frame, meta
+
+
+def _as_list(value: Any) -> Any:
+    """Restore list cells that Arrow hands back as arrays."""
+    if hasattr(value, "tolist"):
+        return [sys.intern(item) for item in value.tolist()]
+    return value
+
+
+def _write_snapshot(path: Path | None, frame: pd.DataFrame, meta: Mapping[str, Any]) -> None:
+    """Persist ``frame`` atomically; snapshots are best effort and never fatal."""
+    if path is None:
+        return
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+    except ImportError:
+        return
+
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[SNAPSHOT_METADATA_KEY] = json.dumps(meta).encode("utf-8")
+        feather.write_feather(table.replace_schema_metadata(metadata), temporary, compression="uncompressed")
+        os.replace(temporary, path)
+    except (OSError, pa.ArrowException):
+        temporary.unlink(missing_ok=True)
+
+
+def load_tutorials(path: str | Path, snapshot_dir: str | Path | None = None) -> pd.DataFrame:
     """Convenience function for loading the tutorials file."""
-    return TutorialListParser(path).load_dataframe()
+    return TutorialListParser(path, snapshot_dir=snapshot_dir).load_dataframe()
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate a tutorial list and report what ingest would normalize.")
+    parser.add_argument("source", type=Path, help="YAML file, directory or glob of shards")
+    parser.add_argument("--snapshot-dir", type=Path, help="reuse (and refresh) the snapshots kept here")
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    parser.add_argument(
+        "--fail-on", choices=ISSUE_KINDS, action="append", default=[], help="exit 1 if issues of this kind exist"
+    )
+    args = parser.parse_args(argv)
+
+    loader = TutorialListParser(args.source, snapshot_dir=args.snapshot_dir)
+    frame = loader.load_dataframe()
+    report = loader.report
+    counts = report.counts()
+    print(f"Validated {len(frame)} tutorials: " + ", ".join(f"{count} {kind}" for kind, count in counts.items()))
+
+    if args.output:
+        payload = {"source": str(args.source), "sha256": frame.attrs.get("source_sha256"), "rows": len(frame)}
+        payload.update(report.to_dict())
+        args.output.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return 1 if any(counts[kind] for kind in args.fail_on) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())